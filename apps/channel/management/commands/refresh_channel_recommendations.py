@@ -0,0 +1,27 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.channel.models import ChannelRecommendation
+
+
+class Command(BaseCommand):
+    help = 'Recompute the recommended channels of every channel from the channels subscribed together'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--top-k',
+            type=int,
+            default=settings.CHANNEL_RECOMMENDATIONS['TOP_K'],
+            help='Number of recommended channels stored for every channel'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=settings.CHANNEL_RECOMMENDATIONS['CHUNK_SIZE'],
+            help='Number of channel ids whose recommendations are computed at once'
+        )
+
+    def handle(self, *args, **options):
+        stored_recommendations = ChannelRecommendation.objects.refresh(options['top_k'], options['chunk_size'])
+
+        self.stdout.write(self.style.SUCCESS(f'Stored {stored_recommendations} channel recommendations'))
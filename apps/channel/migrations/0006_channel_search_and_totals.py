@@ -0,0 +1,67 @@
+# Generated by Django 4.2.2 on 2026-10-18 13:37
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+
+def populate_channel_totals(apps, schema_editor):
+    Channel = apps.get_model('channel', 'Channel')
+    ChannelSubscription = apps.get_model('channel', 'ChannelSubscription')
+    Video = apps.get_model('video', 'Video')
+
+    Channel.objects.update(
+        subscriber_count=Coalesce(
+            Subquery(
+                ChannelSubscription.objects.filter(subscribing=OuterRef('pk'))
+                    .order_by()
+                    .values('subscribing')
+                    .annotate(total=Count('pk'))
+                    .values('total')
+            ),
+            Value(0)
+        ),
+        total_views=Coalesce(
+            Subquery(
+                Video.objects.filter(channel=OuterRef('pk'))
+                    .order_by()
+                    .values('channel')
+                    .annotate(total=Sum('view_count'))
+                    .values('total')
+            ),
+            Value(0)
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('channel', '0005_channel_created_at'),
+        ('video', '0010_video_search_vector'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='channel',
+            name='subscriber_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='channel',
+            name='total_views',
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='channel',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name'], name='channel_name_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='channel',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['handle'], name='channel_handle_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.RunPython(populate_channel_totals, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 4.2.2 on 2026-10-18 14:00
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+from django.db.models import Count, Min, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+import django.db.models.functions.text
+
+
+def remove_duplicated_subscriptions(apps, schema_editor):
+    Channel = apps.get_model('channel', 'Channel')
+    ChannelSubscription = apps.get_model('channel', 'ChannelSubscription')
+
+    duplicated_subscriptions = ChannelSubscription.objects\
+        .values('subscriber', 'subscribing')\
+        .annotate(total=Count('pk'), first_subscription=Min('pk'))\
+        .filter(total__gt=1)
+
+    channels_ids = set()
+
+    for duplicated_subscription in duplicated_subscriptions:
+        ChannelSubscription.objects\
+            .filter(
+                subscriber=duplicated_subscription['subscriber'],
+                subscribing=duplicated_subscription['subscribing']
+            )\
+            .exclude(pk=duplicated_subscription['first_subscription'])\
+            .delete()
+
+        channels_ids.add(duplicated_subscription['subscribing'])
+
+    Channel.objects.filter(pk__in=channels_ids).update(
+        subscriber_count=Coalesce(
+            Subquery(
+                ChannelSubscription.objects.filter(subscribing=OuterRef('pk'))
+                    .order_by()
+                    .values('subscribing')
+                    .annotate(total=Count('pk'))
+                    .values('total')
+            ),
+            Value(0)
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('channel', '0006_channel_search_and_totals'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicated_subscriptions, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='channelsubscription',
+            index=models.Index(fields=['subscriber', '-subscription_date'], name='channel_subscription_date_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='channelsubscription',
+            constraint=models.UniqueConstraint(fields=('subscriber', 'subscribing'), name='channel_subscription_unique'),
+        ),
+        migrations.AddIndex(
+            model_name='channel',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='gin_trgm_ops'), name='channel_name_upper_trgm_idx'),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 4.2.2 on 2026-10-18 15:20
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def populate_channel_video_count(apps, schema_editor):
+    Channel = apps.get_model('channel', 'Channel')
+    Video = apps.get_model('video', 'Video')
+
+    Channel.objects.update(
+        video_count=Coalesce(
+            Subquery(
+                Video.objects.filter(channel=OuterRef('pk'))
+                    .order_by()
+                    .values('channel')
+                    .annotate(total=Count('pk'))
+                    .values('total')
+            ),
+            Value(0)
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('channel', '0007_channelsubscription_unique'),
+        ('video', '0015_likedvideo_unique'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='channel',
+            name='video_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(populate_channel_video_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 4.2.2 on 2026-10-18 15:40
+
+from django.db import migrations, models
+from django.db.models import Max, OuterRef, Subquery
+import django.utils.timezone
+
+
+def populate_channel_last_upload_date(apps, schema_editor):
+    Channel = apps.get_model('channel', 'Channel')
+    Video = apps.get_model('video', 'Video')
+
+    Channel.objects.update(
+        last_upload_date=Subquery(
+            Video.objects.filter(channel=OuterRef('pk'))
+                .order_by()
+                .values('channel')
+                .annotate(last_upload_date=Max('publication_date'))
+                .values('last_upload_date')
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('channel', '0008_channel_video_count'),
+        ('video', '0016_inboxvideo'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='channel',
+            name='last_upload_date',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='channelsubscription',
+            name='last_visit_date',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.RunPython(populate_channel_last_upload_date, migrations.RunPython.noop),
+    ]
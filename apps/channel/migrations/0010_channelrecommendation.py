@@ -0,0 +1,30 @@
+# Generated by Django 4.2.2 on 2026-10-18 15:33
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('channel', '0009_channel_last_upload_date'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChannelRecommendation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.FloatField()),
+                ('channel', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='recommendations', to='channel.channel')),
+                ('recommended_channel', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='recommended_in', to='channel.channel')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['channel', '-score'], name='channel_recommendation_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='channelrecommendation',
+            constraint=models.UniqueConstraint(fields=('channel', 'recommended_channel'), name='channel_recommendation_unique'),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 4.2.2 on 2026-10-18 18:10
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+# Flags the channels over the fan-out limit and the ones that already have a
+# video missing from the inbox of a subscriber since it subscribed
+POPULATE_FAN_OUT_SKIPPED = '''
+UPDATE channel_channel AS channel SET fan_out_skipped = true
+WHERE channel.subscriber_count >= %s
+    OR EXISTS (
+        SELECT 1
+        FROM channel_channelsubscription AS subscription
+        INNER JOIN video_video AS video ON video.channel_id = subscription.subscribing_id
+        WHERE subscription.subscribing_id = channel.id
+            AND video.publication_date >= subscription.subscription_date
+            AND NOT EXISTS (
+                SELECT 1 FROM video_inboxvideo AS inbox_video
+                WHERE inbox_video.subscriber_id = subscription.subscriber_id
+                    AND inbox_video.video_id = video.id
+            )
+    );
+'''
+
+
+def populate_channel_fan_out_skipped(apps, schema_editor):
+    schema_editor.execute(POPULATE_FAN_OUT_SKIPPED, [settings.SUBSCRIPTION_FEED['FAN_OUT_LIMIT']])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('channel', '0010_channelrecommendation'),
+        ('video', '0016_inboxvideo'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='channel',
+            name='fan_out_skipped',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.RunPython(populate_channel_fan_out_skipped, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,14 @@
-from django.db import models
+from array import array
+from bisect import bisect_left
+from typing import Iterable
+
+from django.contrib.postgres.expressions import ArraySubquery
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db import connection, models, transaction
+from django.db.models.functions import Coalesce, JSONObject, Upper
 from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
 
 from .normalize_handle import normalize_handle
 
@@ -17,8 +26,47 @@ class ChannelManager(models.Manager):
         )
         return channel
 
+    def with_details(self) -> models.QuerySet:
+        # The links app depends on the channel models
+        from apps.link.models import Link
+
+        return self.get_queryset().annotate(
+            link_list=ArraySubquery(
+                Link.objects.filter(channel=models.OuterRef('pk'))
+                    .order_by('position')
+                    .values(json=JSONObject(id='id', title='title', url='url', position='position'))
+            )
+        )
+
+    def subscribed_by(self, channel_id: int) -> models.QuerySet:
+        return self.get_queryset().filter(subscribing__subscriber_id=channel_id).annotate(
+            subscription_date=models.F('subscribing__subscription_date'),
+            has_new_uploads=models.ExpressionWrapper(
+                models.Q(
+                    last_upload_date__isnull=False,
+                    last_upload_date__gt=models.F('subscribing__last_visit_date')
+                ),
+                output_field=models.BooleanField()
+            )
+        )
+
+    def refresh_subscriber_count(self, channel_ids):
+        subscriber_count = models.Subquery(
+            ChannelSubscription.objects.filter(
+                subscribing=models.OuterRef('pk')
+            ).order_by().values('subscribing').annotate(
+                total=models.Count('pk')
+            ).values('total')
+        )
+
+        self.get_queryset().filter(pk__in=channel_ids).update(
+            subscriber_count=Coalesce(subscriber_count, 0)
+        )
+
 
 class Channel(models.Model):
+    denormalized_fields = ('subscriber_count', 'total_views', 'video_count', 'last_upload_date', 'fan_out_skipped')
+
     banner_url = models.URLField(verbose_name='Banner image URL', null=True, blank=True)
     picture_url = models.URLField(verbose_name='Avatar image URL', null=True, blank=True)
     description = models.TextField(null=True, blank=True)
@@ -29,17 +77,217 @@ class Channel(models.Model):
     contact_email = models.EmailField(verbose_name='Contact email', null=True, blank=True)
     subscriptions = models.ManyToManyField('self', through='ChannelSubscription')
     created_at = models.DateTimeField(auto_now_add=True, blank=True)
+    subscriber_count = models.PositiveIntegerField(default=0)
+    total_views = models.PositiveBigIntegerField(default=0)
+    video_count = models.PositiveIntegerField(default=0)
+    last_upload_date = models.DateTimeField(null=True, blank=True, editable=False)
+    # Set once a video of the channel is published over the fan-out limit, so the
+    # feed keeps merging its videos on read after it drops below the limit
+    fan_out_skipped = models.BooleanField(default=False, editable=False)
 
     objects = ChannelManager()
 
+    class Meta:
+        indexes = [
+            GinIndex(fields=['name'], name='channel_name_trgm_idx', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['handle'], name='channel_handle_trgm_idx', opclasses=['gin_trgm_ops']),
+            GinIndex(OpClass(Upper('name'), name='gin_trgm_ops'), name='channel_name_upper_trgm_idx'),
+        ]
+
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        # The denormalized fields are only written with F() updates, so saving an
+        # instance loaded before a subscription, view or upload does not revert them
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.denormalized_fields
+            ]
+
+        super().save(*args, **kwargs)
+
+
+# Sorted ids, so a membership check is a binary search
+class SubscribedChannelIds:
+    def __init__(self, channel_ids: array):
+        self.channel_ids = channel_ids
+
+    def __contains__(self, channel_id: int) -> bool:
+        index = bisect_left(self.channel_ids, channel_id)
+
+        return index < len(self.channel_ids) and self.channel_ids[index] == channel_id
+
+    def __len__(self) -> int:
+        return len(self.channel_ids)
+
+
+class ChannelSubscriptionManager(models.Manager):
+    subscribed_channel_ids_key = 'channel:{}:subscribed_channel_ids'
+
+    def subscribed_channel_ids(self, user) -> SubscribedChannelIds:
+        # Memoized on the user of the request, so a page reads the set once
+        memo = getattr(user, '_subscribed_channel_ids', None)
+
+        if memo is None or memo[0] != user.current_channel_id:
+            memo = (user.current_channel_id, self.load_subscribed_channel_ids(user.current_channel_id))
+            user._subscribed_channel_ids = memo
+
+        return memo[1]
+
+    def load_subscribed_channel_ids(self, channel_id: int) -> SubscribedChannelIds:
+        # Kept across requests only in a cache shared by every worker, since the
+        # subscription signals drop it from there
+        cache_key = self.subscribed_channel_ids_key.format(channel_id)
+        packed_channel_ids = cache.get(cache_key) if settings.SHARED_CACHE else None
+
+        if packed_channel_ids is not None:
+            channel_ids = array('q')
+            channel_ids.frombytes(packed_channel_ids)
+
+            return SubscribedChannelIds(channel_ids)
+
+        channel_ids = array(
+            'q',
+            self.get_queryset()
+                .filter(subscriber_id=channel_id)
+                .order_by('subscribing_id')
+                .values_list('subscribing_id', flat=True)
+        )
+
+        if settings.SHARED_CACHE:
+            cache.set(cache_key, channel_ids.tobytes(), settings.SUBSCRIBED_CHANNEL_IDS_CACHE_TIMEOUT)
+
+        return SubscribedChannelIds(channel_ids)
+
+    def invalidate_subscribed_channel_ids(self, channel_ids: Iterable[int]):
+        if settings.SHARED_CACHE:
+            cache.delete_many([self.subscribed_channel_ids_key.format(channel_id) for channel_id in channel_ids])
+
+    def mark_seen(self, user, channel: 'Channel'):
+        if channel.last_upload_date is None or not user.is_authenticated:
+            return
+
+        if channel.pk not in self.subscribed_channel_ids(user):
+            return
+
+        self.get_queryset().filter(
+            subscriber_id=user.current_channel_id,
+            subscribing=channel,
+            last_visit_date__lt=channel.last_upload_date
+        ).update(last_visit_date=timezone.now())
+
 
 class ChannelSubscription(models.Model):
     subscriber = models.ForeignKey(Channel, on_delete=models.CASCADE, related_name='subscriber')
     subscribing = models.ForeignKey(Channel, on_delete=models.CASCADE, related_name='subscribing')
     subscription_date = models.DateTimeField(auto_now_add=True, blank=True)
+    last_visit_date = models.DateTimeField(default=timezone.now)
+
+    objects = ChannelSubscriptionManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['subscriber', 'subscribing'], name='channel_subscription_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['subscriber', '-subscription_date'], name='channel_subscription_date_idx'),
+        ]
 
     def __str__(self):
         return self.subscriber.name
+
+
+class ChannelRecommendationManager(models.Manager):
+    def refresh(self, top_k: int, chunk_size: int) -> int:
+        # Cosine similarity of the subscriber sets, aggregated one range of channel ids per transaction
+        recommendation_table = self.model._meta.db_table
+        subscription_table = ChannelSubscription._meta.db_table
+        channel_table = Channel._meta.db_table
+
+        channel_ids = Channel.objects.aggregate(first=models.Min('pk'), last=models.Max('pk'))
+        stored_recommendations = 0
+
+        if channel_ids['first'] is None:
+            return stored_recommendations
+
+        for first_channel_id in range(channel_ids['first'], channel_ids['last'] + 1, chunk_size):
+            params = {
+                'first_channel_id': first_channel_id,
+                'last_channel_id': first_channel_id + chunk_size,
+                'top_k': top_k
+            }
+
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute(
+                    f'''
+                    DELETE FROM {recommendation_table}
+                    WHERE channel_id >= %(first_channel_id)s AND channel_id < %(last_channel_id)s
+                    ''',
+                    params
+                )
+
+                cursor.execute(
+                    f'''
+                    INSERT INTO {recommendation_table} (channel_id, recommended_channel_id, score)
+                    SELECT channel_id, recommended_channel_id, score FROM (
+                        SELECT
+                            channel_pair.channel_id,
+                            channel_pair.recommended_channel_id,
+                            channel_pair.score,
+                            row_number() OVER (
+                                PARTITION BY channel_pair.channel_id
+                                ORDER BY channel_pair.score DESC, channel_pair.recommended_channel_id
+                            ) AS rank
+                        FROM (
+                            SELECT
+                                subscription.subscribing_id AS channel_id,
+                                co_subscription.subscribing_id AS recommended_channel_id,
+                                count(*) / sqrt(
+                                    GREATEST(channel.subscriber_count, 1)::double precision
+                                    * GREATEST(recommended_channel.subscriber_count, 1)
+                                ) AS score
+                            FROM {subscription_table} AS subscription
+                            INNER JOIN {subscription_table} AS co_subscription
+                                ON co_subscription.subscriber_id = subscription.subscriber_id
+                                AND co_subscription.subscribing_id <> subscription.subscribing_id
+                            INNER JOIN {channel_table} AS channel ON channel.id = subscription.subscribing_id
+                            INNER JOIN {channel_table} AS recommended_channel
+                                ON recommended_channel.id = co_subscription.subscribing_id
+                            WHERE subscription.subscribing_id >= %(first_channel_id)s
+                                AND subscription.subscribing_id < %(last_channel_id)s
+                            GROUP BY
+                                subscription.subscribing_id,
+                                co_subscription.subscribing_id,
+                                channel.subscriber_count,
+                                recommended_channel.subscriber_count
+                        ) AS channel_pair
+                    ) AS ranked_channel_pair
+                    WHERE rank <= %(top_k)s
+                    ''',
+                    params
+                )
+
+                stored_recommendations += cursor.rowcount
+
+        return stored_recommendations
+
+
+class ChannelRecommendation(models.Model):
+    channel = models.ForeignKey(Channel, on_delete=models.CASCADE, related_name='recommendations')
+    recommended_channel = models.ForeignKey(Channel, on_delete=models.CASCADE, related_name='recommended_in')
+    score = models.FloatField()
+
+    objects = ChannelRecommendationManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['channel', 'recommended_channel'], name='channel_recommendation_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['channel', '-score'], name='channel_recommendation_idx'),
+        ]
+
+    def __str__(self):
+        return self.recommended_channel.name
@@ -1,49 +1,24 @@
 from rest_framework import serializers
 
-from drf_spectacular.utils import extend_schema_field
-
 from apps.channel.models import Channel, ChannelSubscription
-from apps.video.models import Video, VideoView
-from apps.link.models import Link
 
 from apps.link.serializers import LinkListSerializer
 
 
 class ChannelDetailsSerializer(serializers.ModelSerializer):
-    subscribers = serializers.SerializerMethodField('channel_subscribers')
-    links = serializers.SerializerMethodField('channel_links')
-    total_videos = serializers.SerializerMethodField('channel_total_videos')
-    total_views = serializers.SerializerMethodField('channel_total_views')
+    subscribers = serializers.IntegerField(source='subscriber_count', read_only=True)
+    links = LinkListSerializer(source='link_list', many=True, read_only=True)
+    total_videos = serializers.IntegerField(source='video_count', read_only=True)
+    total_views = serializers.IntegerField(read_only=True)
     subscribed = serializers.SerializerMethodField('channel_subscribed')
 
-    def channel_subscribers(self, instance: Channel) -> int:
-        return ChannelSubscription.objects.filter(subscribing=instance).count()
-
-    @extend_schema_field(field=LinkListSerializer(many=True))
-    def channel_links(self, instance: Channel):
-        links = Link.objects.filter(channel=instance).order_by('position')
-        return LinkListSerializer(links, many=True).data
-
-    def channel_total_videos(self, instance: Channel) -> int:
-        return Video.objects.filter(channel=instance).count()
-
-    def channel_total_views(self, instance: Channel) -> int:
-        list_video_views = VideoView.objects.filter(video__channel=instance).values_list('count', flat=True)
-        return sum(list_video_views)
-
-    def channel_subscribed(self, instance: Channel) -> int:
+    def channel_subscribed(self, instance: Channel) -> bool:
         request = self.context.get('request')
 
-        if request == None: return False
-
-        user = request.user
+        if request is None or not request.user.is_authenticated:
+            return False
 
-        if user is None or not user.is_authenticated: return False
-
-        return ChannelSubscription.objects.filter(
-            subscriber=user.current_channel,
-            subscribing=instance
-        ).exists()
+        return instance.pk in ChannelSubscription.objects.subscribed_channel_ids(request.user)
 
     class Meta:
         model = Channel
@@ -69,10 +44,7 @@ class ChannelDetailsSerializer(serializers.ModelSerializer):
 
 
 class ChannelListSerializer(serializers.ModelSerializer):
-    subscribers = serializers.SerializerMethodField('subscribers_count')
-
-    def subscribers_count(self, instance: Channel) -> int:
-        return ChannelSubscription.objects.filter(subscribing=instance).count()
+    subscribers = serializers.IntegerField(source='subscriber_count', read_only=True)
 
     class Meta:
         model = Channel
@@ -110,6 +82,13 @@ class ChannelSimpleRepresentationSerializer(serializers.ModelSerializer):
         return representation
 
 
+class SubscribedChannelSerializer(ChannelSimpleRepresentationSerializer):
+    has_new_uploads = serializers.BooleanField(read_only=True)
+
+    class Meta(ChannelSimpleRepresentationSerializer.Meta):
+        fields = ChannelSimpleRepresentationSerializer.Meta.fields + ('has_new_uploads',)
+
+
 class CurrentChannelSerializer(serializers.ModelSerializer):
     class Meta:
         model = Channel
@@ -0,0 +1,62 @@
+from django.db.models import F
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.dispatch import receiver
+
+from apps.channel.models import Channel, ChannelSubscription
+
+
+@receiver(post_save, sender=ChannelSubscription)
+def increase_channel_subscriber_count(sender, instance: ChannelSubscription, created: bool, **kwargs):
+    if not created:
+        return
+
+    Channel.objects.filter(pk=instance.subscribing_id).update(
+        subscriber_count=F('subscriber_count') + 1
+    )
+
+    ChannelSubscription.objects.invalidate_subscribed_channel_ids([instance.subscriber_id])
+
+
+@receiver(post_delete, sender=ChannelSubscription)
+def decrease_channel_subscriber_count(sender, instance: ChannelSubscription, **kwargs):
+    Channel.objects.filter(pk=instance.subscribing_id).update(
+        subscriber_count=F('subscriber_count') - 1
+    )
+
+    ChannelSubscription.objects.invalidate_subscribed_channel_ids([instance.subscriber_id])
+
+
+@receiver(m2m_changed, sender=Channel.subscriptions.through)
+def refresh_channel_subscriber_count(sender, instance: Channel, action: str, pk_set, **kwargs):
+    if action == 'pre_clear':
+        instance._cleared_subscription_ids = set(
+            instance.subscriptions.values_list('pk', flat=True)
+        )
+        return
+
+    if action == 'post_clear':
+        Channel.objects.refresh_subscriber_count({instance.pk, *instance._cleared_subscription_ids})
+        ChannelSubscription.objects.invalidate_subscribed_channel_ids({instance.pk, *instance._cleared_subscription_ids})
+        return
+
+    if action not in ('post_add', 'post_remove'):
+        return
+
+    # The relation is symmetrical, so the mirrored rows that subscribe the
+    # other channels to the instance are written after this signal is sent
+    pending_mirrored_subscriptions = ChannelSubscription.objects.filter(
+        subscriber__in=pk_set,
+        subscribing=instance
+    ).count()
+
+    if action == 'post_add':
+        pending_mirrored_subscriptions = len(pk_set) - pending_mirrored_subscriptions
+    else:
+        pending_mirrored_subscriptions = -pending_mirrored_subscriptions
+
+    Channel.objects.refresh_subscriber_count({instance.pk, *pk_set})
+    ChannelSubscription.objects.invalidate_subscribed_channel_ids({instance.pk, *pk_set})
+
+    Channel.objects.filter(pk=instance.pk).update(
+        subscriber_count=F('subscriber_count') + pending_mirrored_subscriptions
+    )
@@ -13,6 +13,11 @@ urlpatterns = [
         views.RetrieveSubscribedChannelsView.as_view(),
         name='subscribed_channels'
     ),
+    path(
+        '<int:channel_id>/recommendations/',
+        views.RetrieveChannelRecommendationsView.as_view(),
+        name='channel_recommendations'
+    ),
     path(
         'search/',
         views.SearchChannelsView.as_view(),
@@ -1,4 +1,7 @@
-from django.db.models import Q, Subquery, OuterRef, Sum, Count
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db import IntegrityError, transaction
+from django.db.models import FloatField, Q
+from django.db.models.functions import Cast, Greatest
 from django.http import HttpResponse
 
 from rest_framework import status
@@ -10,12 +13,12 @@ from rest_framework.parsers import FormParser, MultiPartParser
 from drf_spectacular.utils import extend_schema, inline_serializer, OpenApiResponse
 
 from apps.channel.models import Channel, ChannelSubscription
-from apps.video.models import VideoView
 
 from apps.channel import serializers
 
 from youtube_clone.utils.storage import CloudinaryUploader
 from youtube_clone.enums import SearchSortOptions
+from youtube_clone.pagination import KeysetPagination
 
 
 class RetrieveOwnChannelsView(APIView):
@@ -62,12 +65,15 @@ class RetrieveChannelDetailsByIdView(APIView):
     )
     def get(self, request, channel_id, format=None):
         try:
-            channel = Channel.objects.get(pk=channel_id)
+            channel = Channel.objects.with_details().get(pk=channel_id)
         except Channel.DoesNotExist:
             return Response({
                 'message': 'The channel does not exists'
             }, status=status.HTTP_404_NOT_FOUND)
 
+        # Visiting a subscribed channel clears its new uploads flag
+        ChannelSubscription.objects.mark_seen(request.user, channel)
+
         serialized_channel = serializers.ChannelDetailsSerializer(channel, context={'request': request})
 
         return Response(serialized_channel.data, status=status.HTTP_200_OK)
@@ -95,12 +101,15 @@ class RetrieveChannelDetailsByHandleView(APIView):
     )
     def get(self, request, channel_handle, format=None):
         try:
-            channel = Channel.objects.get(handle=channel_handle)
+            channel = Channel.objects.with_details().get(handle=channel_handle)
         except Channel.DoesNotExist:
             return Response({
                 'message': 'The channel does not exists'
             }, status=status.HTTP_404_NOT_FOUND)
 
+        # Visiting a subscribed channel clears its new uploads flag
+        ChannelSubscription.objects.mark_seen(request.user, channel)
+
         serialized_channel = serializers.ChannelDetailsSerializer(channel, context={'request': request})
 
         return Response(serialized_channel.data, status=status.HTTP_200_OK)
@@ -111,34 +120,67 @@ class RetrieveSubscribedChannelsView(APIView):
 
     @extend_schema(
         summary='Retrieve subscribed channels',
-        description='',
+        description='Get the channels that the current channel subscribes to, in subscription order, flagging the ones with videos uploaded since they were last visited',
         responses={
             200: OpenApiResponse(
-                response=serializers.ChannelSimpleRepresentationSerializer(many=True)
+                response=serializers.SubscribedChannelSerializer(many=True)
             )
         }
     )
     def get(self, request, format=None):
-        ids_channels_subscribed = ChannelSubscription.objects.filter(
-            subscriber=request.user.current_channel
-        ).values_list('subscribing__id', flat=True).order_by('subscription_date')
+        channels_subscribed = Channel.objects.subscribed_by(request.user.current_channel_id)\
+            .order_by('subscription_date')
 
-        channels_subscribed = Channel.objects.filter(id__in=ids_channels_subscribed)
+        paginator = KeysetPagination()
+        channels_subscribed_page = paginator.paginate_queryset(channels_subscribed, request, view=self)
 
-        serialized_channels_subscribed = serializers.ChannelSimpleRepresentationSerializer(
-            channels_subscribed,
+        serialized_channels_subscribed = serializers.SubscribedChannelSerializer(
+            channels_subscribed_page,
             many=True
         )
 
+        return paginator.get_paginated_response(serialized_channels_subscribed.data)
+
+
+class RetrieveChannelRecommendationsView(APIView):
+    @extend_schema(
+        summary='Retrieve channel recommendations',
+        description='Get the channels most subscribed together with a channel, refreshed offline by the refresh_channel_recommendations command',
+        responses={
+            200: OpenApiResponse(
+                response=serializers.ChannelListSerializer(many=True)
+            ),
+            404: OpenApiResponse(
+                description='Channel does not exist',
+                response={
+                    'type': 'object',
+                    'properties': {
+                        'message': {'type': 'string'}
+                    }
+                }
+            )
+        }
+    )
+    def get(self, request, channel_id, format=None):
+        if not Channel.objects.filter(pk=channel_id).exists():
+            return Response({
+                'message': 'The channel does not exist'
+            }, status=status.HTTP_404_NOT_FOUND)
+
+        recommended_channels = Channel.objects.filter(recommended_in__channel_id=channel_id)\
+            .order_by('-recommended_in__score', 'pk')
+
+        serialized_recommended_channels = serializers.ChannelListSerializer(recommended_channels, many=True)
+
         return Response({
-            'data': serialized_channels_subscribed.data
+            'data': serialized_recommended_channels.data
         }, status=status.HTTP_200_OK)
 
 
 class SearchChannelsView(APIView):
     @extend_schema(
         summary='Search channels',
-        description='',
+        description='Search channels by name or handle tolerating typos, sorted by relevance, join date, views or subscribers',
         responses={
             200: OpenApiResponse(
                 response=serializers.ChannelListSerializer(many=True)
@@ -163,41 +205,43 @@ class SearchChannelsView(APIView):
                 'message': 'Search query is required'
             }, status=status.HTTP_400_BAD_REQUEST)
 
+        handle_search_query = search_query.lstrip('@')
+
         filtered_channels = Channel.objects.filter(
-            Q(name=search_query) | Q(name__icontains=search_query)
+            Q(name__icontains=search_query) |
+            Q(name__trigram_similar=search_query) |
+            Q(name__trigram_word_similar=search_query) |
+            Q(handle__trigram_similar=handle_search_query) |
+            Q(handle__trigram_word_similar=handle_search_query)
         )
 
-        if sort_by == SearchSortOptions.UPLOAD_DATE.value:
+        if sort_by == SearchSortOptions.RELEVANCE.value or sort_by is None:
+            # The similarity is a single precision real, cast to round trip through the cursor
+            filtered_channels = filtered_channels.annotate(
+                similarity=Cast(
+                    Greatest(
+                        TrigramSimilarity('name', search_query),
+                        TrigramSimilarity('handle', handle_search_query)
+                    ),
+                    FloatField()
+                )
+            ).order_by('-similarity', 'pk')
+        elif sort_by == SearchSortOptions.UPLOAD_DATE.value:
             filtered_channels = filtered_channels.order_by('joined')
         elif sort_by == SearchSortOptions.VIEW_COUNT.value:
-            total_video_views = Subquery(
-                VideoView.objects.filter(
-                    video__channel__pk=OuterRef('pk')
-                ).values_list('count')
-            )
-
-            filtered_channels = filtered_channels.annotate(
-                total_views=Sum(total_video_views)
-            ).order_by('total_views')
+            filtered_channels = filtered_channels.order_by('-total_views')
         elif sort_by == SearchSortOptions.RATING.value:
-            total_channel_subscribers = Subquery(
-                ChannelSubscription.objects.filter(
-                    subscribing__pk=OuterRef('pk')
-                ).values_list('pk')
-            )
+            filtered_channels = filtered_channels.order_by('-subscriber_count')
 
-            filtered_channels = filtered_channels.annotate(
-                total_subscribers=Count(total_channel_subscribers)
-            ).order_by('-total_subscribers')
+        paginator = KeysetPagination()
+        filtered_channels_page = paginator.paginate_queryset(filtered_channels, request, view=self)
 
         serialized_channels = serializers.ChannelListSerializer(
-            filtered_channels,
+            filtered_channels_page,
             many=True
         )
 
-        return Response({
-            'data': serialized_channels.data
-        }, status=status.HTTP_200_OK)
+        return paginator.get_paginated_response(serialized_channels.data)
 
 
 class CreateChannelView(APIView):
@@ -377,10 +421,17 @@ class SubscribeChannelView(APIView):
                 'message': 'Subscription removed'
             }, status=status.HTTP_200_OK)
         except ChannelSubscription.DoesNotExist:
-            ChannelSubscription.objects.create(
-                subscriber=request.user.current_channel,
-                subscribing=channel
-            ).save()
+            # A concurrent request may have added the subscription since the lookup
+            try:
+                with transaction.atomic():
+                    ChannelSubscription.objects.create(
+                        subscriber=request.user.current_channel,
+                        subscribing=channel
+                    ).save()
+            except IntegrityError:
+                return Response({
+                    'message': 'The subscription already exists'
+                }, status=status.HTTP_400_BAD_REQUEST)
 
             return Response({
                 'message': 'Subscription added'
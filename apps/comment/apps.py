@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class CommentConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.comment'
+
+    def ready(self):
+        from apps.comment import signals
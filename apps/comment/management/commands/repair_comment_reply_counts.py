@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from apps.comment.models import Comment
+
+
+class Command(BaseCommand):
+    help = 'Recompute the reply count of every comment from its replies'
+
+    def handle(self, *args, **options):
+        repaired_comments = Comment.objects.repair_reply_counts()
+
+        self.stdout.write(self.style.SUCCESS(f'Repaired the reply count of {repaired_comments} comments'))
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.2 on 2026-10-18 14:00
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def remove_duplicated_liked_comments(apps, schema_editor):
+    LikedComment = apps.get_model('comment', 'LikedComment')
+
+    duplicated_likes = LikedComment.objects\
+        .values('comment', 'channel')\
+        .annotate(total=Count('pk'), first_like=Min('pk'))\
+        .filter(total__gt=1)
+
+    for duplicated_like in duplicated_likes:
+        LikedComment.objects\
+            .filter(comment=duplicated_like['comment'], channel=duplicated_like['channel'])\
+            .exclude(pk=duplicated_like['first_like'])\
+            .delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('comment', '0004_alter_comment_options'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicated_liked_comments, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='likedcomment',
+            constraint=models.UniqueConstraint(fields=('comment', 'channel'), name='liked_comment_unique'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 4.2.2 on 2026-10-18 14:06
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def populate_comment_like_counters(apps, schema_editor):
+    Comment = apps.get_model('comment', 'Comment')
+    LikedComment = apps.get_model('comment', 'LikedComment')
+
+    def like_count_subquery(liked: bool):
+        return Coalesce(
+            Subquery(
+                LikedComment.objects.filter(comment=OuterRef('pk'), liked=liked)
+                    .order_by()
+                    .values('comment')
+                    .annotate(total=Count('pk'))
+                    .values('total')
+            ),
+            Value(0)
+        )
+
+    Comment.objects.update(
+        like_count=like_count_subquery(True),
+        dislike_count=like_count_subquery(False)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('comment', '0005_likedcomment_unique'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comment',
+            name='dislike_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='comment',
+            name='like_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(populate_comment_like_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 4.2.2 on 2026-10-18 14:23
+
+from django.db import migrations, models
+
+
+# Lower bound of the Wilson score interval (z = 1.96) of the likes among the
+# reactions, plus a bonus that grows with the logarithm of the replies
+CREATE_SCORE_TRIGGER = '''
+CREATE FUNCTION comment_comment_ranking_score(
+    likes double precision,
+    dislikes double precision,
+    replies double precision
+) RETURNS double precision AS $$
+    SELECT CASE WHEN likes = 0 THEN 0 ELSE (
+        (likes + 1.9208) / (likes + dislikes)
+        - 1.96 * sqrt(likes * dislikes / (likes + dislikes) + 0.9604) / (likes + dislikes)
+    ) / (1 + 3.8416 / (likes + dislikes)) END + 0.1 * ln(1 + replies)
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE FUNCTION comment_comment_score_update() RETURNS trigger AS $$
+BEGIN
+    NEW.score := comment_comment_ranking_score(
+        NEW.like_count,
+        NEW.dislike_count,
+        (SELECT count(*) FROM comment_comment WHERE comment_id = NEW.id)
+    );
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER comment_comment_score_trigger
+BEFORE UPDATE OF like_count, dislike_count ON comment_comment
+FOR EACH ROW EXECUTE FUNCTION comment_comment_score_update();
+
+UPDATE comment_comment SET score = comment_comment_ranking_score(
+    like_count,
+    dislike_count,
+    (SELECT count(*) FROM comment_comment AS reply WHERE reply.comment_id = comment_comment.id)
+);
+'''
+
+DROP_SCORE_TRIGGER = '''
+DROP TRIGGER IF EXISTS comment_comment_score_trigger ON comment_comment;
+DROP FUNCTION IF EXISTS comment_comment_score_update();
+DROP FUNCTION IF EXISTS comment_comment_ranking_score(double precision, double precision, double precision);
+'''
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('comment', '0006_comment_like_counters'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comment',
+            name='score',
+            field=models.FloatField(default=0, editable=False),
+        ),
+        migrations.RunSQL(CREATE_SCORE_TRIGGER, DROP_SCORE_TRIGGER),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(condition=models.Q(('comment__isnull', True)), fields=['video', '-score', '-id'], name='comment_top_score_idx'),
+        ),
+    ]
@@ -0,0 +1,76 @@
+# Generated by Django 4.2.2 on 2026-10-18 14:44
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+# The score reads the replies from the reply_count column instead of counting
+# them, and follows its updates like it follows the reactions
+CREATE_SCORE_TRIGGER = '''
+CREATE OR REPLACE FUNCTION comment_comment_score_update() RETURNS trigger AS $$
+BEGIN
+    NEW.score := comment_comment_ranking_score(NEW.like_count, NEW.dislike_count, NEW.reply_count);
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER comment_comment_score_trigger ON comment_comment;
+
+CREATE TRIGGER comment_comment_score_trigger
+BEFORE UPDATE OF like_count, dislike_count, reply_count ON comment_comment
+FOR EACH ROW EXECUTE FUNCTION comment_comment_score_update();
+'''
+
+DROP_SCORE_TRIGGER = '''
+CREATE OR REPLACE FUNCTION comment_comment_score_update() RETURNS trigger AS $$
+BEGIN
+    NEW.score := comment_comment_ranking_score(
+        NEW.like_count,
+        NEW.dislike_count,
+        (SELECT count(*) FROM comment_comment WHERE comment_id = NEW.id)
+    );
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER comment_comment_score_trigger ON comment_comment;
+
+CREATE TRIGGER comment_comment_score_trigger
+BEFORE UPDATE OF like_count, dislike_count ON comment_comment
+FOR EACH ROW EXECUTE FUNCTION comment_comment_score_update();
+'''
+
+
+def populate_comment_reply_count(apps, schema_editor):
+    Comment = apps.get_model('comment', 'Comment')
+
+    Comment.objects.update(
+        reply_count=Coalesce(
+            Subquery(
+                Comment.objects.filter(comment=OuterRef('pk'))
+                    .order_by()
+                    .values('comment')
+                    .annotate(total=Count('pk'))
+                    .values('total')
+            ),
+            Value(0)
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('comment', '0007_comment_score'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comment',
+            name='reply_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunSQL(CREATE_SCORE_TRIGGER, DROP_SCORE_TRIGGER),
+        migrations.RunPython(populate_comment_reply_count, migrations.RunPython.noop),
+    ]
@@ -1,10 +1,112 @@
-from django.db import models
+from typing import Dict, Iterable, List, Optional
+
+from django.db import connection, models
+from django.db.models.functions import RowNumber
 
 from apps.user.models import Channel
 from apps.video.models import Video
 
+from youtube_clone.reactions import ReactionManager
+
+
+class CommentManager(models.Manager):
+    def with_list_fields(self, channel_id: Optional[int] = None) -> models.QuerySet:
+        queryset = self.get_queryset().select_related('channel')
+
+        if channel_id is None:
+            return queryset.annotate(
+                viewer_liked=models.Value(False),
+                viewer_disliked=models.Value(False)
+            )
+
+        viewer_reactions = LikedComment.objects.filter(comment=models.OuterRef('pk'), channel_id=channel_id)
+
+        return queryset.annotate(
+            viewer_liked=models.Exists(viewer_reactions.filter(liked=True)),
+            viewer_disliked=models.Exists(viewer_reactions.filter(liked=False))
+        )
+
+    def first_replies(
+        self,
+        comment_ids: Iterable[int],
+        size: int,
+        channel_id: Optional[int] = None
+    ) -> Dict[int, List['Comment']]:
+        # Numbers the replies of every thread with a window function to read them in one query
+        replies = self.with_list_fields(channel_id)\
+            .filter(comment_id__in=comment_ids)\
+            .annotate(thread_position=models.Window(
+                RowNumber(),
+                partition_by=models.F('comment'),
+                order_by=models.F('pk').asc()
+            ))\
+            .filter(thread_position__lte=size)\
+            .order_by('comment', 'pk')
+
+        threads = {comment_id: [] for comment_id in comment_ids}
+
+        for reply in replies:
+            threads[reply.comment_id].append(reply)
+
+        return threads
+
+    def remove_channel_comments(self, channel_id: int):
+        # Also removes the replies under the comments from the counts of the kept rows
+        comment_table = self.model._meta.db_table
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'''
+                WITH RECURSIVE removed_comments AS (
+                    SELECT id, video_id, comment_id FROM {comment_table} WHERE channel_id = %s
+                    UNION
+                    SELECT reply.id, reply.video_id, reply.comment_id
+                    FROM {comment_table} AS reply
+                    JOIN removed_comments ON reply.comment_id = removed_comments.id
+                ), updated_videos AS (
+                    UPDATE {Video._meta.db_table} AS video
+                    SET comment_count = video.comment_count - video_comments.total
+                    FROM (
+                        SELECT video_id, count(*) AS total FROM removed_comments GROUP BY video_id
+                    ) AS video_comments
+                    WHERE video.id = video_comments.video_id
+                )
+                UPDATE {comment_table} AS parent
+                SET reply_count = parent.reply_count - replies.total
+                FROM (
+                    SELECT comment_id, count(*) AS total
+                    FROM removed_comments
+                    WHERE comment_id NOT IN (SELECT id FROM removed_comments)
+                    GROUP BY comment_id
+                ) AS replies
+                WHERE parent.id = replies.comment_id
+                ''',
+                [channel_id]
+            )
+
+    def repair_reply_counts(self) -> int:
+        comment_table = self.model._meta.db_table
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'''
+                UPDATE {comment_table} AS parent SET reply_count = replies.total
+                FROM (
+                    SELECT comment.id, count(reply.id) AS total
+                    FROM {comment_table} AS comment
+                    LEFT JOIN {comment_table} AS reply ON reply.comment_id = comment.id
+                    GROUP BY comment.id
+                ) AS replies
+                WHERE replies.id = parent.id AND replies.total <> parent.reply_count
+                '''
+            )
+
+            return cursor.rowcount
+
 
 class Comment(models.Model):
+    counter_fields = ('like_count', 'dislike_count', 'reply_count', 'score')
+
     channel = models.ForeignKey(Channel, on_delete=models.CASCADE, related_name='comment_channel')
     video = models.ForeignKey(Video, on_delete=models.CASCADE, related_name='comment_video')
     comment = models.ForeignKey('self', on_delete=models.CASCADE, related_name='comment_comment', null=True, blank=True)
@@ -12,15 +114,53 @@ class Comment(models.Model):
     publication_date = models.DateTimeField(auto_now_add=True, blank=True)
     was_edited = models.BooleanField(default=False)
     likes = models.ManyToManyField(Channel, through='LikedComment', related_name='comment_likes')
+    like_count = models.PositiveIntegerField(default=0)
+    dislike_count = models.PositiveIntegerField(default=0)
+    reply_count = models.PositiveIntegerField(default=0)
+    score = models.FloatField(default=0, editable=False)
+
+    objects = CommentManager()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['video', '-score', '-id'],
+                condition=models.Q(comment__isnull=True),
+                name='comment_top_score_idx'
+            ),
+        ]
 
     def __str__(self):
         return self.channel.name
 
+    def save(self, *args, **kwargs):
+        # The counters are only written with F() updates and the score by its
+        # trigger, so saving an instance loaded before a reaction or a reply
+        # does not revert them
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.counter_fields
+            ]
+
+        super().save(*args, **kwargs)
+
+
+class LikedCommentManager(ReactionManager):
+    target_field = 'comment'
+
 
 class LikedComment(models.Model):
     channel = models.ForeignKey(Channel, on_delete=models.CASCADE)
     comment = models.ForeignKey(Comment, on_delete=models.CASCADE)
     liked = models.BooleanField(default=True, blank=True)
 
+    objects = LikedCommentManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['comment', 'channel'], name='liked_comment_unique'),
+        ]
+
     def __str__(self):
         return self.channel.name
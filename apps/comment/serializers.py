@@ -1,5 +1,7 @@
 from rest_framework import serializers
 
+from drf_spectacular.utils import extend_schema_field
+
 from apps.comment.models import Comment, LikedComment
 
 from apps.channel.serializers import CurrentChannelSerializer
@@ -7,15 +9,16 @@ from apps.channel.serializers import CurrentChannelSerializer
 
 class CommentListSerializer(serializers.ModelSerializer):
     channel = CurrentChannelSerializer(read_only=True)
-    dislikes = serializers.SerializerMethodField('comment_dislikes')
+    likes = serializers.IntegerField(source='like_count', read_only=True)
+    dislikes = serializers.IntegerField(source='dislike_count', read_only=True)
     liked = serializers.SerializerMethodField('comment_liked')
     disliked = serializers.SerializerMethodField('comment_disliked')
-    comments = serializers.SerializerMethodField('comment_comments')
-
-    def comment_dislikes(self, instance: Comment) -> int:
-        return LikedComment.objects.filter(comment=instance, liked=False).count()
+    comments = serializers.IntegerField(source='reply_count', read_only=True)
 
     def comment_liked(self, instance: Comment) -> bool:
+        if hasattr(instance, 'viewer_liked'):
+            return instance.viewer_liked
+
         request = self.context.get('request')
 
         if request is None:
@@ -33,6 +36,9 @@ class CommentListSerializer(serializers.ModelSerializer):
         ).exists()
 
     def comment_disliked(self, instance: Comment) -> bool:
+        if hasattr(instance, 'viewer_disliked'):
+            return instance.viewer_disliked
+
         request = self.context.get('request')
 
         if request is None:
@@ -49,11 +55,6 @@ class CommentListSerializer(serializers.ModelSerializer):
             liked=False
         ).exists()
 
-    def comment_comments(self, instance: Comment) -> int:
-        return Comment.objects.filter(
-            comment=instance
-        ).count()
-
     class Meta:
         model = Comment
         fields = (
@@ -69,12 +70,27 @@ class CommentListSerializer(serializers.ModelSerializer):
             'comments'
         )
 
-    def to_representation(self, instance: Comment):
-        representation = super().to_representation(instance)
 
-        representation['likes'] = LikedComment.objects.filter(comment=instance, liked=True).count()
+class CommentThreadSerializer(CommentListSerializer):
+    replies = serializers.SerializerMethodField('comment_replies')
+
+    @extend_schema_field({
+        'type': 'object',
+        'properties': {
+            'data': {'type': 'array', 'items': {'type': 'object'}},
+            'next': {'type': 'string', 'nullable': True}
+        }
+    })
+    def comment_replies(self, instance: Comment) -> dict:
+        replies, next_cursor = self.context['replies'][instance.pk]
+
+        return {
+            'data': CommentListSerializer(replies, many=True, context=self.context).data,
+            'next': next_cursor
+        }
 
-        return representation
+    class Meta(CommentListSerializer.Meta):
+        fields = CommentListSerializer.Meta.fields + ('replies',)
 
 
 class CreateCommentSerializer(serializers.ModelSerializer):
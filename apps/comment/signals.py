@@ -0,0 +1,71 @@
+from django.db.models import F
+from django.db.models.signals import post_save, post_delete, pre_delete
+from django.dispatch import receiver
+
+from apps.comment.models import Comment, LikedComment
+from apps.channel.models import Channel
+from apps.video.models import Video
+from apps.video.signals import deletes_videos, get_origin_model
+
+from youtube_clone.reactions import like_counter_field
+
+
+@receiver(post_save, sender=Comment)
+def increase_video_comment_count(sender, instance: Comment, created: bool, **kwargs):
+    if not created:
+        return
+
+    Video.objects.filter(pk=instance.video_id).update(
+        comment_count=F('comment_count') + 1
+    )
+
+    if instance.comment_id is not None:
+        Comment.objects.filter(pk=instance.comment_id).update(
+            reply_count=F('reply_count') + 1
+        )
+
+
+@receiver(post_delete, sender=Comment)
+def decrease_video_comment_count(sender, instance: Comment, origin=None, **kwargs):
+    if deletes_videos(origin):
+        return
+
+    Video.objects.filter(pk=instance.video_id).update(
+        comment_count=F('comment_count') - 1
+    )
+
+    if instance.comment_id is not None:
+        Comment.objects.filter(pk=instance.comment_id).update(
+            reply_count=F('reply_count') - 1
+        )
+
+
+@receiver(post_save, sender=LikedComment)
+def increase_comment_like_count(sender, instance: LikedComment, created: bool, **kwargs):
+    if not created:
+        return
+
+    counter_field = like_counter_field(instance.liked)
+
+    Comment.objects.filter(pk=instance.comment_id).update(
+        **{counter_field: F(counter_field) + 1}
+    )
+
+
+@receiver(post_delete, sender=LikedComment)
+def decrease_comment_like_count(sender, instance: LikedComment, origin=None, **kwargs):
+    # The likes of a deleted comment go away with it
+    if deletes_videos(origin) or issubclass(get_origin_model(origin), Comment):
+        return
+
+    counter_field = like_counter_field(instance.liked)
+
+    Comment.objects.filter(pk=instance.comment_id).update(
+        **{counter_field: F(counter_field) - 1}
+    )
+
+
+@receiver(pre_delete, sender=Channel)
+def remove_channel_activity_from_comments(sender, instance: Channel, **kwargs):
+    Comment.objects.remove_channel_comments(instance.pk)
+    LikedComment.objects.remove_channel_reactions(instance.pk)
@@ -1,11 +1,12 @@
-from django.db.models import Count, Case, When, IntegerField
+from django.db import transaction
 
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly
 
-from drf_spectacular.utils import extend_schema, inline_serializer, OpenApiResponse
+from drf_spectacular.utils import extend_schema, inline_serializer, OpenApiResponse, OpenApiParameter
+from drf_spectacular.types import OpenApiTypes
 
 from apps.comment.models import Comment, LikedComment
 from apps.video.models import Video
@@ -13,18 +14,30 @@ from apps.video.models import Video
 from apps.comment import serializers
 
 from youtube_clone.enums import CommentSortOptions
+from youtube_clone.pagination import KeysetPagination
 
 
 class RetrieveVideoCommentsView(APIView):
     permission_classes = [IsAuthenticatedOrReadOnly]
+    replies_query_param = 'replies'
+    max_replies = 10
 
     @extend_schema(
         summary='Retrieve video comments',
-        description='Retrieve the comments of a video and these can be sorted by top comments and the newest first',
+        description='Retrieve the comments of a video and these can be sorted by top comments and the newest first. With the replies parameter every comment embeds its first replies and a cursor to continue the thread from the comments of comment endpoint',
+        parameters=[
+            OpenApiParameter(
+                'replies',
+                type=OpenApiTypes.INT,
+                required=False,
+                location=OpenApiParameter.QUERY,
+                description=f'Number of replies embedded in every comment, at most {max_replies}'
+            )
+        ],
         responses={
             200: OpenApiResponse(
                 description='Comments from a video',
-                response=serializers.CommentListSerializer(many=True)
+                response=serializers.CommentThreadSerializer(many=True)
             ),
             404: OpenApiResponse(
                 description='Video does not exist',
@@ -46,30 +59,65 @@ class RetrieveVideoCommentsView(APIView):
             }, status=status.HTTP_404_NOT_FOUND)
 
         sort_by = request.query_params.get('sort_by')
+        channel_id = request.user.current_channel_id if request.user.is_authenticated else None
 
-        video_comments = Comment.objects.filter(video=video, comment__isnull=True)
+        video_comments = Comment.objects\
+            .with_list_fields(channel_id)\
+            .filter(video=video, comment__isnull=True)
 
         if sort_by == CommentSortOptions.TOP_COMMENTS.value:
-            video_comments = video_comments.annotate(
-                num_likes=Count(
-                    Case(
-                        When(likedcomment__liked=True, then=1),
-                        output_field=IntegerField()
-                    )
-                )
-            ).order_by('-num_likes')
+            video_comments = video_comments.order_by('-score')
         elif sort_by == CommentSortOptions.NEWEST_FIRST.value:
             video_comments = video_comments.order_by('publication_date')
 
-        serialized_video_comments = serializers.CommentListSerializer(
-            video_comments,
+        paginator = KeysetPagination()
+        video_comments_page = paginator.paginate_queryset(video_comments, request, view=self)
+
+        replies_size = self.get_replies_size(request)
+
+        if replies_size == 0:
+            serialized_video_comments = serializers.CommentListSerializer(
+                video_comments_page,
+                many=True,
+                context={'request': request}
+            )
+
+            return paginator.get_paginated_response(serialized_video_comments.data)
+
+        threads = Comment.objects.first_replies(
+            [video_comment.pk for video_comment in video_comments_page],
+            replies_size + 1,
+            channel_id
+        )
+
+        # The threads continue from RetrieveCommentsOfCommentView, which pages the replies by id
+        replies_paginator = KeysetPagination()
+        replies_paginator.ordering = ['pk']
+
+        replies = {
+            comment_id: (
+                thread_replies[:replies_size],
+                replies_paginator.encode_cursor(thread_replies[replies_size - 1])
+                if len(thread_replies) > replies_size else None
+            )
+            for comment_id, thread_replies in threads.items()
+        }
+
+        serialized_video_comments = serializers.CommentThreadSerializer(
+            video_comments_page,
             many=True,
-            context={'request': request}
+            context={'request': request, 'replies': replies}
         )
 
-        return Response({
-            'data': serialized_video_comments.data
-        }, status=status.HTTP_200_OK)
+        return paginator.get_paginated_response(serialized_video_comments.data)
+
+    def get_replies_size(self, request) -> int:
+        try:
+            replies_size = int(request.query_params[self.replies_query_param])
+        except (KeyError, ValueError):
+            return 0
+
+        return min(max(replies_size, 0), self.max_replies)
 
 
 class RetrieveCommentsOfCommentView(APIView):
@@ -99,17 +147,20 @@ class RetrieveCommentsOfCommentView(APIView):
                 'message': 'The comment does not exist'
             }, status=status.HTTP_404_NOT_FOUND)
 
-        comments_of_comment = Comment.objects.filter(comment=comment)
+        comments_of_comment = Comment.objects\
+            .with_list_fields(request.user.current_channel_id if request.user.is_authenticated else None)\
+            .filter(comment=comment)
+
+        paginator = KeysetPagination()
+        comments_of_comment_page = paginator.paginate_queryset(comments_of_comment, request, view=self)
 
         serialized_comments_of_comment = serializers.CommentListSerializer(
-            comments_of_comment,
+            comments_of_comment_page,
             many=True,
             context={'request': request}
         )
 
-        return Response({
-            'data': serialized_comments_of_comment.data
-        }, status=status.HTTP_200_OK)
+        return paginator.get_paginated_response(serialized_comments_of_comment.data)
 
 
 class CreateVideoCommentView(APIView):
@@ -208,7 +259,8 @@ class CreateCommentForCommentView(APIView):
                 'errors': new_comment.errors
             }, status=status.HTTP_400_BAD_REQUEST)
 
-        new_comment.save()
+        with transaction.atomic():
+            new_comment.save()
 
         return Response({
             'message': 'The comment has been created'
@@ -229,7 +281,11 @@ class LikeCommentView(APIView):
                 response={
                     'type': 'object',
                     'properties': {
-                        'message': {'type': 'string'}
+                        'message': {'type': 'string'},
+                        'liked': {'type': 'boolean'},
+                        'disliked': {'type': 'boolean'},
+                        'likes': {'type': 'integer'},
+                        'dislikes': {'type': 'integer'}
                     }
                 }
             ),
@@ -245,37 +301,16 @@ class LikeCommentView(APIView):
         }
     )
     def post(self, request, comment_id, format=None):
-        try:
-            comment = Comment.objects.get(id=comment_id)
-        except Comment.DoesNotExist:
+        like_comment = LikedComment.objects.toggle(request.user.current_channel_id, comment_id, liked=True)
+
+        if like_comment is None:
             return Response({
                 'message': 'The comment does not exist'
             }, status=status.HTTP_404_NOT_FOUND)
 
-        like_comment = LikedComment.objects.filter(
-            channel=request.user.current_channel,
-            comment=comment
-        ).first()
-
-        if like_comment is not None:
-            if like_comment.liked:
-                like_comment.delete()
-
-                return Response({
-                    'message': 'Like comment removed'
-                }, status=status.HTTP_200_OK)
-
-            like_comment.liked = True
-            like_comment.save()
-        else:
-            LikedComment.objects.create(
-                channel=request.user.current_channel,
-                comment=comment,
-                liked=True
-            ).save()
-
         return Response({
-            'message': 'Like comment added'
+            'message': 'Like comment added' if like_comment['liked'] else 'Like comment removed',
+            **like_comment
         }, status=status.HTTP_200_OK)
 
 
@@ -293,7 +328,11 @@ class DislikeCommentView(APIView):
                 response={
                     'type': 'object',
                     'properties': {
-                        'message': {'type': 'string'}
+                        'message': {'type': 'string'},
+                        'liked': {'type': 'boolean'},
+                        'disliked': {'type': 'boolean'},
+                        'likes': {'type': 'integer'},
+                        'dislikes': {'type': 'integer'}
                     }
                 }
             ),
@@ -309,37 +348,16 @@ class DislikeCommentView(APIView):
         }
     )
     def post(self, request, comment_id, format=None):
-        try:
-            comment = Comment.objects.get(id=comment_id)
-        except Comment.DoesNotExist:
+        dislike_comment = LikedComment.objects.toggle(request.user.current_channel_id, comment_id, liked=False)
+
+        if dislike_comment is None:
             return Response({
                 'message': 'The comment does not exist'
             }, status=status.HTTP_404_NOT_FOUND)
 
-        dislike_comment = LikedComment.objects.filter(
-            channel=request.user.current_channel,
-            comment=comment
-        ).first()
-
-        if dislike_comment is not None:
-            if dislike_comment.liked == False:
-                dislike_comment.delete()
-
-                return Response({
-                    'message': 'Dislike comment removed'
-                }, status=status.HTTP_200_OK)
-
-            dislike_comment.liked = False
-            dislike_comment.save()
-        else:
-            LikedComment.objects.create(
-                channel=request.user.current_channel,
-                comment=comment,
-                liked=False
-            ).save()
-
         return Response({
-            'message': 'Dislike comment added'
+            'message': 'Dislike comment added' if dislike_comment['disliked'] else 'Dislike comment removed',
+            **dislike_comment
         }, status=status.HTTP_200_OK)
 
 
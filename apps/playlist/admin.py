@@ -11,7 +11,7 @@ class PlaylistAdmin(admin.ModelAdmin):
 
 
 class PlaylistVideoAdmin(admin.ModelAdmin):
-    list_display = ['video', 'playlist', 'position', 'date_added']
+    list_display = ['video', 'playlist', 'rank', 'date_added']
     ordering = ['video']
 
 admin.site.register(Playlist, PlaylistAdmin)
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class PlaylistConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.playlist'
+
+    def ready(self):
+        from apps.playlist import signals
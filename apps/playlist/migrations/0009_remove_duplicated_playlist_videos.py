@@ -0,0 +1,42 @@
+# Generated by Django 4.2.2 on 2026-10-18 14:00
+
+from django.db import migrations
+from django.db.models import Count, Min
+
+
+def remove_duplicated_playlist_videos(apps, schema_editor):
+    PlaylistVideo = apps.get_model('playlist', 'PlaylistVideo')
+
+    duplicated_playlist_videos = PlaylistVideo.objects\
+        .values('playlist', 'video')\
+        .annotate(total=Count('pk'), first_playlist_video=Min('pk'))\
+        .filter(total__gt=1)
+
+    playlists_ids = set()
+
+    for duplicated_playlist_video in duplicated_playlist_videos:
+        PlaylistVideo.objects\
+            .filter(playlist=duplicated_playlist_video['playlist'], video=duplicated_playlist_video['video'])\
+            .exclude(pk=duplicated_playlist_video['first_playlist_video'])\
+            .delete()
+
+        playlists_ids.add(duplicated_playlist_video['playlist'])
+
+    for playlist_id in playlists_ids:
+        playlist_videos = PlaylistVideo.objects.filter(playlist=playlist_id).order_by('position', 'pk')
+
+        for position, playlist_video in enumerate(playlist_videos):
+            if playlist_video.position != position:
+                playlist_video.position = position
+                playlist_video.save(update_fields=['position'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('playlist', '0008_alter_playlist_options_remove_playlist_thumbnail_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicated_playlist_videos, migrations.RunPython.noop),
+    ]
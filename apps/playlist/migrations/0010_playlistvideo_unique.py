@@ -0,0 +1,21 @@
+# Generated by Django 4.2.2 on 2026-10-18 14:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('playlist', '0009_remove_duplicated_playlist_videos'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='playlistvideo',
+            index=models.Index(fields=['playlist', 'position'], name='playlist_video_position_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='playlistvideo',
+            constraint=models.UniqueConstraint(fields=('playlist', 'video'), name='playlist_video_unique'),
+        ),
+    ]
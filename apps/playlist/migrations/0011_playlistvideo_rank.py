@@ -0,0 +1,62 @@
+# Generated by Django 4.2.2 on 2026-10-18 15:02
+
+from django.db import migrations, models
+
+
+POPULATE_RANKS = '''
+UPDATE playlist_playlistvideo AS playlist_video
+SET rank = (ranked.position - 1) * 1024.0
+FROM (
+    SELECT id, row_number() OVER (PARTITION BY playlist_id ORDER BY position, id) AS position
+    FROM playlist_playlistvideo
+) AS ranked
+WHERE ranked.id = playlist_video.id;
+'''
+
+POPULATE_POSITIONS = '''
+UPDATE playlist_playlistvideo AS playlist_video
+SET position = ranked.position - 1
+FROM (
+    SELECT id, row_number() OVER (PARTITION BY playlist_id ORDER BY rank, id) AS position
+    FROM playlist_playlistvideo
+) AS ranked
+WHERE ranked.id = playlist_video.id;
+'''
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('playlist', '0010_playlistvideo_unique'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='playlistvideo',
+            name='rank',
+            field=models.FloatField(default=0),
+            preserve_default=False,
+        ),
+        migrations.RunSQL(POPULATE_RANKS, POPULATE_POSITIONS),
+        migrations.AlterModelOptions(
+            name='playlistvideo',
+            options={'ordering': ['rank']},
+        ),
+        migrations.RemoveIndex(
+            model_name='playlistvideo',
+            name='playlist_video_position_idx',
+        ),
+        migrations.AlterField(
+            model_name='playlistvideo',
+            name='position',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.RemoveField(
+            model_name='playlistvideo',
+            name='position',
+        ),
+        migrations.AddIndex(
+            model_name='playlistvideo',
+            index=models.Index(fields=['playlist', 'rank'], name='playlist_video_rank_idx'),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 4.2.2 on 2026-10-18 14:58
+
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def populate_playlist_video_fields(apps, schema_editor):
+    Playlist = apps.get_model('playlist', 'Playlist')
+    PlaylistVideo = apps.get_model('playlist', 'PlaylistVideo')
+
+    first_playlist_videos = PlaylistVideo.objects.filter(playlist=OuterRef('pk')).order_by('rank', 'pk')
+
+    Playlist.objects.update(
+        video_count=Coalesce(
+            Subquery(
+                PlaylistVideo.objects.filter(playlist=OuterRef('pk'))
+                    .order_by()
+                    .values('playlist')
+                    .annotate(total=Count('pk'))
+                    .values('total')
+            ),
+            Value(0)
+        ),
+        first_video=Subquery(first_playlist_videos.values('video')[:1]),
+        thumbnail_url=Coalesce(
+            Subquery(PlaylistVideo.objects.filter(pk=OuterRef('video_thumbnail')).values('video__thumbnail')),
+            Subquery(first_playlist_videos.values('video__thumbnail')[:1])
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('video', '0015_likedvideo_unique'),
+        ('playlist', '0011_playlistvideo_rank'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='playlist',
+            name='first_video',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='video.video'),
+        ),
+        migrations.AddField(
+            model_name='playlist',
+            name='thumbnail_url',
+            field=models.URLField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='playlist',
+            name='video_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(populate_playlist_video_fields, migrations.RunPython.noop),
+    ]
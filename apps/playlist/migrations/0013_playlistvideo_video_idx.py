@@ -0,0 +1,17 @@
+# Generated by Django 4.2.2 on 2026-10-18 15:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('playlist', '0012_playlist_video_fields'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='playlistvideo',
+            index=models.Index(fields=['video', 'playlist'], name='playlist_video_video_idx'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.2 on 2026-10-18 16:20
+
+from django.db import migrations, models
+
+
+POPULATE_SLOTS = '''
+UPDATE playlist_playlistvideo AS playlist_video
+SET slot = numbered.slot - 1
+FROM (
+    SELECT id, row_number() OVER (PARTITION BY playlist_id ORDER BY rank, id) AS slot
+    FROM playlist_playlistvideo
+) AS numbered
+WHERE numbered.id = playlist_video.id;
+'''
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('playlist', '0013_playlistvideo_video_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='playlistvideo',
+            name='slot',
+            field=models.PositiveIntegerField(default=0, editable=False),
+            preserve_default=False,
+        ),
+        migrations.RunSQL(POPULATE_SLOTS, migrations.RunSQL.noop),
+        migrations.AddConstraint(
+            model_name='playlistvideo',
+            constraint=models.UniqueConstraint(deferrable=models.Deferrable['IMMEDIATE'], fields=('playlist', 'slot'), name='playlist_video_slot_unique'),
+        ),
+    ]
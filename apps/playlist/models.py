@@ -1,6 +1,9 @@
-from typing import Dict, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from django.db import models
+from django.db import connection, models, transaction
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from django.utils.functional import cached_property
 
 from apps.channel.models import Channel
 from apps.video.models import Video
@@ -8,7 +11,35 @@ from apps.video.models import Video
 from apps.playlist.choices import Visibility
 
 
+class PlaylistManager(models.Manager):
+    def with_video_saved(self, video_id: int) -> models.QuerySet:
+        return self.get_queryset().annotate(
+            video_is_saved=models.Exists(
+                PlaylistVideo.objects.filter(playlist=models.OuterRef('pk'), video_id=video_id)
+            )
+        )
+
+    def update_video_fields(self, playlist_ids: Iterable[int], added_videos: int = 0):
+        # The thumbnail is the one of the chosen thumbnail video or else of the first video
+        first_playlist_videos = PlaylistVideo.objects.filter(
+            playlist=models.OuterRef('pk')
+        ).order_by('rank', 'pk')
+
+        self.get_queryset().filter(pk__in=playlist_ids).update(
+            video_count=models.F('video_count') + added_videos,
+            first_video=models.Subquery(first_playlist_videos.values('video')[:1]),
+            thumbnail_url=Coalesce(
+                models.Subquery(
+                    PlaylistVideo.objects.filter(pk=models.OuterRef('video_thumbnail')).values('video__thumbnail')
+                ),
+                models.Subquery(first_playlist_videos.values('video__thumbnail')[:1])
+            )
+        )
+
+
 class Playlist(models.Model):
+    video_fields = ('video_count', 'first_video', 'thumbnail_url')
+
     channel = models.ForeignKey(Channel, on_delete=models.CASCADE)
     video_thumbnail = models.ForeignKey(
         "PlaylistVideo",
@@ -26,6 +57,18 @@ class Playlist(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    video_count = models.PositiveIntegerField(default=0, editable=False)
+    first_video = models.ForeignKey(
+        Video,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name='+'
+    )
+    thumbnail_url = models.URLField(null=True, blank=True, editable=False)
+
+    objects = PlaylistManager()
 
     class Meta:
         ordering = ['-updated_at']
@@ -33,29 +76,255 @@ class Playlist(models.Model):
     def __str__(self) -> str:
         return self.name
 
+    def save(self, *args, **kwargs):
+        # The video fields are only written by PlaylistManager.update_video_fields,
+        # so saving an instance loaded before a video change does not revert them
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.video_fields
+            ]
+
+        super().save(*args, **kwargs)
 
+
+# Videos are ordered by a fractional rank and also hold a dense slot used by the shuffle
 class PlaylistVideoManager(models.Manager):
+    rank_step = 1024.0
+
     def create(self, video, playlist):
-        last_playlist_video = self.get_queryset().filter(
-            playlist=playlist
-        ).last()
-
-        if last_playlist_video is not None:
-            position = last_playlist_video.position + 1
-        else:
-            position = 0
-
-        return super().create(
-            video=video,
-            playlist=playlist,
-            position=position
+        with transaction.atomic():
+            video_count = self._lock_video_count(playlist.pk)
+
+            last_rank = self.get_queryset().filter(playlist=playlist).aggregate(rank=models.Max('rank'))['rank']
+            rank = last_rank + self.rank_step if last_rank is not None else 0
+
+            playlist_video = super().create(
+                video=video,
+                playlist=playlist,
+                rank=rank,
+                slot=video_count
+            )
+            playlist_video.position = video_count
+
+            Playlist.objects.update_video_fields([playlist.pk], 1)
+
+        return playlist_video
+
+    def bulk_add(self, playlist: Playlist, video_ids: List[int]) -> List['PlaylistVideo']:
+        # The count grows by the rows actually inserted, so concurrent adds are not counted twice
+        with transaction.atomic():
+            video_count = self._lock_video_count(playlist.pk)
+
+            saved_video_ids = set(
+                self.get_queryset()
+                    .filter(playlist=playlist, video_id__in=video_ids)
+                    .order_by()
+                    .values_list('video_id', flat=True)
+            )
+            new_video_ids = [video_id for video_id in dict.fromkeys(video_ids) if video_id not in saved_video_ids]
+
+            last_rank = self.get_queryset().filter(playlist=playlist).aggregate(rank=models.Max('rank'))['rank']
+            first_rank = last_rank + self.rank_step if last_rank is not None else 0
+
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f'''
+                    INSERT INTO {self.model._meta.db_table} (playlist_id, video_id, rank, slot, date_added)
+                    SELECT
+                        %s,
+                        new_video.video_id,
+                        %s + (new_video.position - 1) * %s,
+                        %s + new_video.position - 1,
+                        %s
+                    FROM unnest(%s::bigint[]) WITH ORDINALITY AS new_video(video_id, position)
+                    ON CONFLICT (playlist_id, video_id) DO NOTHING
+                    RETURNING id, video_id, rank, slot, date_added
+                    ''',
+                    [playlist.pk, first_rank, self.rank_step, video_count, timezone.now(), new_video_ids]
+                )
+
+                new_playlist_videos = [
+                    self.model(pk=pk, playlist=playlist, video_id=video_id, rank=rank, slot=slot, date_added=date_added)
+                    for pk, video_id, rank, slot, date_added in cursor.fetchall()
+                ]
+
+            Playlist.objects.update_video_fields([playlist.pk], len(new_playlist_videos))
+
+        return sorted(new_playlist_videos, key=lambda playlist_video: playlist_video.rank)
+
+    def bulk_remove(self, playlist: Playlist, video_ids: List[int]) -> int:
+        with transaction.atomic():
+            video_count = self._lock_video_count(playlist.pk)
+
+            removed_playlist_videos = self.get_queryset().filter(playlist=playlist, video_id__in=video_ids)
+            removed_slots = list(removed_playlist_videos.values_list('slot', flat=True))
+
+            removed_playlist_videos.delete()
+
+            if playlist.video_thumbnail_id is not None and not self.get_queryset().filter(pk=playlist.video_thumbnail_id).exists():
+                playlist.video_thumbnail = self.get_queryset().filter(playlist=playlist).first()
+                playlist.save(update_fields=['video_thumbnail'])
+
+            self.fill_slots(playlist.pk, video_count, removed_slots)
+
+            Playlist.objects.update_video_fields([playlist.pk], -len(removed_slots))
+
+        return len(removed_slots)
+
+    def vacate_slot(self, playlist_video: 'PlaylistVideo'):
+        # The video in the last slot takes the slot of the deleted one
+        playlist_video_table = self.model._meta.db_table
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'''
+                UPDATE {Playlist._meta.db_table} SET video_count = video_count - 1
+                WHERE id = %s
+                RETURNING video_count
+                ''',
+                [playlist_video.playlist_id]
+            )
+
+            # The videos of a deleted playlist have nothing to swap with
+            if cursor.rowcount == 0:
+                return
+
+            last_slot, = cursor.fetchone()
+
+            # The slots are swapped within the statement, before the unique
+            # constraint is checked
+            cursor.execute(
+                f'''
+                UPDATE {playlist_video_table} AS playlist_video
+                SET slot = CASE
+                    WHEN playlist_video.id = %(id)s THEN %(last_slot)s
+                    ELSE (SELECT slot FROM {playlist_video_table} WHERE id = %(id)s)
+                END
+                WHERE playlist_video.playlist_id = %(playlist_id)s
+                    AND (playlist_video.id = %(id)s OR playlist_video.slot = %(last_slot)s)
+                ''',
+                {'id': playlist_video.pk, 'playlist_id': playlist_video.playlist_id, 'last_slot': last_slot}
+            )
+
+    def fill_slots(self, playlist_id: int, video_count: int, removed_slots: List[int]):
+        new_video_count = video_count - len(removed_slots)
+        free_slots = sorted(slot for slot in removed_slots if slot < new_video_count)
+
+        if not free_slots:
+            return
+
+        playlist_video_table = self.model._meta.db_table
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'''
+                UPDATE {playlist_video_table} AS playlist_video
+                SET slot = free_slot.slot
+                FROM unnest(%s::integer[]) WITH ORDINALITY AS free_slot(slot, number)
+                INNER JOIN (
+                    SELECT id, row_number() OVER (ORDER BY slot) AS number
+                    FROM {playlist_video_table}
+                    WHERE playlist_id = %s AND slot >= %s
+                ) AS last_slot ON last_slot.number = free_slot.number
+                WHERE playlist_video.id = last_slot.id
+                ''',
+                [free_slots, playlist_id, new_video_count]
+            )
+
+    def _lock_video_count(self, playlist_id: int) -> int:
+        # Serializes the changes of the videos of the playlist, which assign
+        # and fill its slots from the video count
+        return Playlist.objects.select_for_update().values_list('video_count', flat=True).get(pk=playlist_id)
+
+    def number_positions(self, playlist_videos: List['PlaylistVideo'], first_position: Optional[int] = None) -> List['PlaylistVideo']:
+        if len(playlist_videos) == 0:
+            return playlist_videos
+
+        if first_position is None:
+            first_position = playlist_videos[0].position
+
+        for position, playlist_video in enumerate(playlist_videos, start=first_position):
+            playlist_video.position = position
+
+        return playlist_videos
+
+    def at_slots(self, playlist_id: int, slots: List[int]) -> List['PlaylistVideo']:
+        playlist_videos = self.get_queryset()\
+            .select_related('video__channel')\
+            .filter(playlist_id=playlist_id, slot__in=slots)
+
+        playlist_videos_by_slot = {playlist_video.slot: playlist_video for playlist_video in playlist_videos}
+
+        return [playlist_videos_by_slot[slot] for slot in slots if slot in playlist_videos_by_slot]
+
+    def move(self, playlist_video: 'PlaylistVideo', new_position: int):
+        # Takes the middle rank of its new neighbours
+        old_position = playlist_video.position
+
+        with transaction.atomic():
+            rank = self._rank_at(playlist_video, new_position)
+
+            if rank is None:
+                self.rebalance(playlist_video.playlist_id)
+                rank = self._rank_at(playlist_video, new_position)
+
+            self.get_queryset().filter(pk=playlist_video.pk).update(rank=rank)
+
+            if old_position == 0 or new_position == 0:
+                Playlist.objects.update_video_fields([playlist_video.playlist_id])
+
+        playlist_video.rank = rank
+        playlist_video.position = new_position
+
+    def _rank_at(self, playlist_video: 'PlaylistVideo', position: int) -> Optional[float]:
+        neighbour_ranks = list(
+            self.get_queryset()
+                .filter(playlist_id=playlist_video.playlist_id)
+                .exclude(pk=playlist_video.pk)
+                .order_by('rank', 'pk')
+                .values_list('rank', flat=True)[max(position - 1, 0):position + 1]
         )
 
+        if position == 0:
+            return neighbour_ranks[0] - self.rank_step if neighbour_ranks else 0
+
+        if len(neighbour_ranks) == 1:
+            return neighbour_ranks[0] + self.rank_step
+
+        previous_rank, next_rank = neighbour_ranks
+        rank = (previous_rank + next_rank) / 2
+
+        # The floats between both ranks have been used up
+        if not previous_rank < rank < next_rank:
+            return None
+
+        return rank
+
+    def rebalance(self, playlist_id: int):
+        playlist_video_table = self.model._meta.db_table
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'''
+                UPDATE {playlist_video_table} AS playlist_video
+                SET rank = (ranked.position - 1) * %s
+                FROM (
+                    SELECT id, row_number() OVER (ORDER BY rank, id) AS position
+                    FROM {playlist_video_table}
+                    WHERE playlist_id = %s
+                ) AS ranked
+                WHERE ranked.id = playlist_video.id
+                ''',
+                [self.rank_step, playlist_id]
+            )
+
 
 class PlaylistVideo(models.Model):
     video = models.ForeignKey(Video, on_delete=models.CASCADE)
     playlist = models.ForeignKey(Playlist, on_delete=models.CASCADE)
-    position = models.PositiveSmallIntegerField()
+    rank = models.FloatField()
+    slot = models.PositiveIntegerField(editable=False)
     date_added = models.DateTimeField(auto_now_add=True)
 
     objects = PlaylistVideoManager()
@@ -64,7 +333,27 @@ class PlaylistVideo(models.Model):
         return self.video.title
 
     class Meta:
-        ordering = ['position']
+        ordering = ['rank']
+        constraints = [
+            models.UniqueConstraint(fields=['playlist', 'video'], name='playlist_video_unique'),
+            models.UniqueConstraint(
+                fields=['playlist', 'slot'],
+                name='playlist_video_slot_unique',
+                deferrable=models.Deferrable.IMMEDIATE
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['playlist', 'rank'], name='playlist_video_rank_idx'),
+            models.Index(fields=['video', 'playlist'], name='playlist_video_video_idx'),
+        ]
+
+    @cached_property
+    def position(self) -> int:
+        return PlaylistVideo.objects.filter(
+            playlist_id=self.playlist_id
+        ).filter(
+            models.Q(rank__lt=self.rank) | models.Q(rank=self.rank, pk__lt=self.pk)
+        ).count()
 
     def delete(self) -> Tuple[int, Dict[str, int]]:
         if self.playlist.video_thumbnail is not None and self.playlist.video_thumbnail.pk == self.pk:
@@ -72,13 +361,6 @@ class PlaylistVideo(models.Model):
                 playlist=self.playlist
             ).exclude(pk=self.pk).first()
 
-            self.playlist.save()
-
-        PlaylistVideo.objects.filter(
-            playlist=self.playlist,
-            position__gt=self.position
-        ).update(
-            position=models.F('position') - 1
-        )
+            self.playlist.save(update_fields=['video_thumbnail'])
 
         return super(PlaylistVideo, self).delete()
@@ -2,32 +2,15 @@ from rest_framework import serializers
 
 from apps.playlist.models import Playlist, PlaylistVideo
 
-from apps.video.serializers import VideoListSimpleSerializer
+from apps.video.serializers import VideoListSimpleSerializer, VideoBatchListSerializer
 from apps.channel.serializers import ChannelSimpleRepresentationSerializer
 
 
 class PlaylistDetailsSerializer(serializers.ModelSerializer):
     channel = ChannelSimpleRepresentationSerializer(read_only=True)
-    thumbnail = serializers.SerializerMethodField('playlist_thumbnail')
-    first_video_id = serializers.SerializerMethodField('playlist_first_video_id')
-    total_videos = serializers.SerializerMethodField('playlist_total_videos')
-
-    def playlist_first_video_id(self, instance: Playlist) -> int:
-        try:
-            return PlaylistVideo.objects.get(playlist=instance, position=0).video.pk
-        except PlaylistVideo.DoesNotExist:
-            return None
-
-    def playlist_total_videos(self, instance: Playlist) -> int:
-        return PlaylistVideo.objects.filter(playlist=instance).count()
-
-    def playlist_thumbnail(self, instance: Playlist) -> str:
-        if instance.video_thumbnail is not None:
-            return instance.video_thumbnail.video.thumbnail 
-
-        first_playlist_video = PlaylistVideo.objects.filter(playlist=instance, position=0).first()
-
-        return first_playlist_video.video.thumbnail if first_playlist_video is not None else None
+    thumbnail = serializers.URLField(source='thumbnail_url', read_only=True)
+    first_video_id = serializers.IntegerField(read_only=True)
+    total_videos = serializers.IntegerField(source='video_count', read_only=True)
 
     class Meta:
         model = Playlist
@@ -47,17 +30,8 @@ class PlaylistDetailsSerializer(serializers.ModelSerializer):
 
 class PlaylistSimpleSerializer(serializers.ModelSerializer):
     channel = ChannelSimpleRepresentationSerializer(read_only=True)
-    total_videos = serializers.SerializerMethodField('playlist_total_videos')
-    first_video_id = serializers.SerializerMethodField('playlist_first_video_id')
-
-    def playlist_first_video_id(self, instance: Playlist) -> int:
-        try:
-            return PlaylistVideo.objects.get(playlist=instance, position=0).video.pk
-        except PlaylistVideo.DoesNotExist:
-            return None
-
-    def playlist_total_videos(self, instance: Playlist) -> int:
-        return PlaylistVideo.objects.filter(playlist=instance).count()
+    total_videos = serializers.IntegerField(source='video_count', read_only=True)
+    first_video_id = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Playlist
@@ -71,11 +45,17 @@ class PlaylistSimpleSerializer(serializers.ModelSerializer):
         )
 
 
+class PlaylistVideoBatchListSerializer(VideoBatchListSerializer):
+    related_fields = ('video__channel',)
+
+
 class PlaylistVideoListSerializer(serializers.ModelSerializer):
     video = VideoListSimpleSerializer(read_only=True)
+    position = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = PlaylistVideo
+        list_serializer_class = PlaylistVideoBatchListSerializer
         fields = (
             'id',
             'position',
@@ -84,26 +64,9 @@ class PlaylistVideoListSerializer(serializers.ModelSerializer):
 
 
 class PlaylistListSerializer(serializers.ModelSerializer):
-    thumbnail = serializers.SerializerMethodField('playlist_thumbnail')
-    first_video_id = serializers.SerializerMethodField('playlist_first_video_id')
-    total_videos = serializers.SerializerMethodField('playlist_total_videos')
-
-    def playlist_thumbnail(self, instance: Playlist) -> str:
-        if instance.video_thumbnail is not None:
-            return instance.video_thumbnail.video.thumbnail 
-
-        first_playlist_video = PlaylistVideo.objects.filter(playlist=instance, position=0).first()
-
-        return first_playlist_video.video.thumbnail if first_playlist_video is not None else None
-
-    def playlist_first_video_id(self, instance: Playlist) -> int:
-        try:
-            return PlaylistVideo.objects.get(playlist=instance, position=0).video.pk
-        except PlaylistVideo.DoesNotExist:
-            return None
-
-    def playlist_total_videos(self, instance: Playlist) -> int:
-        return PlaylistVideo.objects.filter(playlist=instance).count()
+    thumbnail = serializers.URLField(source='thumbnail_url', read_only=True)
+    first_video_id = serializers.IntegerField(read_only=True)
+    total_videos = serializers.IntegerField(source='video_count', read_only=True)
 
     class Meta:
         model = Playlist
@@ -119,15 +82,7 @@ class PlaylistListSerializer(serializers.ModelSerializer):
 
 
 class PlaylistToSaveVideoSerializer(serializers.ModelSerializer):
-    video_is_saved = serializers.SerializerMethodField('playlist_video_is_saved')
-
-    def playlist_video_is_saved(self, instance: Playlist) -> bool:
-        video_id = self.context.get('video_id')
-
-        return PlaylistVideo.objects.filter(
-            playlist=instance,
-            video__pk=video_id
-        ).exists()
+    video_is_saved = serializers.BooleanField(read_only=True)
 
     class Meta:
         model = Playlist
@@ -148,6 +103,14 @@ class PlaylistListSimpleSerializer(serializers.ModelSerializer):
         )
 
 
+class PlaylistVideoIdsSerializer(serializers.Serializer):
+    video_ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        allow_empty=False,
+        max_length=200
+    )
+
+
 class CreatePlaylistSerializer(serializers.ModelSerializer):
     class Meta:
         model = Playlist
@@ -175,4 +138,9 @@ class UpdatePlaylistSerializer(serializers.ModelSerializer):
                     'Video does not belong to the playlist'
                 )
 
-        return super().update(instance, validated_data)
+        playlist = super().update(instance, validated_data)
+
+        if 'video_thumbnail' in validated_data:
+            Playlist.objects.update_video_fields([playlist.pk])
+
+        return playlist
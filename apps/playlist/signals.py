@@ -0,0 +1,41 @@
+from django.db.models import QuerySet
+from django.db.models.signals import post_save, post_delete, pre_delete
+from django.dispatch import receiver
+
+from apps.playlist.models import Playlist, PlaylistVideo
+from apps.video.models import Video
+
+
+def is_bulk_deletion(origin) -> bool:
+    # The bulk removal updates the playlist once for all its videos and the
+    # deleted playlists do not need it
+    origin_model = origin.model if isinstance(origin, QuerySet) else type(origin)
+
+    return origin_model in (PlaylistVideo, Playlist) and not isinstance(origin, PlaylistVideo)
+
+
+@receiver(pre_delete, sender=PlaylistVideo)
+def vacate_playlist_video_slot(sender, instance: PlaylistVideo, origin=None, **kwargs):
+    if is_bulk_deletion(origin):
+        return
+
+    PlaylistVideo.objects.vacate_slot(instance)
+
+
+@receiver(post_delete, sender=PlaylistVideo)
+def refresh_playlist_video_fields(sender, instance: PlaylistVideo, origin=None, **kwargs):
+    if is_bulk_deletion(origin):
+        return
+
+    # The video count was already decreased when the slot was vacated
+    Playlist.objects.update_video_fields([instance.playlist_id])
+
+
+@receiver(post_save, sender=Video)
+def refresh_playlist_thumbnails(sender, instance: Video, created: bool, **kwargs):
+    if created:
+        return
+
+    Playlist.objects.update_video_fields(
+        PlaylistVideo.objects.filter(video=instance).values('playlist')
+    )
@@ -43,6 +43,16 @@ urlpatterns = [
         views.SaveVideoToPlaylistView.as_view(),
         name='save_video_to_playlist'
     ),
+    path(
+        '<int:playlist_id>/save-videos/',
+        views.SaveVideosToPlaylistView.as_view(),
+        name='save_videos_to_playlist'
+    ),
+    path(
+        '<int:playlist_id>/remove-videos/',
+        views.RemoveVideosFromPlaylistView.as_view(),
+        name='remove_videos_from_playlist'
+    ),
     path(
         '<int:playlist_id>/edit/',
         views.EditPlaylistView.as_view(),
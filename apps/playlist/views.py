@@ -1,5 +1,4 @@
-from django.db.models import Count, F
-
+from django.db import IntegrityError, transaction
 from django.http import HttpResponse
 from django.utils import timezone
 
@@ -8,7 +7,8 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly
 
-from drf_spectacular.utils import extend_schema, inline_serializer, OpenApiResponse
+from drf_spectacular.utils import extend_schema, inline_serializer, OpenApiResponse, OpenApiParameter
+from drf_spectacular.types import OpenApiTypes
 
 from apps.playlist.models import Playlist, PlaylistVideo
 from apps.video.models import Video
@@ -17,6 +17,8 @@ from apps.channel.models import Channel
 from apps.playlist import serializers
 from apps.playlist.choices import Visibility
 
+from youtube_clone.pagination import KeysetPagination, ShufflePagination
+
 
 class RetrieveOwnPlaylistsToSaveVideo(APIView):
     permission_classes = [IsAuthenticated]
@@ -47,17 +49,18 @@ class RetrieveOwnPlaylistsToSaveVideo(APIView):
                 'message': 'The video does not exist'
             }, status=status.HTTP_404_NOT_FOUND)
 
-        created_playlists = Playlist.objects.filter(channel=request.user.current_channel)
+        created_playlists = Playlist.objects.with_video_saved(video.pk)\
+            .filter(channel_id=request.user.current_channel_id)
+
+        paginator = KeysetPagination()
+        created_playlists_page = paginator.paginate_queryset(created_playlists, request, view=self)
 
         serialized_created_playlists = serializers.PlaylistToSaveVideoSerializer(
-            created_playlists,
-            many=True,
-            context={'video_id': video.pk}
+            created_playlists_page,
+            many=True
         )
 
-        return Response({
-            'data': serialized_created_playlists.data
-        }, status=status.HTTP_200_OK)
+        return paginator.get_paginated_response(serialized_created_playlists.data)
 
 
 class RetrievePlaylistDetailsView(APIView):
@@ -92,7 +95,7 @@ class RetrievePlaylistDetailsView(APIView):
     )
     def get(self, request, playlist_id, format=None):
         try:
-            playlist = Playlist.objects.get(id=playlist_id)
+            playlist = Playlist.objects.select_related('channel').get(id=playlist_id)
         except Playlist.DoesNotExist:
             return Response({
                 'message': 'The playlist does not exist'
@@ -141,7 +144,7 @@ class RetrieveSimplePlaylistView(APIView):
     )
     def get(self, request, playlist_id, format=None):
         try:
-            playlist = Playlist.objects.get(id=playlist_id)
+            playlist = Playlist.objects.select_related('channel').get(id=playlist_id)
         except Playlist.DoesNotExist:
             return Response({
                 'message': 'The playlist does not exist'
@@ -163,7 +166,16 @@ class RetrieveVideosFromAPlaylistView(APIView):
 
     @extend_schema(
         summary='Retrieve playlist videos',
-        description='Get the videos from a playlist',
+        description='Get the videos from a playlist. With the seed parameter the videos are shuffled, the same seed always returns the same order and the positions are the ones of the shuffled order',
+        parameters=[
+            OpenApiParameter(
+                'seed',
+                type=OpenApiTypes.STR,
+                required=False,
+                location=OpenApiParameter.QUERY,
+                description='Seed of the shuffled order of the videos'
+            )
+        ],
         responses={
             200: OpenApiResponse(
                 description='Videos from a playlist',
@@ -203,16 +215,36 @@ class RetrieveVideosFromAPlaylistView(APIView):
                     'message': 'You are not authorized to view this playlist'
                 }, status=status.HTTP_401_UNAUTHORIZED)
 
-        playlist_videos = PlaylistVideo.objects.filter(playlist=playlist)
+        shuffle_paginator = ShufflePagination()
+
+        if shuffle_paginator.get_seed(request) is not None:
+            playlist_videos_page = shuffle_paginator.paginate_positions(
+                playlist.video_count,
+                lambda slots: PlaylistVideo.objects.at_slots(playlist.pk, slots),
+                request,
+                view=self
+            )
+            PlaylistVideo.objects.number_positions(playlist_videos_page, shuffle_paginator.offset)
+
+            serialized_playlist_videos = serializers.PlaylistVideoListSerializer(
+                playlist_videos_page,
+                many=True
+            )
+
+            return shuffle_paginator.get_paginated_response(serialized_playlist_videos.data)
+
+        playlist_videos = PlaylistVideo.objects.select_related('video__channel').filter(playlist=playlist)
+
+        paginator = KeysetPagination()
+        playlist_videos_page = paginator.paginate_queryset(playlist_videos, request, view=self)
+        PlaylistVideo.objects.number_positions(playlist_videos_page)
 
         serialized_playlist_videos = serializers.PlaylistVideoListSerializer(
-            playlist_videos,
+            playlist_videos_page,
             many=True
         )
 
-        return Response({
-            'data': serialized_playlist_videos.data
-        }, status=status.HTTP_200_OK)
+        return paginator.get_paginated_response(serialized_playlist_videos.data)
 
 
 class RetrieveChannelPlaylistsView(APIView):
@@ -248,27 +280,19 @@ class RetrieveChannelPlaylistsView(APIView):
         channel_playlists = Playlist.objects.filter(channel=channel)
 
         if request.user.is_authenticated and request.user.current_channel == channel:
-            channel_playlists = channel_playlists.filter(
-                playlistvideo__isnull=False
-            ).annotate(
-                video_count=Count('playlistvideo')
-            )
-
             channel_playlists = channel_playlists.filter(video_count__gte=1)
         else:
-            channel_playlists = Playlist.objects.filter(
-                channel=channel,
-                visibility=Visibility.PUBLIC
-            )
+            channel_playlists = channel_playlists.filter(visibility=Visibility.PUBLIC)
+
+        paginator = KeysetPagination()
+        channel_playlists_page = paginator.paginate_queryset(channel_playlists, request, view=self)
 
         serialized_channel_playlists = serializers.PlaylistListSerializer(
-            channel_playlists,
+            channel_playlists_page,
             many=True
         )
 
-        return Response({
-            'data': serialized_channel_playlists.data
-        }, status=status.HTTP_200_OK)
+        return paginator.get_paginated_response(serialized_channel_playlists.data)
 
 
 class RetrieveOwnPlaylistsView(APIView):
@@ -284,14 +308,15 @@ class RetrieveOwnPlaylistsView(APIView):
     def get(self, request, format=None):
         own_playlists = Playlist.objects.filter(channel=request.user.current_channel)
 
+        paginator = KeysetPagination()
+        own_playlists_page = paginator.paginate_queryset(own_playlists, request, view=self)
+
         serialized_own_playlists = serializers.PlaylistListSimpleSerializer(
-            own_playlists,
+            own_playlists_page,
             many=True
         )
 
-        return Response({
-            'data': serialized_own_playlists.data
-        }, status=status.HTTP_200_OK)
+        return paginator.get_paginated_response(serialized_own_playlists.data)
 
 
 class CreatePlaylistView(APIView):
@@ -431,11 +456,10 @@ class SaveVideoToPlaylistView(APIView):
                 'message': 'The video is already in the playlist'
             }, status=status.HTTP_400_BAD_REQUEST)
 
-        new_playlist_video = PlaylistVideo.objects.create(
+        PlaylistVideo.objects.create(
             video=video,
             playlist=playlist
         )
-        new_playlist_video.save()
 
         playlist.updated_at = timezone.now()
         playlist.save()
@@ -445,6 +469,196 @@ class SaveVideoToPlaylistView(APIView):
         }, status=status.HTTP_201_CREATED)
 
 
+class SaveVideosToPlaylistView(APIView):
+    permission_classes = [IsAuthenticated]
+    serializer_class = serializers.PlaylistVideoIdsSerializer
+
+    @extend_schema(
+        summary='Save videos to playlist',
+        description='Save several videos to a playlist at once, in the given order. The videos that are already in the playlist are skipped',
+        request=serializers.PlaylistVideoIdsSerializer,
+        responses={
+            201: OpenApiResponse(
+                description='Videos saved successfully',
+                response={
+                    'type': 'object',
+                    'properties': {
+                        'message': {'type': 'string'},
+                        'added': {'type': 'integer'}
+                    }
+                }
+            ),
+            404: OpenApiResponse(
+                description='Playlist or some of the videos do not exist',
+                response={
+                    'type': 'object',
+                    'properties': {
+                        'message': {'type': 'string'}
+                    }
+                }
+            ),
+            401: OpenApiResponse(
+                description='The playlist is not yours',
+                response={
+                    'type': 'object',
+                    'properties': {
+                        'message': {'type': 'string'}
+                    }
+                }
+            ),
+            400: OpenApiResponse(
+                description='The video IDs are invalid',
+                response={
+                    'type': 'object',
+                    'properties': {
+                        'errors': {
+                            'type': 'object',
+                            'properties': {
+                                'video_ids': {'type': 'array', 'items': {'type': 'string'}}
+                            }
+                        }
+                    }
+                }
+            ),
+        }
+    )
+    def post(self, request, playlist_id, format=None):
+        try:
+            playlist = Playlist.objects.get(id=playlist_id)
+        except Playlist.DoesNotExist:
+            return Response({
+                'message': 'The playlist does not exist'
+            }, status=status.HTTP_404_NOT_FOUND)
+
+        if playlist.channel_id != request.user.current_channel_id:
+            return Response({
+                'message': 'You are not a owner of this playlist'
+            }, status=status.HTTP_401_UNAUTHORIZED)
+
+        playlist_video_ids = serializers.PlaylistVideoIdsSerializer(data=request.data)
+
+        if not playlist_video_ids.is_valid():
+            return Response({
+                'errors': playlist_video_ids.errors
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        video_ids = set(playlist_video_ids.validated_data['video_ids'])
+
+        try:
+            with transaction.atomic():
+                if Video.objects.filter(pk__in=video_ids).count() != len(video_ids):
+                    return Response({
+                        'message': 'Some of the videos do not exist'
+                    }, status=status.HTTP_404_NOT_FOUND)
+
+                new_playlist_videos = PlaylistVideo.objects.bulk_add(
+                    playlist,
+                    playlist_video_ids.validated_data['video_ids']
+                )
+
+                playlist.updated_at = timezone.now()
+                playlist.save()
+        except IntegrityError:
+            # A video was deleted after the check, which the foreign key
+            # rejects when the transaction commits
+            return Response({
+                'message': 'Some of the videos do not exist'
+            }, status=status.HTTP_404_NOT_FOUND)
+
+        return Response({
+            'message': f'Added to {playlist.name}',
+            'added': len(new_playlist_videos)
+        }, status=status.HTTP_201_CREATED)
+
+
+class RemoveVideosFromPlaylistView(APIView):
+    permission_classes = [IsAuthenticated]
+    serializer_class = serializers.PlaylistVideoIdsSerializer
+
+    @extend_schema(
+        summary='Remove videos from playlist',
+        description='Remove several videos from a playlist at once. The videos that are not in the playlist are ignored',
+        request=serializers.PlaylistVideoIdsSerializer,
+        responses={
+            200: OpenApiResponse(
+                description='Videos removed successfully',
+                response={
+                    'type': 'object',
+                    'properties': {
+                        'message': {'type': 'string'},
+                        'removed': {'type': 'integer'}
+                    }
+                }
+            ),
+            404: OpenApiResponse(
+                description='Playlist does not exist',
+                response={
+                    'type': 'object',
+                    'properties': {
+                        'message': {'type': 'string'}
+                    }
+                }
+            ),
+            401: OpenApiResponse(
+                description='Playlist is not yours',
+                response={
+                    'type': 'object',
+                    'properties': {
+                        'message': {'type': 'string'}
+                    }
+                }
+            ),
+            400: OpenApiResponse(
+                description='The video IDs are invalid',
+                response={
+                    'type': 'object',
+                    'properties': {
+                        'errors': {
+                            'type': 'object',
+                            'properties': {
+                                'video_ids': {'type': 'array', 'items': {'type': 'string'}}
+                            }
+                        }
+                    }
+                }
+            ),
+        }
+    )
+    def post(self, request, playlist_id, format=None):
+        try:
+            playlist = Playlist.objects.get(id=playlist_id)
+        except Playlist.DoesNotExist:
+            return Response({
+                'message': 'The playlist does not exist'
+            }, status=status.HTTP_404_NOT_FOUND)
+
+        if playlist.channel_id != request.user.current_channel_id:
+            return Response({
+                'message': "You can't remove a video from a playlist that you don't own"
+            }, status=status.HTTP_401_UNAUTHORIZED)
+
+        playlist_video_ids = serializers.PlaylistVideoIdsSerializer(data=request.data)
+
+        if not playlist_video_ids.is_valid():
+            return Response({
+                'errors': playlist_video_ids.errors
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        with transaction.atomic():
+            removed_playlist_videos = PlaylistVideo.objects.bulk_remove(
+                playlist,
+                playlist_video_ids.validated_data['video_ids']
+            )
+
+            playlist.updated_at = timezone.now()
+            playlist.save()
+
+        return Response({
+            'message': f'Removed from {playlist.name}',
+            'removed': removed_playlist_videos
+        }, status=status.HTTP_200_OK)
+
+
 class RepositionPlaylistVideoView(APIView):
     permission_classes = [IsAuthenticated]
 
@@ -524,44 +738,19 @@ class RepositionPlaylistVideoView(APIView):
                 'message': 'The new position must not be the same as the playlist video position'
             }, status=status.HTTP_400_BAD_REQUEST)
 
-        try:
-            playlist_video_to_update: PlaylistVideo = PlaylistVideo.objects.get(
-                playlist=playlist,
-                position=new_playlist_video_position
-            )
-        except PlaylistVideo.DoesNotExist:
+        total_playlist_videos = PlaylistVideo.objects.filter(playlist=playlist).count()
+
+        if not 0 <= new_playlist_video_position < total_playlist_videos:
             return Response({
                 'message': 'The new position does not exist'
             }, status=status.HTTP_404_NOT_FOUND)
 
-        playlist_videos_rearrange = PlaylistVideo.objects.filter(
-            playlist=playlist
-        ).exclude(pk=playlist_video.pk)
-
-        if abs(playlist_video.position - new_playlist_video_position) == 1:
-            playlist_video_to_update.position = playlist_video.position
-            playlist_video_to_update.save()
-        elif playlist_video.position > new_playlist_video_position:
-            playlist_videos_rearrange = playlist_videos_rearrange.filter(
-                position__range=(new_playlist_video_position, playlist_video.position)
-            )
-            playlist_videos_rearrange.update(position=F('position') + 1)
-        else:
-            playlist_videos_rearrange = playlist_videos_rearrange.filter(
-                position__range=(playlist_video.position, new_playlist_video_position)
-            )
-            playlist_videos_rearrange.update(position=F('position') - 1)
-
         old_playlist_video_position = playlist_video.position
 
-        playlist_video.position = new_playlist_video_position
-        playlist_video.save()
+        PlaylistVideo.objects.move(playlist_video, new_playlist_video_position)
 
         if playlist.video_thumbnail is None and (old_playlist_video_position == 0 or new_playlist_video_position == 0):
-            playlist.video_thumbnail = PlaylistVideo.objects.get(
-                playlist=playlist,
-                position=0
-            )
+            playlist.video_thumbnail = PlaylistVideo.objects.filter(playlist=playlist).first()
             playlist.save()
 
         return HttpResponse(status=status.HTTP_204_NO_CONTENT)
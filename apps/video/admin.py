@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from apps.video.models import Video, VideoView, LikedVideo
+from apps.video.models import Video, VideoView, LikedVideo, TrendingScore
 
 class VideoAdmin(admin.ModelAdmin):
     list_display = ['id', 'title', 'channel', 'video_url', 'publication_date']
@@ -15,6 +15,11 @@ class LikedVideoAdmin(admin.ModelAdmin):
     list_display = ['channel', 'video', 'liked']
     ordering = ['channel']
 
+class TrendingScoreAdmin(admin.ModelAdmin):
+    list_display = ['video', 'score', 'refreshed_at']
+    ordering = ['-score']
+
 admin.site.register(Video, VideoAdmin)
 admin.site.register(VideoView, VideoViewAdmin)
 admin.site.register(LikedVideo, LikedVideoAdmin)
+admin.site.register(TrendingScore, TrendingScoreAdmin)
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class VideoConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.video'
+
+    def ready(self):
+        from apps.video import signals
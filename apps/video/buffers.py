@@ -0,0 +1,77 @@
+import atexit
+import logging
+import threading
+import time
+from typing import Optional
+
+from django.conf import settings
+from django.db import connections
+from django.utils import timezone
+
+from apps.video.models import VideoView
+
+logger = logging.getLogger(__name__)
+
+
+# Flushed when full, after the flush interval or at exit
+class VideoViewBuffer:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.views = {}
+        self.size = 0
+        self.oldest_view_time = None
+        self.flush_timer = None
+
+    def add(self, video_id: int, channel_id: Optional[int] = None):
+        buffer_settings = settings.VIDEO_VIEW_BUFFER
+        now = timezone.now()
+
+        with self.lock:
+            count, _ = self.views.get((video_id, channel_id), (0, now))
+            self.views[(video_id, channel_id)] = (count + 1, now)
+            self.size += 1
+
+            if self.oldest_view_time is None:
+                self.oldest_view_time = time.monotonic()
+
+            flush_interval = buffer_settings['FLUSH_INTERVAL'].total_seconds()
+            should_flush = self.size >= buffer_settings['MAX_SIZE']\
+                or time.monotonic() - self.oldest_view_time >= flush_interval
+
+            if not should_flush and self.flush_timer is None:
+                self.flush_timer = threading.Timer(flush_interval, self.flush_on_timer)
+                self.flush_timer.daemon = True
+                self.flush_timer.start()
+
+        if should_flush:
+            self.flush()
+
+    def flush_on_timer(self):
+        try:
+            self.flush()
+        finally:
+            # The timer thread opened its own database connection
+            connections.close_all()
+
+    def flush(self):
+        with self.lock:
+            views, self.views = self.views, {}
+            self.size = 0
+            self.oldest_view_time = None
+
+            if self.flush_timer is not None:
+                self.flush_timer.cancel()
+                self.flush_timer = None
+
+        if not views:
+            return
+
+        try:
+            VideoView.objects.bulk_add(views)
+        except Exception:
+            logger.exception('Could not flush %s buffered video views', sum(count for count, _ in views.values()))
+
+
+video_view_buffer = VideoViewBuffer()
+
+atexit.register(video_view_buffer.flush)
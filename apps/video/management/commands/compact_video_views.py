@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from apps.video.models import VideoView
+
+
+class Command(BaseCommand):
+    help = 'Merge the anonymous view shards of every video into a single row'
+
+    def handle(self, *args, **options):
+        compacted_videos = VideoView.objects.compact_anonymous_views()
+
+        self.stdout.write(self.style.SUCCESS(f'Compacted the anonymous views of {compacted_videos} videos'))
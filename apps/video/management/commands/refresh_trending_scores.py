@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from apps.video.models import TrendingScore
+
+
+class Command(BaseCommand):
+    help = 'Decay the trending scores and add the engagement received since the last refresh'
+
+    def handle(self, *args, **options):
+        refreshed_videos = TrendingScore.objects.refresh()
+
+        self.stdout.write(self.style.SUCCESS(f'Refreshed the trending score of {refreshed_videos} videos'))
@@ -0,0 +1,63 @@
+# Generated by Django 4.2.2 on 2026-10-18 13:23
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+
+def populate_engagement_counters(apps, schema_editor):
+    Video = apps.get_model('video', 'Video')
+    VideoView = apps.get_model('video', 'VideoView')
+    LikedVideo = apps.get_model('video', 'LikedVideo')
+    Comment = apps.get_model('comment', 'Comment')
+
+    def counter_subquery(queryset, aggregate):
+        return Coalesce(
+            Subquery(
+                queryset.filter(video=OuterRef('pk'))
+                    .order_by()
+                    .values('video')
+                    .annotate(total=aggregate)
+                    .values('total')
+            ),
+            Value(0)
+        )
+
+    Video.objects.update(
+        view_count=counter_subquery(VideoView.objects.all(), Sum('count')),
+        like_count=counter_subquery(LikedVideo.objects.filter(liked=True), Count('pk')),
+        dislike_count=counter_subquery(LikedVideo.objects.filter(liked=False), Count('pk')),
+        comment_count=counter_subquery(Comment.objects.all(), Count('pk'))
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('video', '0008_alter_videoview_last_view_date'),
+        ('comment', '0004_alter_comment_options'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='video',
+            name='comment_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='video',
+            name='dislike_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='video',
+            name='like_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='video',
+            name='view_count',
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.RunPython(populate_engagement_counters, migrations.RunPython.noop),
+    ]
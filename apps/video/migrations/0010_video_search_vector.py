@@ -0,0 +1,48 @@
+# Generated by Django 4.2.2 on 2026-10-18 13:33
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+CREATE_SEARCH_VECTOR_TRIGGER = '''
+CREATE FUNCTION video_video_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('english', coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(NEW.description, '')), 'B');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER video_video_search_vector_trigger
+BEFORE INSERT OR UPDATE OF title, description, search_vector ON video_video
+FOR EACH ROW EXECUTE FUNCTION video_video_search_vector_update();
+
+UPDATE video_video SET title = title;
+'''
+
+DROP_SEARCH_VECTOR_TRIGGER = '''
+DROP TRIGGER IF EXISTS video_video_search_vector_trigger ON video_video;
+DROP FUNCTION IF EXISTS video_video_search_vector_update();
+'''
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('video', '0009_video_engagement_counters'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='video',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='video',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='video_search_vector_idx'),
+        ),
+        migrations.RunSQL(CREATE_SEARCH_VECTOR_TRIGGER, DROP_SEARCH_VECTOR_TRIGGER),
+    ]
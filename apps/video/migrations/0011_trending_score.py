@@ -0,0 +1,29 @@
+# Generated by Django 4.2.2 on 2026-10-18 13:45
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('video', '0010_video_search_vector'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TrendingScore',
+            fields=[
+                ('video', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='trending_score', serialize=False, to='video.video')),
+                ('score', models.FloatField(default=0)),
+                ('view_count', models.PositiveBigIntegerField(default=0)),
+                ('like_count', models.PositiveIntegerField(default=0)),
+                ('comment_count', models.PositiveIntegerField(default=0)),
+                ('refreshed_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['-score', '-video'], name='video_trending_score_idx')],
+            },
+        ),
+    ]
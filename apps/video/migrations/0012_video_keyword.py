@@ -0,0 +1,38 @@
+# Generated by Django 4.2.2 on 2026-10-18 13:49
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+POPULATE_VIDEO_KEYWORDS = '''
+INSERT INTO video_videokeyword (video_id, keyword, weight)
+SELECT video.id, lexeme.lexeme, 1 + ln((
+    SELECT sum(CASE lexeme_weight WHEN 'A' THEN 2 ELSE 1 END)
+    FROM unnest(lexeme.weights) AS lexeme_weight
+))
+FROM video_video AS video, unnest(video.search_vector) AS lexeme;
+'''
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('video', '0011_trending_score'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VideoKeyword',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('keyword', models.CharField(max_length=255)),
+                ('weight', models.FloatField()),
+                ('video', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='keywords', to='video.video')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='videokeyword',
+            constraint=models.UniqueConstraint(fields=('keyword', 'video'), include=('weight',), name='video_keyword_unique'),
+        ),
+        migrations.RunSQL(POPULATE_VIDEO_KEYWORDS, migrations.RunSQL.noop),
+    ]
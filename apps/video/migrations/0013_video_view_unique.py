@@ -0,0 +1,42 @@
+# Generated by Django 4.2.2 on 2026-10-18 13:52
+
+from django.db import migrations, models
+from django.db.models import Count, Max, Sum
+
+
+def merge_duplicated_video_views(apps, schema_editor):
+    VideoView = apps.get_model('video', 'VideoView')
+
+    duplicated_views = VideoView.objects\
+        .values('video', 'channel')\
+        .annotate(total=Count('pk'))\
+        .filter(total__gt=1)
+
+    for duplicated_view in duplicated_views:
+        video_views = VideoView.objects\
+            .filter(video=duplicated_view['video'], channel=duplicated_view['channel'])\
+            .order_by('pk')
+
+        merged_view = video_views.aggregate(count=Sum('count'), last_view_date=Max('last_view_date'))
+
+        video_views.filter(pk=video_views[0].pk).update(**merged_view)
+        video_views.exclude(pk=video_views[0].pk).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('video', '0012_video_keyword'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicated_video_views, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='videoview',
+            constraint=models.UniqueConstraint(condition=models.Q(('channel__isnull', False)), fields=('video', 'channel'), name='video_view_channel_unique'),
+        ),
+        migrations.AddConstraint(
+            model_name='videoview',
+            constraint=models.UniqueConstraint(condition=models.Q(('channel__isnull', True)), fields=('video',), name='video_view_anonymous_unique'),
+        ),
+    ]
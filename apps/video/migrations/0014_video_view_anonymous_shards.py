@@ -0,0 +1,26 @@
+# Generated by Django 4.2.2 on 2026-10-18 13:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('video', '0013_video_view_unique'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='videoview',
+            name='video_view_anonymous_unique',
+        ),
+        migrations.AddField(
+            model_name='videoview',
+            name='shard',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddConstraint(
+            model_name='videoview',
+            constraint=models.UniqueConstraint(condition=models.Q(('channel__isnull', True)), fields=('video', 'shard'), name='video_view_anonymous_shard_unique'),
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 4.2.2 on 2026-10-18 14:00
+
+from django.db import migrations, models
+from django.db.models import Count, Min, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def remove_duplicated_liked_videos(apps, schema_editor):
+    Video = apps.get_model('video', 'Video')
+    LikedVideo = apps.get_model('video', 'LikedVideo')
+
+    duplicated_likes = LikedVideo.objects\
+        .values('video', 'channel')\
+        .annotate(total=Count('pk'), first_like=Min('pk'))\
+        .filter(total__gt=1)
+
+    videos_ids = set()
+
+    for duplicated_like in duplicated_likes:
+        LikedVideo.objects\
+            .filter(video=duplicated_like['video'], channel=duplicated_like['channel'])\
+            .exclude(pk=duplicated_like['first_like'])\
+            .delete()
+
+        videos_ids.add(duplicated_like['video'])
+
+    def like_count_subquery(liked: bool):
+        return Coalesce(
+            Subquery(
+                LikedVideo.objects.filter(video=OuterRef('pk'), liked=liked)
+                    .order_by()
+                    .values('video')
+                    .annotate(total=Count('pk'))
+                    .values('total')
+            ),
+            Value(0)
+        )
+
+    Video.objects.filter(pk__in=videos_ids).update(
+        like_count=like_count_subquery(True),
+        dislike_count=like_count_subquery(False)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('video', '0014_video_view_anonymous_shards'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicated_liked_videos, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='likedvideo',
+            constraint=models.UniqueConstraint(fields=('video', 'channel'), name='liked_video_unique'),
+        ),
+    ]
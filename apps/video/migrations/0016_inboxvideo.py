@@ -0,0 +1,67 @@
+# Generated by Django 4.2.2 on 2026-10-18 15:17
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def populate_inbox_videos(apps, schema_editor):
+    # The subscribers get the latest videos of the channels under the fan-out
+    # limit, like a new subscription does
+    schema_editor.execute(
+        '''
+        INSERT INTO video_inboxvideo (subscriber_id, video_id, publication_date)
+        SELECT subscription.subscriber_id, latest_video.id, latest_video.publication_date
+        FROM channel_channelsubscription AS subscription
+        INNER JOIN channel_channel AS channel ON channel.id = subscription.subscribing_id
+        CROSS JOIN LATERAL (
+            SELECT id, publication_date FROM video_video
+            WHERE channel_id = channel.id
+            ORDER BY publication_date DESC, id DESC
+            LIMIT %s
+        ) AS latest_video
+        WHERE channel.subscriber_count < %s
+        ''',
+        [settings.SUBSCRIPTION_FEED['BACKFILL_SIZE'], settings.SUBSCRIPTION_FEED['FAN_OUT_LIMIT']]
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('channel', '0008_channel_video_count'),
+        ('video', '0015_likedvideo_unique'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InboxVideo',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('publication_date', models.DateTimeField()),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='video',
+            index=models.Index(fields=['channel', '-publication_date', '-id'], name='video_channel_date_idx'),
+        ),
+        migrations.AddField(
+            model_name='inboxvideo',
+            name='subscriber',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='inbox_videos', to='channel.channel'),
+        ),
+        migrations.AddField(
+            model_name='inboxvideo',
+            name='video',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='video.video'),
+        ),
+        migrations.AddIndex(
+            model_name='inboxvideo',
+            index=models.Index(fields=['subscriber', '-publication_date', '-video'], name='inbox_video_feed_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='inboxvideo',
+            constraint=models.UniqueConstraint(fields=('subscriber', 'video'), name='inbox_video_unique'),
+        ),
+        migrations.RunPython(populate_inbox_videos, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 4.2.2 on 2026-10-18 15:56
+
+from django.db import migrations, models
+
+
+# Flags the trending score of a video when its engagement counters change,
+# whichever path updates them, so the refresh only reads the flagged videos
+CREATE_ENGAGEMENT_TRIGGER = '''
+CREATE FUNCTION video_video_engagement_update() RETURNS trigger AS $$
+BEGIN
+    UPDATE video_trendingscore SET has_new_engagement = true
+    WHERE video_id = NEW.id AND NOT has_new_engagement;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER video_video_engagement_trigger
+AFTER UPDATE OF view_count, like_count, comment_count ON video_video
+FOR EACH ROW
+WHEN (
+    OLD.view_count IS DISTINCT FROM NEW.view_count
+    OR OLD.like_count IS DISTINCT FROM NEW.like_count
+    OR OLD.comment_count IS DISTINCT FROM NEW.comment_count
+)
+EXECUTE FUNCTION video_video_engagement_update();
+'''
+
+DROP_ENGAGEMENT_TRIGGER = '''
+DROP TRIGGER IF EXISTS video_video_engagement_trigger ON video_video;
+DROP FUNCTION IF EXISTS video_video_engagement_update();
+'''
+
+# The scores are created with the videos from now on, the videos created
+# before are added and every score is flagged for one full refresh
+POPULATE_TRENDING_SCORES = '''
+INSERT INTO video_trendingscore
+    (video_id, score, view_count, like_count, comment_count, refreshed_at, has_new_engagement)
+SELECT id, 0, 0, 0, 0, now(), true FROM video_video
+ON CONFLICT (video_id) DO NOTHING;
+
+UPDATE video_trendingscore SET has_new_engagement = true;
+'''
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('video', '0016_inboxvideo'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='trendingscore',
+            name='has_new_engagement',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddIndex(
+            model_name='trendingscore',
+            index=models.Index(condition=models.Q(('has_new_engagement', True)), fields=['video'], name='video_trending_engaged_idx'),
+        ),
+        migrations.RunSQL(CREATE_ENGAGEMENT_TRIGGER, DROP_ENGAGEMENT_TRIGGER),
+        migrations.RunSQL(POPULATE_TRENDING_SCORES, migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.2 on 2026-10-18 16:00
+
+from django.db import migrations, models
+
+
+# The empty keyword counts the indexed videos
+POPULATE_KEYWORD_FREQUENCIES = '''
+INSERT INTO video_keywordfrequency (keyword, video_count)
+SELECT keyword, count(*) FROM video_videokeyword GROUP BY keyword
+UNION ALL
+SELECT '', count(DISTINCT video_id) FROM video_videokeyword;
+'''
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('video', '0017_trending_score_has_new_engagement'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='KeywordFrequency',
+            fields=[
+                ('keyword', models.CharField(max_length=255, primary_key=True, serialize=False)),
+                ('video_count', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='videokeyword',
+            index=models.Index(fields=['keyword', '-weight'], include=('video',), name='video_keyword_weight_idx'),
+        ),
+        migrations.RunSQL(POPULATE_KEYWORD_FREQUENCIES, migrations.RunSQL.noop),
+    ]
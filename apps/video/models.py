@@ -1,10 +1,89 @@
-from django.db import models
+import math
+import random
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db import connection, models, transaction
+from django.db.models.expressions import RawSQL
 from django.utils import timezone
 
-from apps.channel.models import Channel
+from apps.channel.models import Channel, ChannelSubscription
+
+from youtube_clone.reactions import ReactionManager
+
+VIDEO_SEARCH_CONFIG = 'english'
+
+
+class VideoManager(models.Manager):
+    def add_views(self, video_id: int, count: int):
+        self.get_queryset().filter(pk=video_id).update(
+            view_count=models.F('view_count') + count
+        )
+
+        Channel.objects.filter(video__pk=video_id).update(
+            total_views=models.F('total_views') + count
+        )
+
+    def subscription_feed(self, channel_id: int, cursor: Optional[List[Any]], size: int) -> models.QuerySet:
+        # Inbox videos plus the videos of the channels that skipped the fan-out, merged on read
+        inbox_video_table = InboxVideo._meta.db_table
+        subscription_table = ChannelSubscription._meta.db_table
+        channel_table = Channel._meta.db_table
+        video_table = self.model._meta.db_table
+
+        fan_out_limit = settings.SUBSCRIPTION_FEED['FAN_OUT_LIMIT']
+        cursor_params = []
+        inbox_cursor = video_cursor = ''
+
+        if cursor is not None:
+            cursor_params = list(cursor)
+            inbox_cursor = 'AND (publication_date, video_id) < (%s, %s)'
+            video_cursor = 'AND (publication_date, id) < (%s, %s)'
+
+        feed_video_ids = RawSQL(
+            f'''
+            (
+                SELECT video_id FROM {inbox_video_table}
+                WHERE subscriber_id = %s {inbox_cursor}
+                ORDER BY publication_date DESC, video_id DESC
+                LIMIT %s
+            )
+            UNION
+            (
+                SELECT large_channel_video.id
+                FROM {subscription_table} AS subscription
+                INNER JOIN {channel_table} AS channel ON channel.id = subscription.subscribing_id
+                CROSS JOIN LATERAL (
+                    SELECT id, publication_date FROM {video_table}
+                    WHERE channel_id = channel.id {video_cursor}
+                    ORDER BY publication_date DESC, id DESC
+                    LIMIT %s
+                ) AS large_channel_video
+                WHERE subscription.subscriber_id = %s
+                    AND (channel.subscriber_count >= %s OR channel.fan_out_skipped)
+                ORDER BY large_channel_video.publication_date DESC, large_channel_video.id DESC
+                LIMIT %s
+            )
+            ''',
+            [
+                channel_id, *cursor_params, size,
+                *cursor_params, size, channel_id, fan_out_limit, size
+            ]
+        )
+
+        return self.get_queryset()\
+            .select_related('channel')\
+            .filter(pk__in=feed_video_ids)\
+            .order_by('-publication_date', '-pk')[:size]
 
 
 class Video(models.Model):
+    counter_fields = ('view_count', 'like_count', 'dislike_count', 'comment_count')
+
     title = models.CharField(max_length=45)
     video_url = models.URLField()
     thumbnail = models.URLField()
@@ -13,13 +92,159 @@ class Video(models.Model):
     publication_date = models.DateTimeField(auto_now_add=True, blank=True)
     views = models.ManyToManyField(Channel, through='VideoView', related_name='video_views')
     likes = models.ManyToManyField(Channel, through='LikedVideo', related_name='video_likes')
+    view_count = models.PositiveBigIntegerField(default=0)
+    like_count = models.PositiveIntegerField(default=0)
+    dislike_count = models.PositiveIntegerField(default=0)
+    comment_count = models.PositiveIntegerField(default=0)
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    objects = VideoManager()
 
     class Meta:
         ordering = ['title']
+        indexes = [
+            GinIndex(fields=['search_vector'], name='video_search_vector_idx'),
+            models.Index(fields=['channel', '-publication_date', '-id'], name='video_channel_date_idx'),
+        ]
 
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        # The counters are only written with F() updates, so saving an instance
+        # loaded before a like, view or comment does not revert them
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.counter_fields
+            ]
+
+        super().save(*args, **kwargs)
+
+
+class VideoViewManager(models.Manager):
+    def bulk_add(self, views: Dict[Tuple[int, Optional[int]], Tuple[int, datetime]]):
+        # Anonymous views are spread over random shard rows to avoid waiting on one row lock
+        views = [
+            (
+                video_id,
+                channel_id,
+                0 if channel_id is not None else random.randrange(settings.VIDEO_VIEW_ANONYMOUS_SHARDS),
+                count,
+                last_view_date
+            )
+            for (video_id, channel_id), (count, last_view_date) in views.items()
+        ]
+
+        channel_views = sorted(view for view in views if view[1] is not None)
+        anonymous_views = sorted(view for view in views if view[1] is None)
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            if channel_views:
+                self._upsert_views(cursor, channel_views, '(video_id, channel_id) WHERE channel_id IS NOT NULL')
+
+            if anonymous_views:
+                self._upsert_views(cursor, anonymous_views, '(video_id, shard) WHERE channel_id IS NULL')
+
+            video_views = {}
+
+            for video_id, _, _, count, _ in sorted(views, key=lambda view: view[0]):
+                video_views[video_id] = video_views.get(video_id, 0) + count
+
+            values = ', '.join(['(%s::bigint, %s::bigint)'] * len(video_views))
+            params = [param for video_view in video_views.items() for param in video_view]
+
+            cursor.execute(
+                f'''
+                UPDATE {Video._meta.db_table} AS video
+                SET view_count = video.view_count + views.count
+                FROM (VALUES {values}) AS views (video_id, count)
+                WHERE video.id = views.video_id
+                ''',
+                params
+            )
+
+            cursor.execute(
+                f'''
+                UPDATE {Channel._meta.db_table} AS channel
+                SET total_views = channel.total_views + channel_views.count
+                FROM (
+                    SELECT video.channel_id, sum(views.count) AS count
+                    FROM (VALUES {values}) AS views (video_id, count)
+                    JOIN {Video._meta.db_table} AS video ON video.id = views.video_id
+                    GROUP BY video.channel_id
+                ) AS channel_views
+                WHERE channel.id = channel_views.channel_id
+                ''',
+                params
+            )
+
+    def _upsert_views(self, cursor, views, conflict_target: str):
+        values = ', '.join(['(%s::bigint, %s::bigint, %s::smallint, %s::bigint, %s::timestamptz)'] * len(views))
+
+        cursor.execute(
+            f'''
+            INSERT INTO {self.model._meta.db_table} (video_id, channel_id, shard, count, last_view_date)
+            SELECT views.video_id, views.channel_id, views.shard, views.count, views.last_view_date
+            FROM (VALUES {values}) AS views (video_id, channel_id, shard, count, last_view_date)
+            WHERE EXISTS (SELECT 1 FROM {Video._meta.db_table} WHERE id = views.video_id)
+                AND (
+                    views.channel_id IS NULL
+                    OR EXISTS (SELECT 1 FROM {Channel._meta.db_table} WHERE id = views.channel_id)
+                )
+            ORDER BY views.video_id, views.channel_id, views.shard
+            ON CONFLICT {conflict_target} DO UPDATE SET
+                count = {self.model._meta.db_table}.count + EXCLUDED.count,
+                last_view_date = GREATEST({self.model._meta.db_table}.last_view_date, EXCLUDED.last_view_date)
+            ''',
+            [param for view in views for param in view]
+        )
+
+    def remove_channel_views(self, channel_id: int):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'''
+                WITH removed_views AS (
+                    UPDATE {Video._meta.db_table} AS video
+                    SET view_count = video.view_count - views.count
+                    FROM {self.model._meta.db_table} AS views
+                    WHERE views.channel_id = %s AND video.id = views.video_id
+                    RETURNING video.channel_id, views.count
+                )
+                UPDATE {Channel._meta.db_table} AS channel
+                SET total_views = channel.total_views - channel_views.count
+                FROM (
+                    SELECT channel_id, sum(count) AS count FROM removed_views GROUP BY channel_id
+                ) AS channel_views
+                WHERE channel.id = channel_views.channel_id
+                ''',
+                [channel_id]
+            )
+
+    def compact_anonymous_views(self) -> int:
+        table = self.model._meta.db_table
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'''
+                WITH compacted_views AS (
+                    DELETE FROM {table}
+                    WHERE channel_id IS NULL AND shard <> 0
+                    RETURNING video_id, count, last_view_date
+                )
+                INSERT INTO {table} (video_id, channel_id, shard, count, last_view_date)
+                SELECT video_id, NULL, 0, sum(count), max(last_view_date)
+                FROM compacted_views
+                GROUP BY video_id
+                ORDER BY video_id
+                ON CONFLICT (video_id, shard) WHERE channel_id IS NULL DO UPDATE SET
+                    count = {table}.count + EXCLUDED.count,
+                    last_view_date = GREATEST({table}.last_view_date, EXCLUDED.last_view_date)
+                '''
+            )
+
+            return cursor.rowcount
+
 
 class VideoView(models.Model):
     channel = models.ForeignKey(
@@ -31,18 +256,375 @@ class VideoView(models.Model):
     )
     video = models.ForeignKey(Video, on_delete=models.CASCADE)
     count = models.PositiveBigIntegerField(default=1)
+    shard = models.PositiveSmallIntegerField(default=0)
     last_view_date = models.DateTimeField(default=timezone.now, blank=True)
 
+    objects = VideoViewManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['video', 'channel'],
+                condition=models.Q(channel__isnull=False),
+                name='video_view_channel_unique'
+            ),
+            models.UniqueConstraint(
+                fields=['video', 'shard'],
+                condition=models.Q(channel__isnull=True),
+                name='video_view_anonymous_shard_unique'
+            ),
+        ]
+
     def __str__(self):
         if self.channel is not None:
             return self.channel.name
         return self.video.title
 
 
+class LikedVideoManager(ReactionManager):
+    target_field = 'video'
+
+
 class LikedVideo(models.Model):
     channel = models.ForeignKey(Channel, on_delete=models.CASCADE)
     video = models.ForeignKey(Video, on_delete=models.CASCADE)
     liked = models.BooleanField(default=True, blank=True)
 
+    objects = LikedVideoManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['video', 'channel'], name='liked_video_unique'),
+        ]
+
     def __str__(self):
         return self.channel.name
+
+
+class VideoKeywordManager(models.Manager):
+    max_query_keywords = 10
+    # Videos read from the posting list of each keyword, the heaviest first
+    max_keyword_candidates = 200
+
+    def index_video(self, video_id: int):
+        # A keyword found in the title weighs twice as much as one in the description
+        with transaction.atomic(), connection.cursor() as cursor:
+            removed_keywords = self._delete_video_keywords(cursor, video_id)
+
+            cursor.execute(
+                f'''
+                INSERT INTO {self.model._meta.db_table} (video_id, keyword, weight)
+                SELECT video.id, lexeme.lexeme, 1 + ln((
+                    SELECT sum(CASE lexeme_weight WHEN 'A' THEN 2 ELSE 1 END)
+                    FROM unnest(lexeme.weights) AS lexeme_weight
+                ))
+                FROM {Video._meta.db_table} AS video, unnest(video.search_vector) AS lexeme
+                WHERE video.id = %(video_id)s
+                RETURNING keyword
+                ''',
+                {'video_id': video_id}
+            )
+
+            added_keywords = [keyword for keyword, in cursor.fetchall()]
+
+            KeywordFrequency.objects.add(cursor, removed_keywords, added_keywords)
+
+    def unindex_video(self, video_id: int):
+        with transaction.atomic(), connection.cursor() as cursor:
+            removed_keywords = self._delete_video_keywords(cursor, video_id)
+
+            KeywordFrequency.objects.add(cursor, removed_keywords, [])
+
+    def _delete_video_keywords(self, cursor, video_id: int) -> List[str]:
+        cursor.execute(
+            f'DELETE FROM {self.model._meta.db_table} WHERE video_id = %(video_id)s RETURNING keyword',
+            {'video_id': video_id}
+        )
+
+        return [keyword for keyword, in cursor.fetchall()]
+
+    def suggestions(self, video: Video) -> models.QuerySet:
+        # Scored by TF-IDF over the top keywords of the video and the heaviest postings of each
+        document_frequencies = KeywordFrequency.objects.filter(keyword=models.OuterRef('keyword'))
+
+        video_keywords = self.get_queryset()\
+            .filter(video=video)\
+            .annotate(
+                document_frequency=models.Subquery(document_frequencies.values('video_count')),
+                total_videos=models.Subquery(
+                    KeywordFrequency.objects.filter(keyword=KeywordFrequency.ALL_VIDEOS).values('video_count')
+                )
+            )
+
+        weighted_keywords = {}
+
+        for video_keyword in video_keywords:
+            total_videos = video_keyword.total_videos or 0
+            document_frequency = video_keyword.document_frequency or 0
+
+            inverse_document_frequency = 1 + math.log((1 + total_videos) / (1 + document_frequency))
+            weighted_keywords[video_keyword.keyword] = video_keyword.weight * inverse_document_frequency ** 2
+
+        weighted_keywords = dict(
+            sorted(weighted_keywords.items(), key=lambda item: item[1], reverse=True)[:self.max_query_keywords]
+        )
+
+        if not weighted_keywords:
+            return Video.objects.none()
+
+        candidate_video_ids = RawSQL(
+            f'''
+            SELECT candidate.video_id
+            FROM unnest(%s::varchar[]) AS query_keyword(keyword)
+            CROSS JOIN LATERAL (
+                SELECT video_id FROM {self.model._meta.db_table}
+                WHERE keyword = query_keyword.keyword
+                ORDER BY weight DESC
+                LIMIT %s
+            ) AS candidate
+            ''',
+            [list(weighted_keywords.keys()), self.max_keyword_candidates]
+        )
+
+        keyword_weight = models.Case(
+            *[
+                models.When(keywords__keyword=keyword, then=models.Value(weight))
+                for keyword, weight in weighted_keywords.items()
+            ],
+            default=models.Value(0.0),
+            output_field=models.FloatField()
+        )
+
+        return Video.objects\
+            .filter(pk__in=candidate_video_ids, keywords__keyword__in=weighted_keywords.keys())\
+            .exclude(pk=video.pk)\
+            .annotate(similarity=models.Sum(models.F('keywords__weight') * keyword_weight))\
+            .order_by('-similarity')
+
+
+class VideoKeyword(models.Model):
+    video = models.ForeignKey(Video, on_delete=models.CASCADE, related_name='keywords')
+    keyword = models.CharField(max_length=255)
+    weight = models.FloatField()
+
+    objects = VideoKeywordManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['keyword', 'video'], include=['weight'], name='video_keyword_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['keyword', '-weight'], include=['video'], name='video_keyword_weight_idx'),
+        ]
+
+    def __str__(self):
+        return self.keyword
+
+
+class KeywordFrequencyManager(models.Manager):
+    def add(self, cursor, removed_keywords: List[str], added_keywords: List[str]):
+        changes = Counter(added_keywords)
+        changes.subtract(removed_keywords)
+        changes[self.model.ALL_VIDEOS] += bool(added_keywords) - bool(removed_keywords)
+
+        # Sorted, so concurrent indexings lock the keywords in the same order
+        changes = sorted((keyword, change) for keyword, change in changes.items() if change != 0)
+        added_changes = [(keyword, change) for keyword, change in changes if change > 0]
+        removed_changes = [(keyword, change) for keyword, change in changes if change < 0]
+
+        keyword_frequency_table = self.model._meta.db_table
+
+        # The check of the count runs before the conflict, so only the
+        # additions can insert the keywords they are the first to count
+        if added_changes:
+            cursor.execute(
+                f'''
+                INSERT INTO {keyword_frequency_table} (keyword, video_count)
+                SELECT * FROM unnest(%s::varchar[], %s::integer[])
+                ON CONFLICT (keyword) DO UPDATE
+                SET video_count = {keyword_frequency_table}.video_count + EXCLUDED.video_count
+                ''',
+                [[keyword for keyword, _ in added_changes], [change for _, change in added_changes]]
+            )
+
+        if removed_changes:
+            cursor.execute(
+                f'''
+                UPDATE {keyword_frequency_table} AS keyword_frequency
+                SET video_count = keyword_frequency.video_count + change.video_count
+                FROM unnest(%s::varchar[], %s::integer[]) AS change(keyword, video_count)
+                WHERE keyword_frequency.keyword = change.keyword
+                ''',
+                [[keyword for keyword, _ in removed_changes], [change for _, change in removed_changes]]
+            )
+
+
+class KeywordFrequency(models.Model):
+    # No lexeme is empty, so the empty keyword counts every indexed video
+    ALL_VIDEOS = ''
+
+    keyword = models.CharField(max_length=255, primary_key=True)
+    video_count = models.PositiveIntegerField(default=0)
+
+    objects = KeywordFrequencyManager()
+
+    def __str__(self):
+        return self.keyword
+
+
+class TrendingScoreManager(models.Manager):
+    def refresh(self, now=None):
+        # Decays the scores and only reads the trending or flagged videos
+        trending_settings = settings.TRENDING_SCORE
+        now = now or timezone.now()
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'''
+                UPDATE {self.model._meta.db_table} AS trending SET
+                    score = GREATEST(
+                        trending.score * power(
+                            0.5,
+                            extract(epoch FROM %(now)s - trending.refreshed_at) / %(half_life)s
+                        )
+                        + %(view_weight)s * (video.view_count - trending.view_count)
+                        + %(like_weight)s * (video.like_count - trending.like_count)
+                        + %(comment_weight)s * (video.comment_count - trending.comment_count),
+                        0
+                    ),
+                    view_count = video.view_count,
+                    like_count = video.like_count,
+                    comment_count = video.comment_count,
+                    refreshed_at = %(now)s,
+                    has_new_engagement = false
+                FROM {Video._meta.db_table} AS video
+                WHERE video.id = trending.video_id AND (
+                    trending.has_new_engagement OR trending.score > %(min_score)s
+                )
+                ''',
+                {
+                    'now': now,
+                    'half_life': trending_settings['HALF_LIFE'].total_seconds(),
+                    'view_weight': trending_settings['VIEW_WEIGHT'],
+                    'like_weight': trending_settings['LIKE_WEIGHT'],
+                    'comment_weight': trending_settings['COMMENT_WEIGHT'],
+                    'min_score': trending_settings['MIN_SCORE']
+                }
+            )
+
+            return cursor.rowcount
+
+
+class TrendingScore(models.Model):
+    video = models.OneToOneField(
+        Video,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='trending_score'
+    )
+    score = models.FloatField(default=0)
+    view_count = models.PositiveBigIntegerField(default=0)
+    like_count = models.PositiveIntegerField(default=0)
+    comment_count = models.PositiveIntegerField(default=0)
+    refreshed_at = models.DateTimeField(default=timezone.now)
+    # Set by a trigger on the engagement counters of the video
+    has_new_engagement = models.BooleanField(default=False)
+
+    objects = TrendingScoreManager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-score', '-video'], name='video_trending_score_idx'),
+            models.Index(
+                fields=['video'],
+                condition=models.Q(has_new_engagement=True),
+                name='video_trending_engaged_idx'
+            ),
+        ]
+
+    def __str__(self):
+        return self.video.title
+
+
+# Fan-out on write, except for the channels with at least FAN_OUT_LIMIT subscribers
+class InboxVideoManager(models.Manager):
+    def fan_out(self, video: Video) -> int:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'''
+                WITH skipped_channel AS (
+                    UPDATE {Channel._meta.db_table} SET fan_out_skipped = true
+                    WHERE id = %(channel_id)s
+                        AND subscriber_count >= %(fan_out_limit)s
+                        AND NOT fan_out_skipped
+                )
+                INSERT INTO {self.model._meta.db_table} (subscriber_id, video_id, publication_date)
+                SELECT subscription.subscriber_id, %(video_id)s, %(publication_date)s
+                FROM {ChannelSubscription._meta.db_table} AS subscription
+                INNER JOIN {Channel._meta.db_table} AS channel ON channel.id = subscription.subscribing_id
+                WHERE subscription.subscribing_id = %(channel_id)s
+                    AND channel.subscriber_count < %(fan_out_limit)s
+                ON CONFLICT (subscriber_id, video_id) DO NOTHING
+                ''',
+                {
+                    'video_id': video.pk,
+                    'publication_date': video.publication_date,
+                    'channel_id': video.channel_id,
+                    'fan_out_limit': settings.SUBSCRIPTION_FEED['FAN_OUT_LIMIT']
+                }
+            )
+
+            return cursor.rowcount
+
+    def add_channel(self, subscriber_id: int, channel_id: int) -> int:
+        feed_settings = settings.SUBSCRIPTION_FEED
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'''
+                INSERT INTO {self.model._meta.db_table} (subscriber_id, video_id, publication_date)
+                SELECT %(subscriber_id)s, video.id, video.publication_date
+                FROM {Video._meta.db_table} AS video
+                INNER JOIN {Channel._meta.db_table} AS channel ON channel.id = video.channel_id
+                WHERE video.channel_id = %(channel_id)s
+                    AND channel.subscriber_count < %(fan_out_limit)s
+                ORDER BY video.publication_date DESC, video.id DESC
+                LIMIT %(backfill_size)s
+                ON CONFLICT (subscriber_id, video_id) DO NOTHING
+                ''',
+                {
+                    'subscriber_id': subscriber_id,
+                    'channel_id': channel_id,
+                    'fan_out_limit': feed_settings['FAN_OUT_LIMIT'],
+                    'backfill_size': feed_settings['BACKFILL_SIZE']
+                }
+            )
+
+            return cursor.rowcount
+
+    def remove_channel(self, subscriber_id: int, channel_id: int) -> int:
+        removed_videos, _ = self.get_queryset().filter(
+            subscriber_id=subscriber_id,
+            video__channel_id=channel_id
+        ).delete()
+
+        return removed_videos
+
+
+class InboxVideo(models.Model):
+    subscriber = models.ForeignKey(Channel, on_delete=models.CASCADE, related_name='inbox_videos')
+    video = models.ForeignKey(Video, on_delete=models.CASCADE, related_name='+')
+    publication_date = models.DateTimeField()
+
+    objects = InboxVideoManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['subscriber', 'video'], name='inbox_video_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['subscriber', '-publication_date', '-video'], name='inbox_video_feed_idx'),
+        ]
+
+    def __str__(self):
+        return self.video.title
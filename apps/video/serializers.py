@@ -1,17 +1,32 @@
+from django.db import models
+
 from rest_framework import serializers
 
-from apps.video.models import Video, VideoView, LikedVideo
-from apps.comment.models import Comment
+from apps.video.models import Video, LikedVideo
 from apps.channel.models import ChannelSubscription
 
 from apps.channel.serializers import ChannelSimpleRepresentationSerializer, ChannelListSerializer
 
 
+class VideoBatchListSerializer(serializers.ListSerializer):
+    related_fields = ('channel',)
+
+    def to_representation(self, data):
+        if isinstance(data, (models.Manager, models.QuerySet)):
+            data = data.all().select_related(*self.related_fields)
+        else:
+            models.prefetch_related_objects(data, *self.related_fields)
+
+        return super().to_representation(data)
+
+
 class VideoListSimpleSerializer(serializers.ModelSerializer):
     channel = ChannelSimpleRepresentationSerializer(read_only=True)
+    views = serializers.IntegerField(source='view_count', read_only=True)
 
     class Meta:
         model = Video
+        list_serializer_class = VideoBatchListSerializer
         fields = (
             'id',
             'title',
@@ -21,22 +36,15 @@ class VideoListSimpleSerializer(serializers.ModelSerializer):
             'views',
         )
 
-    def to_representation(self, instance):
-        representation = super().to_representation(instance)
-
-        video_view_list = VideoView.objects.filter(video=instance).values_list('count', flat=True)
-        total_video_views = sum(video_view_list)
-
-        representation['views'] = total_video_views
-
-        return representation
-
 
 class VideoListSerializer(serializers.ModelSerializer):
     channel = ChannelSimpleRepresentationSerializer(read_only=True)
+    views = serializers.IntegerField(source='view_count', read_only=True)
+    likes = serializers.IntegerField(source='like_count', read_only=True)
 
     class Meta:
         model = Video
+        list_serializer_class = VideoBatchListSerializer
         fields = (
             'id',
             'title',
@@ -48,31 +56,16 @@ class VideoListSerializer(serializers.ModelSerializer):
             'likes',
         )
 
-    def to_representation(self, instance: Video):
-        representation = super().to_representation(instance)
-
-        video_view_list = VideoView.objects.filter(video=instance).values_list('count', flat=True)
-        total_video_views = sum(video_view_list)
-
-        representation['views'] = total_video_views
-        representation['likes'] = LikedVideo.objects.filter(video=instance, liked=True).count()
-
-        return representation
-
 
 class VideoDetailsSerializer(serializers.ModelSerializer):
     channel = ChannelListSerializer(read_only=True)
-    dislikes = serializers.SerializerMethodField('video_dislikes')
-    comments = serializers.SerializerMethodField('video_comments')
+    views = serializers.IntegerField(source='view_count', read_only=True)
+    likes = serializers.IntegerField(source='like_count', read_only=True)
+    dislikes = serializers.IntegerField(source='dislike_count', read_only=True)
+    comments = serializers.IntegerField(source='comment_count', read_only=True)
     liked = serializers.SerializerMethodField('video_liked')
     disliked = serializers.SerializerMethodField('video_disliked')
 
-    def video_dislikes(self, instance: Video) -> int:
-        return LikedVideo.objects.filter(video=instance, liked=False).count()
-
-    def video_comments(self, instance: Video) -> int:
-        return Comment.objects.filter(video=instance).count()
-
     def video_liked(self, instance: Video) -> bool:
         user = self.context['request'].user
 
@@ -117,21 +110,13 @@ class VideoDetailsSerializer(serializers.ModelSerializer):
     def to_representation(self, instance: Video):
         representation = super().to_representation(instance)
 
-        video_view_list = VideoView.objects.filter(video=instance).values_list('count', flat=True)
-        total_video_views = sum(video_view_list)
-
-        representation['views'] = total_video_views
-        representation['likes'] = LikedVideo.objects.filter(video=instance, liked=True).count()
-
         user = self.context.get('request').user
 
         representation['channel']['subscribed'] = False
 
         if user != None and user.is_authenticated:
-            representation['channel']['subscribed'] = ChannelSubscription.objects.filter(
-                subscriber=user.current_channel,
-                subscribing=instance.channel
-            ).exists()
+            representation['channel']['subscribed'] = instance.channel_id in ChannelSubscription.objects\
+                .subscribed_channel_ids(user)
 
         return representation
 
@@ -0,0 +1,143 @@
+from django.contrib.auth import get_user_model
+from django.db.models import F, OuterRef, QuerySet, Subquery, Value
+from django.db.models.functions import Greatest
+from django.db.models.signals import post_save, post_delete, pre_delete
+from django.dispatch import receiver
+
+from apps.channel.models import Channel, ChannelSubscription
+from apps.video.models import Video, VideoView, LikedVideo, VideoKeyword, InboxVideo, TrendingScore
+
+from youtube_clone.reactions import like_counter_field
+
+
+def get_origin_model(origin):
+    return origin.model if isinstance(origin, QuerySet) else type(origin)
+
+
+def deletes_channels(origin) -> bool:
+    return issubclass(get_origin_model(origin), (Channel, get_user_model()))
+
+
+def deletes_videos(origin) -> bool:
+    # The counters of the deleted videos go away with them and a deleted channel
+    # takes its activity out of the other videos at once
+    return issubclass(get_origin_model(origin), Video) or deletes_channels(origin)
+
+
+@receiver(post_save, sender=Video)
+def index_video_keywords(sender, instance: Video, **kwargs):
+    VideoKeyword.objects.index_video(instance.pk)
+
+
+@receiver(pre_delete, sender=Video)
+def unindex_video_keywords(sender, instance: Video, **kwargs):
+    VideoKeyword.objects.unindex_video(instance.pk)
+
+
+@receiver(post_save, sender=Video)
+def add_channel_upload(sender, instance: Video, created: bool, **kwargs):
+    if not created:
+        return
+
+    Channel.objects.filter(pk=instance.channel_id).update(
+        video_count=F('video_count') + 1,
+        # GREATEST skips the null date of a channel without videos
+        last_upload_date=Greatest('last_upload_date', Value(instance.publication_date))
+    )
+
+
+@receiver(post_save, sender=Video)
+def create_video_trending_score(sender, instance: Video, created: bool, **kwargs):
+    if not created:
+        return
+
+    TrendingScore.objects.create(video=instance)
+
+
+@receiver(post_save, sender=Video)
+def fan_out_video_to_subscriber_inboxes(sender, instance: Video, created: bool, **kwargs):
+    if not created:
+        return
+
+    InboxVideo.objects.fan_out(instance)
+
+
+@receiver(post_save, sender=ChannelSubscription)
+def add_channel_videos_to_subscriber_inbox(sender, instance: ChannelSubscription, created: bool, **kwargs):
+    if not created:
+        return
+
+    InboxVideo.objects.add_channel(instance.subscriber_id, instance.subscribing_id)
+
+
+@receiver(post_delete, sender=ChannelSubscription)
+def remove_channel_videos_from_subscriber_inbox(sender, instance: ChannelSubscription, **kwargs):
+    InboxVideo.objects.remove_channel(instance.subscriber_id, instance.subscribing_id)
+
+
+@receiver(post_delete, sender=Video)
+def remove_channel_upload(sender, instance: Video, **kwargs):
+    Channel.objects.filter(pk=instance.channel_id).update(
+        video_count=F('video_count') - 1,
+        last_upload_date=Subquery(
+            Video.objects.filter(channel=OuterRef('pk'))
+                .order_by('-publication_date')
+                .values('publication_date')[:1]
+        )
+    )
+
+
+@receiver(pre_delete, sender=Video)
+def remove_video_views_from_channel(sender, instance: Video, origin=None, **kwargs):
+    if deletes_channels(origin):
+        return
+
+    Channel.objects.filter(pk=instance.channel_id).update(
+        total_views=F('total_views') - Subquery(Video.objects.filter(pk=instance.pk).values('view_count'))
+    )
+
+
+@receiver(pre_delete, sender=Channel)
+def remove_channel_activity_from_videos(sender, instance: Channel, **kwargs):
+    VideoView.objects.remove_channel_views(instance.pk)
+    LikedVideo.objects.remove_channel_reactions(instance.pk)
+
+
+@receiver(post_save, sender=VideoView)
+def increase_video_view_count(sender, instance: VideoView, created: bool, **kwargs):
+    if not created:
+        return
+
+    Video.objects.add_views(instance.video_id, instance.count)
+
+
+@receiver(post_delete, sender=VideoView)
+def decrease_video_view_count(sender, instance: VideoView, origin=None, **kwargs):
+    if deletes_videos(origin):
+        return
+
+    Video.objects.add_views(instance.video_id, -instance.count)
+
+
+@receiver(post_save, sender=LikedVideo)
+def increase_video_like_count(sender, instance: LikedVideo, created: bool, **kwargs):
+    if not created:
+        return
+
+    counter_field = like_counter_field(instance.liked)
+
+    Video.objects.filter(pk=instance.video_id).update(
+        **{counter_field: F(counter_field) + 1}
+    )
+
+
+@receiver(post_delete, sender=LikedVideo)
+def decrease_video_like_count(sender, instance: LikedVideo, origin=None, **kwargs):
+    if deletes_videos(origin):
+        return
+
+    counter_field = like_counter_field(instance.liked)
+
+    Video.objects.filter(pk=instance.video_id).update(
+        **{counter_field: F(counter_field) - 1}
+    )
@@ -6,6 +6,7 @@ urlpatterns = [
     path('search/', views.SearchVideosView.as_view(), name='search_videos'),
     path('create/', views.CreateVideoView.as_view(), name='upload_video'),
     path('trending/', views.RetrieveTrendingVideosView.as_view(), name='trending_videos'),
+    path('subscriptions/', views.RetrieveSubscriptionFeedView.as_view(), name='subscription_feed'),
     path('channel/<int:channel_id>/', views.RetrieveChannelVideosView.as_view(), name='channel_videos'),
     path('<int:video_id>/', views.RetrieveVideoDetailsView.as_view(), name='video_details'),
     path('<int:video_id>/suggestions/', views.RetrieveSuggestionVideosView.as_view(), name='suggestion_videos'),
@@ -1,6 +1,8 @@
 from datetime import datetime
 
-from django.db.models import Q, Count, Sum, Case, When, IntegerField
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import F, FloatField
+from django.db.models.functions import Cast
 
 from rest_framework import status, generics
 from rest_framework.views import APIView
@@ -11,20 +13,22 @@ from rest_framework.parsers import FormParser, MultiPartParser
 from drf_spectacular.utils import extend_schema, inline_serializer, OpenApiResponse, OpenApiParameter
 from drf_spectacular.types import OpenApiTypes
 
-from apps.video.models import Video, LikedVideo, VideoView
+from apps.video.models import Video, LikedVideo, VideoView, VideoKeyword, VIDEO_SEARCH_CONFIG
 from apps.channel.models import Channel
 
 from apps.video import serializers
+from apps.video.buffers import video_view_buffer
 
 from youtube_clone.utils.storage import CloudinaryUploader
 
 from youtube_clone.enums import SearchSortOptions, SearchUploadDate, VideoSortOptions
+from youtube_clone.pagination import KeysetPagination
 
 
 class RetrieveTrendingVideosView(APIView):
     @extend_schema(
         summary='Retrieve trending videos',
-        description='Get all videos sorted by likes, views and comments sorted from highest to lowest',
+        description='Get the videos with the highest trending score, which decays over time and grows with the recent views, likes and comments',
         responses={
             200: OpenApiResponse(
                 description='Trending videos',
@@ -33,26 +37,49 @@ class RetrieveTrendingVideosView(APIView):
         }
     )
     def get(self, request, format=None):
-        trending_videos = Video.objects.annotate(
-            total_views=Sum('videoview__count', default=0),
-            num_likes=Count(Case(
-                When(likedvideo__liked=True, then=1),
-                output_field=IntegerField()
-            )),
-            total_comments=Count('comment_video')
-        ).order_by('-num_likes', '-total_views', '-total_comments')
+        trending_videos = Video.objects.select_related('channel', 'trending_score')\
+            .filter(trending_score__score__gt=0)\
+            .order_by('-trending_score__score', '-pk')
 
-        serialized_trending_videos = serializers.VideoListSimpleSerializer(trending_videos, many=True)
+        paginator = KeysetPagination()
+        trending_videos_page = paginator.paginate_queryset(trending_videos, request, view=self)
 
-        return Response({
-            'data': serialized_trending_videos.data
-        }, status=status.HTTP_200_OK)
+        serialized_trending_videos = serializers.VideoListSimpleSerializer(trending_videos_page, many=True)
+
+        return paginator.get_paginated_response(serialized_trending_videos.data)
+
+
+class RetrieveSubscriptionFeedView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        summary='Retrieve subscription feed',
+        description='Get the latest videos of the channels that the current channel subscribes to, newest first',
+        responses={
+            200: OpenApiResponse(
+                description='Videos from the subscribed channels',
+                response=serializers.VideoListSerializer(many=True)
+            )
+        }
+    )
+    def get(self, request, format=None):
+        paginator = KeysetPagination()
+        feed_videos_page = paginator.paginate_keyset_source(
+            lambda cursor, size: Video.objects.subscription_feed(request.user.current_channel_id, cursor, size),
+            Video.objects.order_by('-publication_date', '-pk'),
+            request,
+            view=self
+        )
+
+        serialized_feed_videos = serializers.VideoListSerializer(feed_videos_page, many=True)
+
+        return paginator.get_paginated_response(serialized_feed_videos.data)
 
 
 class RetrieveSuggestionVideosView(APIView):
     @extend_schema(
         summary='Retrieve suggestion videos',
-        description='Get suggestion videos from a video',
+        description='Get the videos that share the most relevant keywords with a video, sorted by similarity',
         responses={
             200: OpenApiResponse(
                 description='Suggestion videos from a video',
@@ -77,26 +104,14 @@ class RetrieveSuggestionVideosView(APIView):
                 'message': 'The video does not exist'
             }, status=status.HTTP_404_NOT_FOUND)
 
-        video_title_keywords = video.title.split(' ')
-        
-        if video.description is not None:
-            video_description_keywords = video.description.split(' ')
-            keywords = set(video_title_keywords + video_description_keywords)
-        else:
-            keywords = video_title_keywords
-
-        suggestion_videos = Video.objects.none()
+        suggestion_videos = VideoKeyword.objects.suggestions(video).select_related('channel')
 
-        for keyword in keywords:
-            suggestion_videos |= Video.objects.filter(title__icontains=keyword) | Video.objects.filter(description__icontains=keyword)
+        paginator = KeysetPagination()
+        suggestion_videos_page = paginator.paginate_queryset(suggestion_videos, request, view=self)
 
-        suggestion_videos = Video.objects.exclude(pk=video.id)
+        serialized_suggestion_videos = serializers.VideoListSimpleSerializer(suggestion_videos_page, many=True)
 
-        serialized_suggestion_videos = serializers.VideoListSimpleSerializer(suggestion_videos, many=True)
-
-        return Response({
-            'data': serialized_suggestion_videos.data
-        }, status=status.HTTP_200_OK)
+        return paginator.get_paginated_response(serialized_suggestion_videos.data)
 
 
 class RetrieveChannelVideosView(APIView):
@@ -129,25 +144,24 @@ class RetrieveChannelVideosView(APIView):
 
         sort_by = request.query_params.get('sort_by')
 
-        channel_videos = Video.objects.filter(channel=channel)
+        channel_videos = Video.objects.select_related('channel').filter(channel=channel)
 
         if sort_by == VideoSortOptions.MOST_POPULAR.value:
-            channel_videos = channel_videos.annotate(
-                total_views=Sum('videoview__count', default=0)
-            ).order_by('-total_views')
+            channel_videos = channel_videos.order_by('-view_count')
         elif sort_by == VideoSortOptions.OLDEST_UPLOADED.value:
             channel_videos = channel_videos.order_by('-publication_date')
         elif sort_by == VideoSortOptions.RECENTLY_UPLOADED.value or sort_by is None:
             channel_videos = channel_videos.order_by('publication_date')
 
+        paginator = KeysetPagination()
+        channel_videos_page = paginator.paginate_queryset(channel_videos, request, view=self)
+
         serialized_channel_videos = serializers.VideoListSimpleSerializer(
-            channel_videos,
+            channel_videos_page,
             many=True
         )
 
-        return Response({
-            'data': serialized_channel_videos.data
-        }, status=status.HTTP_200_OK)
+        return paginator.get_paginated_response(serialized_channel_videos.data)
 
 
 class RetrieveVideoDetailsView(generics.RetrieveAPIView):
@@ -174,7 +188,7 @@ class RetrieveVideoDetailsView(generics.RetrieveAPIView):
     )
     def get(self, request, video_id, format=None):
         try:
-            video = Video.objects.get(pk=video_id)
+            video = Video.objects.select_related('channel').get(pk=video_id)
         except Video.DoesNotExist:
             return Response({
                 'message': 'The video does not exist'
@@ -194,7 +208,7 @@ class RetrieveVideoDetailsView(generics.RetrieveAPIView):
 class SearchVideosView(APIView):
     @extend_schema(
         summary='Search videos',
-        description='Search videos by video title, in addition to having options to sort by: publication date, views and likes, and filter by dates, such as: last minute, today, this week, this month and this year',
+        description='Search videos by video title and description, in addition to having options to sort by: relevance, publication date, views and likes, and filter by dates, such as: last minute, today, this week, this month and this year',
         parameters=[
             OpenApiParameter(
                 'search_query',
@@ -210,6 +224,7 @@ class SearchVideosView(APIView):
                 required=True,
                 location=OpenApiParameter.QUERY,
                 enum=[
+                    SearchSortOptions.RELEVANCE.value,
                     SearchSortOptions.RATING.value,
                     SearchSortOptions.VIEW_COUNT.value,
                     SearchSortOptions.UPLOAD_DATE.value
@@ -256,8 +271,14 @@ class SearchVideosView(APIView):
                 'message': 'Search query is required'
             }, status=status.HTTP_400_BAD_REQUEST)
 
-        filtered_videos = Video.objects.filter(
-            Q(title=search_query) | Q(title__icontains=search_query)
+        search_vector_query = SearchQuery(
+            search_query,
+            config=VIDEO_SEARCH_CONFIG,
+            search_type='websearch'
+        )
+
+        filtered_videos = Video.objects.select_related('channel').filter(
+            search_vector=search_vector_query
         )
 
         if upload_date == SearchUploadDate.LAST_HOUR.value:
@@ -281,30 +302,27 @@ class SearchVideosView(APIView):
                 publication_date__year=datetime.today().year
             )
 
-        if sort_by == SearchSortOptions.UPLOAD_DATE.value:
+        if sort_by == SearchSortOptions.RELEVANCE.value or sort_by is None:
+            # The rank is a single precision real, cast to round trip through the cursor
+            filtered_videos = filtered_videos.annotate(
+                rank=Cast(SearchRank(F('search_vector'), search_vector_query), FloatField())
+            ).order_by('-rank')
+        elif sort_by == SearchSortOptions.UPLOAD_DATE.value:
             filtered_videos = filtered_videos.order_by('publication_date')
         elif sort_by == SearchSortOptions.VIEW_COUNT.value:
-            filtered_videos = filtered_videos.annotate(
-                total_views=Sum('videoview__count', default=0)
-            ).order_by('-total_views')
+            filtered_videos = filtered_videos.order_by('-view_count')
         elif sort_by == SearchSortOptions.RATING.value:
-            filtered_videos = filtered_videos.annotate(
-                num_likes=Count(
-                    Case(
-                        When(likedvideo__liked=True, then=1),
-                        output_field=IntegerField()
-                    )
-                )
-            ).order_by('-num_likes')
+            filtered_videos = filtered_videos.order_by('-like_count')
+
+        paginator = KeysetPagination()
+        filtered_videos_page = paginator.paginate_queryset(filtered_videos, request, view=self)
 
         serialized_videos = serializers.VideoListSerializer(
-            filtered_videos,
+            filtered_videos_page,
             many=True
         )
 
-        return Response({
-            'data': serialized_videos.data
-        }, status=status.HTTP_200_OK)
+        return paginator.get_paginated_response(serialized_videos.data)
 
 
 class CreateVideoView(APIView):
@@ -393,7 +411,7 @@ class AddVisitToVideoView(APIView):
 
     @extend_schema(
         summary='Add visit to video',
-        description='Increase the number of views of a video by one',
+        description='Increase the number of views of a video by one, the view is buffered and written in bulk with other views',
         request=None,
         responses={
             204: OpenApiResponse(
@@ -411,27 +429,15 @@ class AddVisitToVideoView(APIView):
         }
     )
     def post(self, request, video_id, format=None):
-        try:
-            video = Video.objects.get(pk=video_id)
-        except Video.DoesNotExist:
+        if not Video.objects.filter(pk=video_id).exists():
             return Response({
                 'message': 'The video does not exist'
             }, status=status.HTTP_404_NOT_FOUND)
 
         if request.user.is_authenticated:
-            video_view, created = VideoView.objects.get_or_create(
-                channel=request.user.current_channel,
-                video=video
-            )
+            video_view_buffer.add(video_id, request.user.current_channel_id)
         else:
-            video_view, created = VideoView.objects.get_or_create(
-                channel=None,
-                video=video
-            )
-
-        if not created:
-            video_view.count += 1
-            video_view.save()
+            video_view_buffer.add(video_id)
 
         return Response(status=status.HTTP_204_NO_CONTENT)
 
@@ -450,7 +456,11 @@ class LikeVideoView(APIView):
                 response={
                     'type': 'object',
                     'properties': {
-                        'message': {'type': 'string'}
+                        'message': {'type': 'string'},
+                        'liked': {'type': 'boolean'},
+                        'disliked': {'type': 'boolean'},
+                        'likes': {'type': 'integer'},
+                        'dislikes': {'type': 'integer'}
                     }
                 }
             ),
@@ -466,37 +476,16 @@ class LikeVideoView(APIView):
         }
     )
     def post(self, request, video_id, format=None):
-        try:
-            video = Video.objects.get(id=video_id)
-        except Video.DoesNotExist:
+        like_video = LikedVideo.objects.toggle(request.user.current_channel_id, video_id, liked=True)
+
+        if like_video is None:
             return Response({
                 'message': 'The video does not exist'
             }, status=status.HTTP_404_NOT_FOUND)
 
-        try:
-            like_video = LikedVideo.objects.get(
-                channel=request.user.current_channel,
-                video=video
-            )
-
-            if like_video.liked:
-                like_video.delete()
-
-                return Response({
-                    'message': 'Like video removed'
-                }, status=status.HTTP_200_OK)
-
-            like_video.liked = True
-            like_video.save()
-        except LikedVideo.DoesNotExist:
-            LikedVideo.objects.create(
-                channel=request.user.current_channel,
-                video=video,
-                liked=True
-            ).save()
-
         return Response({
-            'message': 'Like video added'
+            'message': 'Like video added' if like_video['liked'] else 'Like video removed',
+            **like_video
         }, status=status.HTTP_200_OK)
 
 
@@ -514,7 +503,11 @@ class DislikeVideoView(APIView):
                 response={
                     'type': 'object',
                     'properties': {
-                        'message': {'type': 'string'}
+                        'message': {'type': 'string'},
+                        'liked': {'type': 'boolean'},
+                        'disliked': {'type': 'boolean'},
+                        'likes': {'type': 'integer'},
+                        'dislikes': {'type': 'integer'}
                     }
                 }
             ),
@@ -530,37 +523,16 @@ class DislikeVideoView(APIView):
         }
     )
     def post(self, request, video_id, format=None):
-        try:
-            video = Video.objects.get(id=video_id)
-        except Video.DoesNotExist:
+        dislike_video = LikedVideo.objects.toggle(request.user.current_channel_id, video_id, liked=False)
+
+        if dislike_video is None:
             return Response({
                 'message': 'The video does not exist'
             }, status=status.HTTP_404_NOT_FOUND)
 
-        try:
-            dislike_video = LikedVideo.objects.get(
-                channel=request.user.current_channel,
-                video=video
-            )
-
-            if not dislike_video.liked:
-                dislike_video.delete()
-
-                return Response({
-                    'message': 'Dislike video removed'
-                }, status=status.HTTP_200_OK)
-
-            dislike_video.liked = False
-            dislike_video.save()
-        except LikedVideo.DoesNotExist:
-            LikedVideo.objects.create(
-                channel=request.user.current_channel,
-                video=video,
-                liked=False
-            ).save()
-
         return Response({
-            'message': 'Dislike video added'
+            'message': 'Dislike video added' if dislike_video['disliked'] else 'Dislike video removed',
+            **dislike_video
         }, status=status.HTTP_200_OK)
 
 
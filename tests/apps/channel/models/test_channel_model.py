@@ -2,7 +2,8 @@ from django.test import TestCase
 
 from faker import Faker
 
-from tests.factories.channel import ChannelFactory
+from tests.factories.channel import ChannelFactory, ChannelSubscriptionFactory
+from tests.factories.video import VideoFactory, VideoViewFactory
 
 from apps.channel.models import Channel
 
@@ -25,3 +26,85 @@ class TestChannelModel(TestCase):
         """
         channel_exists = Channel.objects.filter(id=self.channel.pk)
         self.assertTrue(channel_exists)
+
+    def test_subscriber_count_is_maintained_by_the_subscriptions(self):
+        """
+        Should verify that the subscriber count of the channel follows its created and deleted subscriptions
+        """
+        subscriptions = ChannelSubscriptionFactory.create_batch(3, subscribing=self.channel)
+        subscriptions[0].delete()
+
+        self.channel.refresh_from_db()
+
+        self.assertEqual(self.channel.subscriber_count, 2)
+
+    def test_subscriber_count_is_maintained_by_the_subscriptions_relation(self):
+        """
+        Should verify that the subscriber count of the channels follows the symmetrical subscriptions relation
+        """
+        other_channel: Channel = ChannelFactory.create()
+
+        self.channel.subscriptions.add(other_channel)
+
+        self.channel.refresh_from_db()
+        other_channel.refresh_from_db()
+
+        self.assertEqual(self.channel.subscriber_count, 1)
+        self.assertEqual(other_channel.subscriber_count, 1)
+
+        self.channel.subscriptions.remove(other_channel)
+
+        self.channel.refresh_from_db()
+        other_channel.refresh_from_db()
+
+        self.assertEqual(self.channel.subscriber_count, 0)
+        self.assertEqual(other_channel.subscriber_count, 0)
+
+    def test_total_views_is_maintained_by_the_views_of_its_videos(self):
+        """
+        Should verify that the total views of the channel is the sum of the views of its videos
+        """
+        first_video = VideoFactory.create(channel=self.channel)
+        second_video = VideoFactory.create(channel=self.channel)
+
+        VideoViewFactory.create(video=first_video, count=4)
+        VideoViewFactory.create(video=second_video, count=3)
+
+        second_video.delete()
+
+        self.channel.refresh_from_db()
+
+        self.assertEqual(self.channel.total_views, 4)
+
+    def test_video_count_is_maintained_by_its_videos(self):
+        """
+        Should verify that the video count of the channel follows its created and deleted videos
+        """
+        videos = VideoFactory.create_batch(3, channel=self.channel)
+        VideoFactory.create()
+
+        videos[0].delete()
+
+        self.channel.refresh_from_db()
+
+        self.assertEqual(self.channel.video_count, 2)
+
+    def test_last_upload_date_is_maintained_by_its_videos(self):
+        """
+        Should verify that the last upload date of the channel is the publication date of its latest video
+        """
+        first_video = VideoFactory.create(channel=self.channel)
+        second_video = VideoFactory.create(channel=self.channel)
+
+        self.channel.refresh_from_db()
+        self.assertEqual(self.channel.last_upload_date, second_video.publication_date)
+
+        second_video.delete()
+
+        self.channel.refresh_from_db()
+        self.assertEqual(self.channel.last_upload_date, first_video.publication_date)
+
+        first_video.delete()
+
+        self.channel.refresh_from_db()
+        self.assertIsNone(self.channel.last_upload_date)
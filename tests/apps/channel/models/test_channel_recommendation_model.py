@@ -0,0 +1,76 @@
+import math
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from tests.factories.channel import ChannelFactory, ChannelSubscriptionFactory
+
+from apps.channel.models import Channel, ChannelRecommendation, ChannelSubscription
+
+
+class TestChannelRecommendationModel(TestCase):
+    def setUp(self):
+        self.channels: list[Channel] = ChannelFactory.create_batch(3)
+        self.subscribers: list[Channel] = ChannelFactory.create_batch(4)
+
+        first, second, third = self.channels
+
+        for subscriber, channel in [
+            (self.subscribers[0], first), (self.subscribers[0], second),
+            (self.subscribers[1], first), (self.subscribers[1], second),
+            (self.subscribers[2], first), (self.subscribers[2], third),
+            (self.subscribers[3], third),
+        ]:
+            ChannelSubscriptionFactory.create(subscriber=subscriber, subscribing=channel)
+
+    def get_recommendations(self, channel: Channel):
+        return list(
+            ChannelRecommendation.objects.filter(channel=channel)
+                .order_by('-score')
+                .values_list('recommended_channel_id', 'score')
+        )
+
+    def test_recommendations_are_the_channels_subscribed_together_by_cosine_similarity(self):
+        """
+        Should verify that the recommended channels are scored by the cosine similarity of their subscribers
+        """
+        first, second, third = self.channels
+
+        stored_recommendations = ChannelRecommendation.objects.refresh(top_k=10, chunk_size=1)
+
+        self.assertEqual(stored_recommendations, 4)
+
+        first_recommendations = self.get_recommendations(first)
+
+        self.assertEqual([channel_id for channel_id, _ in first_recommendations], [second.pk, third.pk])
+        self.assertAlmostEqual(first_recommendations[0][1], 2 / math.sqrt(3 * 2))
+        self.assertAlmostEqual(first_recommendations[1][1], 1 / math.sqrt(3 * 2))
+
+        self.assertEqual([channel_id for channel_id, _ in self.get_recommendations(second)], [first.pk])
+        self.assertEqual([channel_id for channel_id, _ in self.get_recommendations(third)], [first.pk])
+
+    def test_only_the_top_k_recommendations_are_stored(self):
+        """
+        Should verify that only the top_k recommended channels of every channel are stored
+        """
+        first, second, _ = self.channels
+
+        ChannelRecommendation.objects.refresh(top_k=1, chunk_size=1000)
+
+        self.assertEqual([channel_id for channel_id, _ in self.get_recommendations(first)], [second.pk])
+
+    def test_refresh_replaces_the_stale_recommendations(self):
+        """
+        Should verify that the recommendations no longer supported by the subscriptions are removed on refresh
+        """
+        first, _, third = self.channels
+
+        ChannelRecommendation.objects.refresh(top_k=10, chunk_size=2)
+
+        ChannelSubscription.objects.get(subscriber=self.subscribers[2], subscribing=third).delete()
+
+        call_command('refresh_channel_recommendations', stdout=StringIO())
+
+        self.assertNotIn(third.pk, [channel_id for channel_id, _ in self.get_recommendations(first)])
+        self.assertEqual(self.get_recommendations(third), [])
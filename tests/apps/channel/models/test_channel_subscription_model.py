@@ -1,6 +1,9 @@
-from django.test import TestCase
+from django.contrib.auth.models import AnonymousUser
+from django.db import IntegrityError
+from django.test import TestCase, override_settings
 
-from tests.factories.channel import ChannelSubscriptionFactory
+from tests.factories.channel import ChannelFactory, ChannelSubscriptionFactory
+from tests.factories.video import VideoFactory
 
 from apps.channel.models import ChannelSubscription
 
@@ -21,3 +24,85 @@ class TestChannelSubscriptionModel(TestCase):
         """
         channel_subscription = ChannelSubscription.objects.filter(id=self.channel_subscription.pk)
         self.assertTrue(channel_subscription.exists())
+
+    def test_a_channel_can_only_subscribe_to_a_channel_once(self):
+        """
+        Should verify that a channel can not be subscribed twice to the same channel
+        """
+        with self.assertRaises(IntegrityError):
+            ChannelSubscriptionFactory.create(
+                subscriber=self.channel_subscription.subscriber,
+                subscribing=self.channel_subscription.subscribing
+            )
+
+    @override_settings(SHARED_CACHE=True)
+    def test_subscribed_channel_ids_follow_the_subscriptions(self):
+        """
+        Should verify that the subscribed channel ids kept in the shared cache are refreshed when the subscriptions change
+        """
+        subscriber = self.channel_subscription.subscriber
+        other_channel = ChannelFactory.create()
+
+        subscribed_channel_ids = ChannelSubscription.objects.load_subscribed_channel_ids(subscriber.pk)
+
+        self.assertIn(self.channel_subscription.subscribing_id, subscribed_channel_ids)
+        self.assertNotIn(other_channel.pk, subscribed_channel_ids)
+
+        ChannelSubscriptionFactory.create(subscriber=subscriber, subscribing=other_channel)
+        self.channel_subscription.delete()
+
+        with self.assertNumQueries(1):
+            subscribed_channel_ids = ChannelSubscription.objects.load_subscribed_channel_ids(subscriber.pk)
+
+        with self.assertNumQueries(0):
+            ChannelSubscription.objects.load_subscribed_channel_ids(subscriber.pk)
+
+        self.assertEqual(len(subscribed_channel_ids), 1)
+        self.assertIn(other_channel.pk, subscribed_channel_ids)
+        self.assertNotIn(self.channel_subscription.subscribing_id, subscribed_channel_ids)
+
+    def test_subscribed_channel_ids_are_read_once_per_user_without_a_shared_cache(self):
+        """
+        Should verify that the subscribed channel ids are read once for the user of a request and not kept for the next one
+        """
+        user = self.channel_subscription.subscriber.user
+        user.current_channel = self.channel_subscription.subscriber
+
+        with self.assertNumQueries(1):
+            ChannelSubscription.objects.subscribed_channel_ids(user)
+            subscribed_channel_ids = ChannelSubscription.objects.subscribed_channel_ids(user)
+
+        self.assertIn(self.channel_subscription.subscribing_id, subscribed_channel_ids)
+
+        with self.assertNumQueries(1):
+            ChannelSubscription.objects.load_subscribed_channel_ids(user.current_channel_id)
+
+    def test_mark_seen_only_writes_when_the_channel_has_new_uploads(self):
+        """
+        Should verify that marking a channel as seen updates the last visit date only when the channel uploaded since the last visit
+        """
+        user = self.channel_subscription.subscriber.user
+        user.current_channel = self.channel_subscription.subscriber
+        subscribing = self.channel_subscription.subscribing
+        other_channel = ChannelFactory.create()
+        last_visit_date = self.channel_subscription.last_visit_date
+
+        VideoFactory.create(channel=subscribing)
+        subscribing.refresh_from_db()
+
+        ChannelSubscription.objects.mark_seen(user, subscribing)
+        self.channel_subscription.refresh_from_db()
+        seen_date = self.channel_subscription.last_visit_date
+
+        self.assertGreater(seen_date, last_visit_date)
+
+        ChannelSubscription.objects.mark_seen(user, subscribing)
+        self.channel_subscription.refresh_from_db()
+
+        self.assertEqual(self.channel_subscription.last_visit_date, seen_date)
+
+        with self.assertNumQueries(0):
+            ChannelSubscription.objects.mark_seen(user, other_channel)
+
+        with self.assertNumQueries(0):
+            ChannelSubscription.objects.mark_seen(AnonymousUser(), subscribing)
@@ -7,6 +7,9 @@ from unittest.mock import patch
 
 from tests.setups import APITestCaseWithAuth
 
+from tests.factories.channel import ChannelSubscriptionFactory
+from tests.factories.video import VideoFactory
+
 from apps.channel.models import Channel
 
 from faker import Faker
@@ -63,6 +66,40 @@ class TestEditChannel(APITestCaseWithAuth):
 
         self.assertNotEqual(self.user.current_channel.banner_url, channel_edited.banner_url)
 
+    @patch('youtube_clone.utils.storage.CloudinaryUploader.upload_image')
+    def test_channel_counters_changed_during_the_edition_are_kept(self, mock_upload_image):
+        """
+        Should verify that the subscriptions and uploads added while the channel is edited are not reverted by the edition
+        """
+        channel = self.user.current_channel
+
+        def subscribe_and_upload_during_upload(*args):
+            ChannelSubscriptionFactory.create(subscribing=channel)
+            VideoFactory.create(channel=channel)
+
+            return 'https://cloudinary.com/image.png'
+
+        mock_upload_image.side_effect = subscribe_and_upload_during_upload
+
+        banner_content = faker.image(size=(1, 1), hue=[90, 270])
+        banner_image = SimpleUploadedFile('banner_default.png', banner_content, content_type='image/png')
+
+        self.client.patch(
+            self.url,
+            {
+                'description': 'New description',
+                'banner': banner_image
+            },
+            format='multipart'
+        )
+
+        channel_edited: Channel = Channel.objects.get(id=channel.pk)
+
+        self.assertEqual(channel_edited.description, 'New description')
+        self.assertEqual(channel_edited.subscriber_count, 1)
+        self.assertEqual(channel_edited.video_count, 1)
+        self.assertIsNotNone(channel_edited.last_upload_date)
+
     @patch('youtube_clone.utils.storage.CloudinaryUploader.upload_image')
     def test_channel_picture_has_been_updated(self, mock_upload_image):
         """
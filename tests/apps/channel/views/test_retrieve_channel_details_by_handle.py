@@ -21,7 +21,7 @@ class TestChannelDetailsByHandle(APITestCase):
         """
         response = self.client.get(self.url)
 
-        serialized_channel = ChannelDetailsSerializer(self.channel)
+        serialized_channel = ChannelDetailsSerializer(Channel.objects.with_details().get(pk=self.channel.pk))
 
         self.assertDictEqual(response.data, serialized_channel.data)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -3,7 +3,11 @@ from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
 
-from tests.factories.channel import ChannelFactory
+from tests.setups import APITestCaseWithAuth
+
+from tests.factories.channel import ChannelFactory, ChannelSubscriptionFactory
+from tests.factories.link import LinkFactory
+from tests.factories.video import VideoFactory, VideoViewFactory
 
 from apps.channel.models import Channel
 
@@ -21,7 +25,7 @@ class TestChannelDetailsById(APITestCase):
         """
         response = self.client.get(self.url)
 
-        serialized_channel = ChannelDetailsSerializer(self.channel)
+        serialized_channel = ChannelDetailsSerializer(Channel.objects.with_details().get(pk=self.channel.pk))
 
         self.assertDictEqual(response.data, serialized_channel.data)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -35,4 +39,57 @@ class TestChannelDetailsById(APITestCase):
         response = self.client.get(self.url)
 
         self.assertDictEqual(response.data, {'message': 'The channel does not exists'})
-        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
\ No newline at end of file
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+class TestChannelDetailsByIdStatistics(APITestCaseWithAuth):
+    def setUp(self):
+        super().setUp()
+
+        self.channel: Channel = ChannelFactory.create()
+        self.url = reverse('channel_details_by_id', kwargs={'channel_id': self.channel.pk})
+
+    def test_returns_the_channel_statistics_and_links(self):
+        """
+        Should return the stored totals of the channel, its links in order and whether it is subscribed
+        """
+        videos = VideoFactory.create_batch(2, channel=self.channel)
+        VideoViewFactory.create(video=videos[0], count=5)
+        ChannelSubscriptionFactory.create(subscriber=self.user.current_channel, subscribing=self.channel)
+        ChannelSubscriptionFactory.create(subscribing=self.channel)
+
+        links = [
+            LinkFactory.create(channel=self.channel),
+            LinkFactory.create(channel=self.channel)
+        ]
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data.get('subscribers'), 2)
+        self.assertEqual(response.data.get('total_videos'), 2)
+        self.assertEqual(response.data.get('total_views'), 5)
+        self.assertTrue(response.data.get('subscribed'))
+        self.assertEqual(
+            [(link.get('id'), link.get('position')) for link in response.data.get('links')],
+            [(links[0].pk, 0), (links[1].pk, 1)]
+        )
+
+    def test_returns_the_channel_in_a_single_query(self):
+        """
+        Should read the channel with its links in a single query and the subscribed channel ids of the viewer once
+        """
+        LinkFactory.create_batch(3, channel=self.channel)
+        VideoFactory.create_batch(3, channel=self.channel)
+        ChannelSubscriptionFactory.create(subscriber=self.user.current_channel, subscribing=self.channel)
+
+        # The user, the channel, the subscribed channel ids of the viewer and
+        # the visit that clears the new uploads flag
+        with self.assertNumQueries(4):
+            self.client.get(self.url)
+
+        # The same update matches no subscription until the channel uploads again
+        with self.assertNumQueries(4):
+            response = self.client.get(self.url)
+
+        self.assertEqual(len(response.data.get('links')), 3)
+        self.assertTrue(response.data.get('subscribed'))
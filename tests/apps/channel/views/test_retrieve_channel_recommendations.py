@@ -0,0 +1,57 @@
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from tests.factories.channel import ChannelFactory
+
+from apps.channel.models import Channel, ChannelRecommendation
+
+from apps.channel.serializers import ChannelListSerializer
+
+
+class TestRetrieveChannelRecommendations(APITestCase):
+    def setUp(self):
+        self.channel: Channel = ChannelFactory.create()
+        self.url = reverse('channel_recommendations', kwargs={'channel_id': self.channel.pk})
+
+    def test_return_the_recommended_channels_by_score(self):
+        """
+        Should return the serialized recommended channels of the channel, the most similar first
+        """
+        recommended_channels: list[Channel] = ChannelFactory.create_batch(2)
+
+        ChannelRecommendation.objects.create(channel=self.channel, recommended_channel=recommended_channels[0], score=0.2)
+        ChannelRecommendation.objects.create(channel=self.channel, recommended_channel=recommended_channels[1], score=0.8)
+        ChannelRecommendation.objects.create(channel=recommended_channels[0], recommended_channel=self.channel, score=0.5)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data.get('data'),
+            ChannelListSerializer([recommended_channels[1], recommended_channels[0]], many=True).data
+        )
+
+    def test_return_the_recommended_channels_with_a_single_read(self):
+        """
+        Should read the recommended channels with a single query after checking the channel
+        """
+        for recommended_channel in ChannelFactory.create_batch(3):
+            ChannelRecommendation.objects.create(channel=self.channel, recommended_channel=recommended_channel, score=0.5)
+
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+
+        self.assertEqual(len(response.data.get('data')), 3)
+
+    def test_channel_does_not_exist(self):
+        """
+        Should return an error message and a 404 status code if the channel does not exist
+        """
+        self.channel.delete()
+
+        response = self.client.get(self.url)
+
+        self.assertDictEqual(response.data, {'message': 'The channel does not exist'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -5,6 +5,7 @@ from rest_framework import status
 from tests.setups import APITestCaseWithAuth
 
 from tests.factories.channel import ChannelFactory, ChannelSubscriptionFactory
+from tests.factories.video import VideoFactory
 
 from apps.channel.models import Channel
 
@@ -39,3 +40,56 @@ class TestSubscribedChannels(APITestCaseWithAuth):
                 channel_subscribed.pk,
                 response_channels[index].get('id')
             )
+
+    def test_channels_subscribed_are_paginated_in_subscription_order(self):
+        """
+        Should return the subscribed channels in subscription order across pages, whatever their ids
+        """
+        older_channels: list[Channel] = ChannelFactory.create_batch(3)
+
+        for older_channel in reversed(older_channels):
+            ChannelSubscriptionFactory.create(subscriber=self.user.current_channel, subscribing=older_channel)
+
+        first_page = self.client.get(self.url, {'page_size': 3})
+        second_page = self.client.get(self.url, {'page_size': 3, 'cursor': first_page.data.get('next')})
+
+        self.assertIsNone(second_page.data.get('next'))
+        self.assertEqual(
+            [channel.get('id') for channel in first_page.data.get('data') + second_page.data.get('data')],
+            [channel.pk for channel in self.channels_subscribed + list(reversed(older_channels))]
+        )
+
+    def test_channels_subscribed_with_new_uploads_are_flagged(self):
+        """
+        Should flag the subscribed channels that uploaded a video since they were last visited
+        """
+        VideoFactory.create(channel=self.channels_subscribed[1])
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(
+            [channel.get('has_new_uploads') for channel in response.data.get('data')],
+            [False, True]
+        )
+
+        self.client.get(reverse('channel_details_by_id', kwargs={'channel_id': self.channels_subscribed[1].pk}))
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(
+            [channel.get('has_new_uploads') for channel in response.data.get('data')],
+            [False, False]
+        )
+
+    def test_channels_subscribed_in_a_constant_number_of_queries(self):
+        """
+        Should retrieve the subscribed channels with a single query whatever their number
+        """
+        for channel in ChannelFactory.create_batch(3):
+            ChannelSubscriptionFactory.create(subscriber=self.user.current_channel, subscribing=channel)
+
+        # The user and the subscribed channels
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+
+        self.assertEqual(len(response.data.get('data')), 5)
@@ -7,6 +7,7 @@ from rest_framework.test import APITestCase
 from tests.factories.channel import ChannelFactory, ChannelSubscriptionFactory
 from tests.factories.video import VideoFactory, VideoViewFactory
 from tests.factories.user_account import UserFactory
+from tests.utils import encode_cursor
 
 from apps.channel.models import Channel
 from apps.user.models import UserAccount
@@ -147,3 +148,88 @@ class TestSearchChannels(APITestCase):
             first_channel.get('id'),
             self.channel_with_subscribers.pk
         )
+
+    def test_search_tolerates_typos(self):
+        """
+        Should return the channels whose name is similar to a misspelled search query
+        """
+        channel: Channel = ChannelFactory.create(name='Cooking Lessons')
+
+        response = self.client.get(self.url, {'search_query': 'Cookng Lesons'})
+
+        channels_ids = [dict(channel).get('id') for channel in response.data.get('data')]
+
+        self.assertIn(channel.pk, channels_ids)
+
+    def test_search_by_handle(self):
+        """
+        Should return the channel whose handle matches the search query
+        """
+        channel: Channel = ChannelFactory.create(name='Cooking Lessons')
+
+        response = self.client.get(self.url, {'search_query': f'@{channel.handle}'})
+
+        channels_ids = [dict(channel).get('id') for channel in response.data.get('data')]
+
+        self.assertIn(channel.pk, channels_ids)
+
+    def test_sorted_by_RELEVANCE(self):
+        """
+        Should return first the channel whose name is the most similar to the search query
+        """
+        ChannelFactory.create(name='Cooking Lessons Abroad')
+        most_similar_channel: Channel = ChannelFactory.create(name='Cooking Lessons')
+
+        response = self.client.get(
+            self.url,
+            {
+                'search_query': 'Cooking Lessons',
+                'sort_by': SearchSortOptions.RELEVANCE.value
+            }
+        )
+
+        first_channel = dict(response.data.get('data')[0])
+
+        self.assertEqual(first_channel.get('id'), most_similar_channel.pk)
+
+    def test_search_by_relevance_across_pages(self):
+        """
+        Should verify that the pages of the channels sorted by relevance neither repeat nor skip channels
+        """
+        for name in ['rock band', 'rock bands', 'band of rock', 'rock band live', 'my rock band channel', 'rock n band']:
+            ChannelFactory.create(name=name)
+
+        single_page = self.client.get(self.url, {'search_query': 'rock band', 'page_size': 50})
+        expected_channels_ids = [channel.get('id') for channel in single_page.data.get('data')]
+
+        searched_channels_ids = []
+        params = {'search_query': 'rock band', 'page_size': 1}
+
+        for _ in range(len(expected_channels_ids)):
+            response = self.client.get(self.url, params)
+            searched_channels_ids += [channel.get('id') for channel in response.data.get('data')]
+
+            if response.data.get('next') is None:
+                break
+
+            params['cursor'] = response.data.get('next')
+
+        self.assertGreaterEqual(len(expected_channels_ids), 6)
+        self.assertEqual(searched_channels_ids, expected_channels_ids)
+
+    def test_search_channels_with_an_invalid_cursor(self):
+        """
+        Should return a 404 status code if the values of the cursor do not match the sort of the channels
+        """
+        for sort_by, cursor in [
+            (SearchSortOptions.RELEVANCE.value, [{'similarity': 1}, 1]),
+            (SearchSortOptions.RELEVANCE.value, ['x', 'y']),
+            (SearchSortOptions.UPLOAD_DATE.value, ['x', 1]),
+            (SearchSortOptions.RATING.value, [1, 2 ** 70]),
+        ]:
+            response = self.client.get(
+                self.url,
+                {'search_query': self.SEARCH_QUERY, 'sort_by': sort_by, 'cursor': encode_cursor(cursor)}
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
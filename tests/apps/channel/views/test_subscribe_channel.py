@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from django.urls import reverse
 
 from rest_framework import status
@@ -84,3 +86,21 @@ class TestSubscribeChannel(APITestCaseWithAuth):
 
         self.assertDictEqual(response.data, {'message': "Can't subscribe to itself"})
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_subscription_added_by_a_concurrent_request(self):
+        """
+        Should return a 400 status code instead of failing if the subscription is added after it was looked up
+        """
+        self.channel.subscriptions.add(self.user.current_channel)
+
+        url = reverse(self.url_name, kwargs={'channel_id': self.channel.pk})
+
+        with patch.object(ChannelSubscription.objects, 'get', side_effect=ChannelSubscription.DoesNotExist):
+            response = self.client.post(url)
+
+        self.assertDictEqual(response.data, {'message': 'The subscription already exists'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            ChannelSubscription.objects.filter(subscriber=self.user.current_channel, subscribing=self.channel).count(),
+            1
+        )
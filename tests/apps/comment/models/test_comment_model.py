@@ -1,8 +1,12 @@
+from io import StringIO
+
+from django.core.management import call_command
 from django.test import TestCase
 
-from tests.factories.comment import CommentFactory
+from tests.factories.comment import CommentFactory, LikeCommentFactory, DislikeCommentFactory
+from tests.factories.channel import ChannelFactory
 
-from apps.comment.models import Comment
+from apps.comment.models import Comment, LikedComment
 
 
 class TestCommentModel(TestCase):
@@ -21,3 +25,170 @@ class TestCommentModel(TestCase):
         """
         comment = Comment.objects.filter(id=self.comment.pk)
         self.assertTrue(comment.exists())
+
+    def test_like_counters_increase_when_likes_are_created(self):
+        """
+        Should verify that the like and dislike counters increase when likes and dislikes are created
+        """
+        LikeCommentFactory.create_batch(2, comment=self.comment)
+        DislikeCommentFactory.create(comment=self.comment)
+
+        self.comment.refresh_from_db()
+
+        self.assertEqual(self.comment.like_count, 2)
+        self.assertEqual(self.comment.dislike_count, 1)
+
+    def test_like_counters_decrease_when_likes_are_deleted(self):
+        """
+        Should verify that the like and dislike counters decrease when likes and dislikes are deleted
+        """
+        like_comment = LikeCommentFactory.create(comment=self.comment)
+        dislike_comment = DislikeCommentFactory.create(comment=self.comment)
+
+        like_comment.delete()
+        dislike_comment.delete()
+
+        self.comment.refresh_from_db()
+
+        self.assertEqual(self.comment.like_count, 0)
+        self.assertEqual(self.comment.dislike_count, 0)
+
+    def test_saving_a_comment_keeps_the_counters_changed_since_it_was_loaded(self):
+        """
+        Should verify that saving a comment loaded before a like and a reply does not revert its counters and score
+        """
+        comment = Comment.objects.get(pk=self.comment.pk)
+
+        LikeCommentFactory.create(comment=self.comment)
+        CommentFactory.create(video=self.comment.video, comment=self.comment)
+
+        comment.content = 'Edited content'
+        comment.save()
+
+        self.comment.refresh_from_db()
+
+        self.assertEqual(self.comment.content, 'Edited content')
+        self.assertEqual(self.comment.like_count, 1)
+        self.assertEqual(self.comment.reply_count, 1)
+        self.assertGreater(self.comment.score, 0)
+
+    def test_first_replies_of_every_comment(self):
+        """
+        Should verify that the first replies of every comment are returned oldest first and limited by the size
+        """
+        replies = CommentFactory.create_batch(3, video=self.comment.video, comment=self.comment)
+        other_comment: Comment = CommentFactory.create(video=self.comment.video)
+        other_reply: Comment = CommentFactory.create(video=self.comment.video, comment=other_comment)
+        comment_without_replies: Comment = CommentFactory.create(video=self.comment.video)
+
+        threads = Comment.objects.first_replies(
+            [self.comment.pk, other_comment.pk, comment_without_replies.pk],
+            2
+        )
+
+        self.assertEqual(threads[self.comment.pk], replies[:2])
+        self.assertEqual(threads[other_comment.pk], [other_reply])
+        self.assertEqual(threads[comment_without_replies.pk], [])
+
+    def test_score_increases_with_the_likes(self):
+        """
+        Should verify that the score of the comment increases when it is liked
+        """
+        LikeCommentFactory.create(comment=self.comment)
+
+        self.comment.refresh_from_db()
+        score_with_one_like = self.comment.score
+
+        LikeCommentFactory.create(comment=self.comment)
+
+        self.comment.refresh_from_db()
+
+        self.assertGreater(score_with_one_like, 0)
+        self.assertGreater(self.comment.score, score_with_one_like)
+
+    def test_score_decreases_with_the_dislikes(self):
+        """
+        Should verify that a comment with the same likes but more dislikes has a lower score
+        """
+        comment_with_dislikes: Comment = CommentFactory.create()
+
+        LikeCommentFactory.create_batch(2, comment=self.comment)
+        LikeCommentFactory.create_batch(2, comment=comment_with_dislikes)
+        DislikeCommentFactory.create_batch(2, comment=comment_with_dislikes)
+
+        self.comment.refresh_from_db()
+        comment_with_dislikes.refresh_from_db()
+
+        self.assertGreater(self.comment.score, comment_with_dislikes.score)
+
+    def test_score_follows_the_reaction_toggles(self):
+        """
+        Should verify that the score of the comment is updated when a reaction is toggled
+        """
+        channel = LikeCommentFactory.create(comment=self.comment).channel
+
+        LikedComment.objects.toggle(channel.pk, self.comment.pk, False)
+
+        self.comment.refresh_from_db()
+
+        self.assertEqual(self.comment.score, 0)
+
+    def test_score_follows_the_replies(self):
+        """
+        Should verify that the score of the comment increases when it is replied and decreases when the reply is deleted
+        """
+        reply: Comment = CommentFactory.create(video=self.comment.video, comment=self.comment)
+
+        self.comment.refresh_from_db()
+        self.assertGreater(self.comment.score, 0)
+
+        reply.delete()
+
+        self.comment.refresh_from_db()
+        self.assertEqual(self.comment.score, 0)
+
+    def test_reply_count_follows_the_replies(self):
+        """
+        Should verify that the reply count of the comment increases when it is replied and decreases when the reply is deleted
+        """
+        replies = CommentFactory.create_batch(2, video=self.comment.video, comment=self.comment)
+
+        self.comment.refresh_from_db()
+        self.assertEqual(self.comment.reply_count, 2)
+
+        replies[0].delete()
+
+        self.comment.refresh_from_db()
+        self.assertEqual(self.comment.reply_count, 1)
+
+    def test_reply_count_decreases_when_a_reply_is_deleted_in_cascade(self):
+        """
+        Should verify that the reply count of the comment decreases when the channel of a reply is deleted
+        """
+        channel = ChannelFactory.create()
+        CommentFactory.create(video=self.comment.video, comment=self.comment, channel=channel)
+        CommentFactory.create(video=self.comment.video, comment=self.comment)
+
+        channel.delete()
+
+        self.comment.refresh_from_db()
+        self.assertEqual(self.comment.reply_count, 1)
+
+    def test_repair_the_reply_counts(self):
+        """
+        Should verify that the repair command recomputes the wrong reply counts
+        """
+        CommentFactory.create_batch(2, video=self.comment.video, comment=self.comment)
+        comment_without_replies: Comment = CommentFactory.create()
+
+        Comment.objects.filter(pk=self.comment.pk).update(reply_count=5)
+        Comment.objects.filter(pk=comment_without_replies.pk).update(reply_count=3)
+
+        call_command('repair_comment_reply_counts', stdout=StringIO())
+
+        self.comment.refresh_from_db()
+        comment_without_replies.refresh_from_db()
+
+        self.assertEqual(self.comment.reply_count, 2)
+        self.assertEqual(comment_without_replies.reply_count, 0)
+        self.assertEqual(Comment.objects.repair_reply_counts(), 0)
@@ -1,3 +1,4 @@
+from django.db import IntegrityError
 from django.test import TestCase
 
 from tests.factories.comment import LikeCommentFactory
@@ -21,3 +22,10 @@ class TestLikedCommentModel(TestCase):
         """
         like_comment = LikedComment.objects.filter(id=self.like_comment.pk)
         self.assertTrue(like_comment.exists())
+
+    def test_a_channel_can_only_like_a_comment_once(self):
+        """
+        Should verify that a channel can not have two likes on the same comment
+        """
+        with self.assertRaises(IntegrityError):
+            LikeCommentFactory.create(channel=self.like_comment.channel, comment=self.like_comment.comment)
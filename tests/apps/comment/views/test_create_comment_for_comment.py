@@ -51,6 +51,22 @@ class TestCreateCommentForComment(APITestCaseWithAuth):
 
         self.assertEqual(comments_of_comment.count(), 1)
 
+    def test_reply_count_of_the_comment_parent_increases(self):
+        """
+        Should verify that the reply count of the comment parent increases when the comment is created
+        """
+        self.client.post(
+            self.url,
+            {
+                'content': faker.paragraph()
+            },
+            format='json'
+        )
+
+        self.comment.refresh_from_db()
+
+        self.assertEqual(self.comment.reply_count, 1)
+
     def test_data_sent_is_invalid(self):
         """
         Should return an error response and a 400 status code if the data sent is invalid
@@ -25,7 +25,13 @@ class TestDislikeComment(APITestCaseWithAuth):
 
         response = self.client.post(url)
 
-        self.assertDictEqual(response.data, {'message': 'Dislike comment added'})
+        self.assertDictEqual(response.data, {
+            'message': 'Dislike comment added',
+            'liked': False,
+            'disliked': True,
+            'likes': 0,
+            'dislikes': 1
+        })
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
     def test_dislike_comment_added(self):
@@ -57,7 +63,13 @@ class TestDislikeComment(APITestCaseWithAuth):
 
         response = self.client.post(url)
 
-        self.assertDictEqual(response.data, {'message': 'Dislike comment removed'})
+        self.assertDictEqual(response.data, {
+            'message': 'Dislike comment removed',
+            'liked': False,
+            'disliked': False,
+            'likes': 0,
+            'dislikes': 0
+        })
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
     def test_dislike_comment_removed(self):
@@ -101,6 +113,27 @@ class TestDislikeComment(APITestCaseWithAuth):
 
         self.assertTrue(dislike_comment.exists())
 
+    def test_like_counters_of_the_comment_have_been_updated(self):
+        """
+        Should return and store the new totals of the comment when a like is converted to a dislike
+        """
+        LikeCommentFactory.create(
+            channel=self.user.current_channel,
+            comment=self.comment
+        )
+
+        url = reverse(self.url_name, kwargs={'comment_id': self.comment.pk})
+
+        response = self.client.post(url)
+
+        self.comment.refresh_from_db()
+
+        self.assertTrue(response.data.get('disliked'))
+        self.assertEqual(response.data.get('likes'), 0)
+        self.assertEqual(response.data.get('dislikes'), 1)
+        self.assertEqual(self.comment.like_count, 0)
+        self.assertEqual(self.comment.dislike_count, 1)
+
     def test_comment_does_not_exist(self):
         """
         Should return an error response and a 404 status code if the comment does not exist
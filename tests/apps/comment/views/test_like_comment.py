@@ -25,7 +25,13 @@ class TestLikeComment(APITestCaseWithAuth):
 
         response = self.client.post(url)
 
-        self.assertDictEqual(response.data, {'message': 'Like comment added'})
+        self.assertDictEqual(response.data, {
+            'message': 'Like comment added',
+            'liked': True,
+            'disliked': False,
+            'likes': 1,
+            'dislikes': 0
+        })
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
     def test_like_comment_added(self):
@@ -56,7 +62,13 @@ class TestLikeComment(APITestCaseWithAuth):
 
         response = self.client.post(url)
 
-        self.assertDictEqual(response.data, {'message': 'Like comment removed'})
+        self.assertDictEqual(response.data, {
+            'message': 'Like comment removed',
+            'liked': False,
+            'disliked': False,
+            'likes': 0,
+            'dislikes': 0
+        })
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
     def test_like_comment_removed(self):
@@ -100,6 +112,27 @@ class TestLikeComment(APITestCaseWithAuth):
 
         self.assertTrue(like_comment.exists())
 
+    def test_like_counters_of_the_comment_have_been_updated(self):
+        """
+        Should return and store the new totals of the comment when a dislike is converted to a like
+        """
+        DislikeCommentFactory.create(
+            channel=self.user.current_channel,
+            comment=self.comment
+        )
+        LikeCommentFactory.create(comment=self.comment)
+
+        url = reverse(self.url_name, kwargs={'comment_id': self.comment.pk})
+
+        response = self.client.post(url)
+
+        self.comment.refresh_from_db()
+
+        self.assertEqual(response.data.get('likes'), 2)
+        self.assertEqual(response.data.get('dislikes'), 0)
+        self.assertEqual(self.comment.like_count, 2)
+        self.assertEqual(self.comment.dislike_count, 0)
+
     def test_comment_does_not_exist(self):
         """
         Should return an error response and a 404 status code if the comment does not exist
@@ -35,6 +35,12 @@ class TestRetrieveCommentsOfComment(APITestCase):
             serialized_comments.data
         )
 
+    def test_retrieve_comments_of_comment_in_a_constant_number_of_queries(self):
+        CommentFactory.create_batch(5, comment=self.parent_comment)
+
+        with self.assertNumQueries(2):
+            self.client.get(self.url)
+
     def test_comment_does_not_exist(self):
         """
         Should return an error response and a 404 status code if the comment does not exist
@@ -5,11 +5,13 @@ from rest_framework.test import APITestCase
 
 from tests.factories.comment import CommentFactory, DislikeCommentFactory, LikeCommentFactory
 from tests.factories.video import VideoFactory
+from tests.factories.user_account import UserFactory
 
 from apps.comment.models import Comment
 from apps.video.models import Video
 
 from apps.comment.serializers import CommentListSerializer
+from apps.comment.views import RetrieveVideoCommentsView
 
 from youtube_clone.enums import CommentSortOptions
 
@@ -82,9 +84,9 @@ class TestRetrieveVideoComments(APITestCase):
         self.assertEqual(retrieved_comments_ids[1], second_comment_with_most_likes.pk)
         self.assertEqual(retrieved_comments_ids[2], comment_without_likes.pk)
 
-    def test_sort_by_TOP_COMMENTS_ignoring_dislikes(self):
+    def test_sort_by_TOP_COMMENTS_ranking_disliked_comments_last(self):
         """
-        Should verify that it returns the video comment sorted by TOP_COMMENTS ignoring the dislikes that the comment has
+        Should verify that it returns the video comment sorted by TOP_COMMENTS ranking the disliked comments after the liked ones
         """
         comment_with_most_dislikes: Comment = CommentFactory.create(video=self.video)
         DislikeCommentFactory.create_batch(2, comment=comment_with_most_dislikes)
@@ -99,6 +101,44 @@ class TestRetrieveVideoComments(APITestCase):
         self.assertEqual(retrieved_comments_ids[0], comment_with_most_likes.pk)
         self.assertEqual(retrieved_comments_ids[1], comment_with_most_dislikes.pk)
 
+    def test_sort_by_TOP_COMMENTS_weighing_likes_against_dislikes(self):
+        """
+        Should verify that a comment with fewer likes but no dislikes ranks above a comment with many likes and many dislikes
+        """
+        controversial_comment: Comment = CommentFactory.create(video=self.video)
+        LikeCommentFactory.create_batch(3, comment=controversial_comment)
+        DislikeCommentFactory.create_batch(4, comment=controversial_comment)
+
+        liked_comment: Comment = CommentFactory.create(video=self.video)
+        LikeCommentFactory.create_batch(2, comment=liked_comment)
+
+        response = self.client.get(self.url, {'sort_by': CommentSortOptions.TOP_COMMENTS.value})
+
+        retrieved_comments_ids = [dict(comment).get('id') for comment in response.data.get('data')]
+
+        self.assertEqual(retrieved_comments_ids, [liked_comment.pk, controversial_comment.pk])
+
+    def test_sort_by_TOP_COMMENTS_across_pages(self):
+        """
+        Should verify that the next page of TOP_COMMENTS continues after the last comment of the previous page
+        """
+        comments = CommentFactory.create_batch(3, video=self.video)
+
+        for likes, comment in enumerate(comments):
+            LikeCommentFactory.create_batch(likes, comment=comment)
+
+        first_page = self.client.get(self.url, {'sort_by': CommentSortOptions.TOP_COMMENTS.value, 'page_size': 2})
+        second_page = self.client.get(self.url, {
+            'sort_by': CommentSortOptions.TOP_COMMENTS.value,
+            'page_size': 2,
+            'cursor': first_page.data.get('next')
+        })
+
+        self.assertEqual(
+            [comment.get('id') for comment in first_page.data.get('data') + second_page.data.get('data')],
+            [comments[2].pk, comments[1].pk, comments[0].pk]
+        )
+
     def test_sort_by_NEWEST_FIRST(self):
         """
         Should return the video comments sorted by NEWEST_FIRST
@@ -125,6 +165,133 @@ class TestRetrieveVideoComments(APITestCase):
         for i, video in enumerate(video_comments):
             self.assertEqual(video.pk, retrieved_comments_ids[i])
 
+    def test_return_the_reactions_of_the_current_channel(self):
+        """
+        Should verify that the comments are marked as liked or disliked by the channel of the authenticated user
+        """
+        user = UserFactory.create()
+
+        liked_comment: Comment = CommentFactory.create(video=self.video)
+        LikeCommentFactory.create(comment=liked_comment, channel=user.current_channel)
+
+        disliked_comment: Comment = CommentFactory.create(video=self.video)
+        DislikeCommentFactory.create(comment=disliked_comment, channel=user.current_channel)
+
+        self.client.force_authenticate(user)
+
+        response = self.client.get(self.url)
+
+        retrieved_comments = {comment.get('id'): comment for comment in response.data.get('data')}
+
+        self.assertTrue(retrieved_comments[liked_comment.pk].get('liked'))
+        self.assertFalse(retrieved_comments[liked_comment.pk].get('disliked'))
+        self.assertFalse(retrieved_comments[disliked_comment.pk].get('liked'))
+        self.assertTrue(retrieved_comments[disliked_comment.pk].get('disliked'))
+
+    def test_retrieve_video_comments_in_a_constant_number_of_queries(self):
+        for comment in CommentFactory.create_batch(5, video=self.video):
+            LikeCommentFactory.create(comment=comment)
+            CommentFactory.create(video=self.video, comment=comment)
+
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.data.get('data')[0].get('comments'), 1)
+
+    def test_embed_the_first_replies_of_every_comment(self):
+        """
+        Should verify than every comment embeds its first replies, oldest first, when the replies parameter is given
+        """
+        comment: Comment = CommentFactory.create(video=self.video)
+        replies = CommentFactory.create_batch(3, video=self.video, comment=comment)
+        comment_without_replies: Comment = CommentFactory.create(video=self.video)
+
+        response = self.client.get(self.url, {'replies': 2})
+
+        retrieved_comments = {comment.get('id'): comment for comment in response.data.get('data')}
+
+        self.assertEqual(
+            [reply.get('id') for reply in retrieved_comments[comment.pk].get('replies').get('data')],
+            [replies[0].pk, replies[1].pk]
+        )
+        self.assertIsNotNone(retrieved_comments[comment.pk].get('replies').get('next'))
+        self.assertDictEqual(
+            retrieved_comments[comment_without_replies.pk].get('replies'),
+            {'data': [], 'next': None}
+        )
+
+    def test_continue_a_thread_from_the_comments_of_comment(self):
+        """
+        Should verify than the cursor of an embedded thread returns the remaining replies from the comments of comment
+        """
+        comment: Comment = CommentFactory.create(video=self.video)
+        replies = CommentFactory.create_batch(3, video=self.video, comment=comment)
+
+        response = self.client.get(self.url, {'replies': 2})
+
+        next_cursor = response.data.get('data')[0].get('replies').get('next')
+
+        response = self.client.get(
+            reverse('comments_of_comment', kwargs={'comment_id': comment.pk}),
+            {'cursor': next_cursor}
+        )
+
+        self.assertEqual(
+            [reply.get('id') for reply in response.data.get('data')],
+            [replies[2].pk]
+        )
+
+    def test_embed_all_the_replies_of_a_short_thread(self):
+        """
+        Should verify than a thread with no more replies than requested does not return a cursor
+        """
+        comment: Comment = CommentFactory.create(video=self.video)
+        CommentFactory.create_batch(2, video=self.video, comment=comment)
+
+        response = self.client.get(self.url, {'replies': 2})
+
+        thread = response.data.get('data')[0].get('replies')
+
+        self.assertEqual(len(thread.get('data')), 2)
+        self.assertIsNone(thread.get('next'))
+
+    def test_limit_the_embedded_replies(self):
+        """
+        Should verify than no more replies than the maximum are embedded in a comment
+        """
+        comment: Comment = CommentFactory.create(video=self.video)
+        CommentFactory.create_batch(
+            RetrieveVideoCommentsView.max_replies + 1,
+            video=self.video,
+            comment=comment
+        )
+
+        response = self.client.get(self.url, {'replies': RetrieveVideoCommentsView.max_replies + 5})
+
+        self.assertEqual(
+            len(response.data.get('data')[0].get('replies').get('data')),
+            RetrieveVideoCommentsView.max_replies
+        )
+
+    def test_do_not_embed_replies_by_default(self):
+        """
+        Should verify than the comments do not embed replies if the replies parameter is not given
+        """
+        CommentFactory.create(video=self.video)
+
+        response = self.client.get(self.url)
+
+        self.assertNotIn('replies', response.data.get('data')[0])
+
+    def test_retrieve_threads_in_a_constant_number_of_queries(self):
+        for comment in CommentFactory.create_batch(5, video=self.video):
+            CommentFactory.create_batch(3, video=self.video, comment=comment)
+
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url, {'replies': 2})
+
+        self.assertEqual(len(response.data.get('data')[0].get('replies').get('data')), 2)
+
     def test_video_does_not_exist(self):
         """
         Should return an error response and a 404 status code if the video does not exist
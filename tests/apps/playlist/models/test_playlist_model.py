@@ -1,8 +1,10 @@
+from django.db import connection
 from django.test import TestCase
 
-from tests.factories.playlist import PlaylistFactory
+from tests.factories.playlist import PlaylistFactory, PlaylistVideoFactory
+from tests.factories.video import VideoFactory
 
-from apps.playlist.models import Playlist
+from apps.playlist.models import Playlist, PlaylistVideo
 
 
 class TestPlaylistModel(TestCase):
@@ -32,3 +34,103 @@ class TestPlaylistModel(TestCase):
 
         self.assertEqual(playlists_ids[0], second_playlist.pk)
         self.assertEqual(playlists_ids[1], self.playlist.pk)
+
+    def test_video_fields_follow_the_added_videos(self):
+        """
+        Should verify that the video count, the first video and the thumbnail are updated when videos are added
+        """
+        playlist_video = PlaylistVideoFactory.create(playlist=self.playlist)
+        videos = VideoFactory.create_batch(2)
+
+        PlaylistVideo.objects.bulk_add(self.playlist, [video.pk for video in videos])
+
+        self.playlist.refresh_from_db()
+
+        self.assertEqual(self.playlist.video_count, 3)
+        self.assertEqual(self.playlist.first_video_id, playlist_video.video_id)
+        self.assertEqual(self.playlist.thumbnail_url, playlist_video.video.thumbnail)
+
+    def test_video_count_only_grows_by_the_inserted_videos(self):
+        """
+        Should verify that a video added by a concurrent request between the lookup and the insert is not counted twice
+        """
+        videos = VideoFactory.create_batch(2)
+        concurrent_videos = [videos[0]]
+
+        def add_video_concurrently(execute, sql, params, many, context):
+            if sql.lstrip().startswith('INSERT') and concurrent_videos:
+                PlaylistVideoFactory.create(playlist=self.playlist, video=concurrent_videos.pop())
+
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(add_video_concurrently):
+            new_playlist_videos = PlaylistVideo.objects.bulk_add(self.playlist, [video.pk for video in videos])
+
+        self.playlist.refresh_from_db()
+
+        self.assertEqual([playlist_video.video_id for playlist_video in new_playlist_videos], [videos[1].pk])
+        self.assertEqual(self.playlist.video_count, 2)
+
+    def test_video_fields_follow_the_removed_videos(self):
+        """
+        Should verify that the video count, the first video and the thumbnail are updated when videos are removed
+        """
+        playlist_videos = PlaylistVideoFactory.create_batch(4, playlist=self.playlist)
+
+        playlist_videos[0].delete()
+        PlaylistVideo.objects.bulk_remove(self.playlist, [playlist_videos[1].video_id])
+        playlist_videos[2].video.delete()
+
+        self.playlist.refresh_from_db()
+
+        self.assertEqual(self.playlist.video_count, 1)
+        self.assertEqual(self.playlist.first_video_id, playlist_videos[3].video_id)
+        self.assertEqual(self.playlist.thumbnail_url, playlist_videos[3].video.thumbnail)
+
+    def test_video_fields_follow_the_moved_videos(self):
+        """
+        Should verify that the first video and the thumbnail follow the video moved to the first position
+        """
+        playlist_videos = PlaylistVideoFactory.create_batch(3, playlist=self.playlist)
+
+        PlaylistVideo.objects.move(playlist_videos[2], 0)
+
+        self.playlist.refresh_from_db()
+
+        self.assertEqual(self.playlist.first_video_id, playlist_videos[2].video_id)
+        self.assertEqual(self.playlist.thumbnail_url, playlist_videos[2].video.thumbnail)
+
+    def test_thumbnail_follows_the_video_thumbnail(self):
+        """
+        Should verify that the thumbnail is the one of the chosen video and follows the edits of its video
+        """
+        playlist_videos = PlaylistVideoFactory.create_batch(2, playlist=self.playlist)
+
+        self.playlist.video_thumbnail = playlist_videos[1]
+        self.playlist.save()
+        Playlist.objects.update_video_fields([self.playlist.pk])
+
+        video = playlist_videos[1].video
+        video.thumbnail = 'https://example.com/thumbnail.png'
+        video.save()
+
+        self.playlist.refresh_from_db()
+
+        self.assertEqual(self.playlist.thumbnail_url, 'https://example.com/thumbnail.png')
+
+    def test_saving_a_stale_playlist_keeps_the_video_fields(self):
+        """
+        Should verify that saving a playlist loaded before its videos changed does not revert the video fields
+        """
+        stale_playlist = Playlist.objects.get(pk=self.playlist.pk)
+
+        playlist_video = PlaylistVideoFactory.create(playlist=self.playlist)
+
+        stale_playlist.name = 'Renamed'
+        stale_playlist.save()
+
+        self.playlist.refresh_from_db()
+
+        self.assertEqual(self.playlist.name, 'Renamed')
+        self.assertEqual(self.playlist.video_count, 1)
+        self.assertEqual(self.playlist.first_video_id, playlist_video.video_id)
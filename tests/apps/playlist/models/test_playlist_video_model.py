@@ -1,8 +1,12 @@
+from django.db import IntegrityError, connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from tests.factories.playlist import PlaylistFactory, PlaylistVideoFactory
+from tests.factories.video import VideoFactory
 
 from apps.playlist.models import Playlist, PlaylistVideo
+from apps.video.models import Video
 
 
 class TestPlaylistVideoModel(TestCase):
@@ -45,6 +49,136 @@ class TestPlaylistVideoModel(TestCase):
         for new_position, playlist_video in enumerate(playlist_videos):
             self.assertEqual(playlist_video.position, new_position)
 
+    def test_deleting_a_playlist_video_only_deletes_its_row(self):
+        """
+        Should verify that the other playlist videos keep their ranks and only the one in the last slot is rewritten when a playlist video is deleted
+        """
+        PlaylistVideoFactory.create_batch(2, playlist=self.playlist)
+
+        ranks = dict(PlaylistVideo.objects.exclude(pk=self.playlist_video.pk).values_list('pk', 'rank'))
+
+        with CaptureQueriesContext(connection) as context:
+            PlaylistVideo.objects.filter(pk=self.playlist_video.pk).first().delete()
+
+        updates = [
+            query for query in context.captured_queries
+            if query['sql'].lstrip().replace('"', '').startswith('UPDATE playlist_playlistvideo')
+        ]
+
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(dict(PlaylistVideo.objects.values_list('pk', 'rank')), ranks)
+
+    def assert_dense_slots(self, playlist: Playlist):
+        playlist.refresh_from_db()
+
+        self.assertCountEqual(
+            PlaylistVideo.objects.filter(playlist=playlist).values_list('slot', flat=True),
+            range(playlist.video_count)
+        )
+
+    def test_new_playlist_videos_take_the_next_slots(self):
+        """
+        Should verify that the created and the bulk added playlist videos take the slots after the last one
+        """
+        second_playlist_video: PlaylistVideo = PlaylistVideoFactory.create(playlist=self.playlist)
+        added_playlist_videos = PlaylistVideo.objects.bulk_add(
+            self.playlist,
+            [video.pk for video in VideoFactory.create_batch(2)]
+        )
+
+        self.assertEqual(
+            [playlist_video.slot for playlist_video in [self.playlist_video, second_playlist_video, *added_playlist_videos]],
+            [0, 1, 2, 3]
+        )
+        self.assert_dense_slots(self.playlist)
+
+    def test_slots_stay_dense_when_a_playlist_video_is_deleted(self):
+        """
+        Should verify that the playlist video in the last slot takes the slot of a deleted playlist video
+        """
+        playlist_videos = PlaylistVideoFactory.create_batch(3, playlist=self.playlist)
+
+        self.playlist_video.delete()
+
+        playlist_videos[2].refresh_from_db()
+
+        self.assertEqual(playlist_videos[2].slot, 0)
+        self.assert_dense_slots(self.playlist)
+
+    def test_slots_stay_dense_when_playlist_videos_are_bulk_removed(self):
+        """
+        Should verify that the slots of the bulk removed playlist videos are taken by the playlist videos in the last slots
+        """
+        playlist_videos = [self.playlist_video, *PlaylistVideoFactory.create_batch(5, playlist=self.playlist)]
+
+        removed_videos = PlaylistVideo.objects.bulk_remove(
+            self.playlist,
+            [playlist_videos[0].video_id, playlist_videos[2].video_id, playlist_videos[5].video_id]
+        )
+
+        self.assertEqual(removed_videos, 3)
+        self.assert_dense_slots(self.playlist)
+
+    def test_slots_stay_dense_when_the_videos_are_deleted(self):
+        """
+        Should verify that the slots stay dense when the deletion of videos cascades to several playlist videos of the playlist
+        """
+        playlist_videos = [self.playlist_video, *PlaylistVideoFactory.create_batch(5, playlist=self.playlist)]
+
+        Video.objects.filter(pk__in=[playlist_videos[1].video_id, playlist_videos[3].video_id, playlist_videos[4].video_id]).delete()
+
+        self.assert_dense_slots(self.playlist)
+        self.assertEqual(self.playlist.video_count, 3)
+
+    def test_move_a_playlist_video(self):
+        """
+        Should verify that a moved playlist video takes the new position and only its row is updated
+        """
+        playlist_videos = [self.playlist_video] + PlaylistVideoFactory.create_batch(3, playlist=self.playlist)
+
+        with CaptureQueriesContext(connection) as context:
+            PlaylistVideo.objects.move(playlist_videos[0], 2)
+
+        updates = [
+            query['sql'] for query in context.captured_queries
+            if query['sql'].startswith('UPDATE "playlist_playlistvideo"')
+        ]
+
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(
+            list(PlaylistVideo.objects.filter(playlist=self.playlist).values_list('pk', flat=True)),
+            [playlist_videos[1].pk, playlist_videos[2].pk, playlist_videos[0].pk, playlist_videos[3].pk]
+        )
+
+    def test_move_a_playlist_video_to_the_ends(self):
+        """
+        Should verify that a playlist video can be moved to the first and to the last position
+        """
+        playlist_videos = [self.playlist_video] + PlaylistVideoFactory.create_batch(2, playlist=self.playlist)
+
+        PlaylistVideo.objects.move(playlist_videos[2], 0)
+        PlaylistVideo.objects.move(playlist_videos[1], 2)
+
+        self.assertEqual(
+            list(PlaylistVideo.objects.filter(playlist=self.playlist).values_list('pk', flat=True)),
+            [playlist_videos[2].pk, playlist_videos[0].pk, playlist_videos[1].pk]
+        )
+
+    def test_rebalance_the_ranks_when_they_run_out_of_room(self):
+        """
+        Should verify that the order of the playlist videos is kept when the ranks between two videos run out of room
+        """
+        playlist_videos = [self.playlist_video] + PlaylistVideoFactory.create_batch(3, playlist=self.playlist)
+
+        for _ in range(60):
+            PlaylistVideo.objects.move(playlist_videos[3], 1)
+            PlaylistVideo.objects.move(playlist_videos[2], 1)
+
+        self.assertEqual(
+            list(PlaylistVideo.objects.filter(playlist=self.playlist).values_list('pk', flat=True)),
+            [playlist_videos[0].pk, playlist_videos[2].pk, playlist_videos[3].pk, playlist_videos[1].pk]
+        )
+
     def test_video_thumbnail_of_the_playlist_has_been_updated_to_null(self):
         """
         Should verify if the video_thumbnail of the playlist has been updated to null before deleting last video from the playlist
@@ -62,3 +196,10 @@ class TestPlaylistVideoModel(TestCase):
         self.playlist_video.delete()
 
         self.assertEqual(self.playlist.video_thumbnail, second_playlist_video)
+
+    def test_a_video_can_only_be_once_in_a_playlist(self):
+        """
+        Should verify that a video can not be added twice to the same playlist
+        """
+        with self.assertRaises(IntegrityError):
+            PlaylistVideoFactory.create(playlist=self.playlist, video=self.playlist_video.video)
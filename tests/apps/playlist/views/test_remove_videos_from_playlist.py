@@ -0,0 +1,120 @@
+from django.urls import reverse
+
+from rest_framework import status
+
+from tests.setups import APITestCaseWithAuth
+
+from tests.factories.playlist import PlaylistFactory, PlaylistVideoFactory
+
+from apps.playlist.models import Playlist, PlaylistVideo
+
+
+class TestRemoveVideosFromPlaylist(APITestCaseWithAuth):
+    def setUp(self):
+        super().setUp()
+        self.playlist: Playlist = PlaylistFactory.create(channel=self.user.current_channel)
+
+        self.playlist_videos = PlaylistVideoFactory.create_batch(4, playlist=self.playlist)
+
+        self.url_name = 'remove_videos_from_playlist'
+        self.url = reverse(self.url_name, kwargs={'playlist_id': self.playlist.pk})
+
+    def test_success_response(self):
+        """
+        Should return a success response with the number of removed videos if the videos have been removed from the playlist
+        """
+        response = self.client.post(
+            self.url,
+            {'video_ids': [self.playlist_videos[0].video_id, self.playlist_videos[2].video_id]},
+            format='json'
+        )
+
+        self.assertDictEqual(response.data, {'message': f'Removed from {self.playlist.name}', 'removed': 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_videos_have_been_removed_keeping_the_order_of_the_rest(self):
+        """
+        Should verify that the videos have been removed and the other videos keep their order and dense positions
+        """
+        self.client.post(
+            self.url,
+            {'video_ids': [self.playlist_videos[0].video_id, self.playlist_videos[2].video_id]},
+            format='json'
+        )
+
+        remaining_playlist_videos = PlaylistVideo.objects.filter(playlist=self.playlist)
+
+        self.assertEqual(
+            [(playlist_video.pk, playlist_video.position) for playlist_video in remaining_playlist_videos],
+            [(self.playlist_videos[1].pk, 0), (self.playlist_videos[3].pk, 1)]
+        )
+
+    def test_video_thumbnail_of_the_playlist_is_replaced_if_it_is_removed(self):
+        """
+        Should verify that the video thumbnail of the playlist becomes the first remaining video if it has been removed
+        """
+        self.playlist.video_thumbnail = self.playlist_videos[0]
+        self.playlist.save()
+
+        self.client.post(self.url, {'video_ids': [self.playlist_videos[0].video_id]}, format='json')
+
+        playlist_updated = Playlist.objects.get(id=self.playlist.pk)
+
+        self.assertEqual(playlist_updated.video_thumbnail_id, self.playlist_videos[1].pk)
+
+    def test_ignore_the_videos_that_are_not_in_the_playlist(self):
+        """
+        Should verify that the videos of other playlists are not removed
+        """
+        other_playlist_video: PlaylistVideo = PlaylistVideoFactory.create()
+
+        response = self.client.post(self.url, {'video_ids': [other_playlist_video.video_id]}, format='json')
+
+        self.assertEqual(response.data.get('removed'), 0)
+        self.assertTrue(PlaylistVideo.objects.filter(pk=other_playlist_video.pk).exists())
+
+    def test_playlist_updates_its_updated_at(self):
+        """
+        Should verify if the playlist updates its updated_at field
+        """
+        self.client.post(self.url, {'video_ids': [self.playlist_videos[0].video_id]}, format='json')
+
+        playlist_updated = Playlist.objects.get(id=self.playlist.pk)
+
+        self.assertNotEqual(self.playlist.updated_at, playlist_updated.updated_at)
+
+    def test_another_channel_wants_to_remove_videos_from_a_playlist_it_does_not_own(self):
+        """
+        Should return an error response and a 401 status code if the playlist is not owned by the channel
+        """
+        not_own_playlist_video: PlaylistVideo = PlaylistVideoFactory.create()
+
+        response = self.client.post(
+            reverse(self.url_name, kwargs={'playlist_id': not_own_playlist_video.playlist_id}),
+            {'video_ids': [not_own_playlist_video.video_id]},
+            format='json'
+        )
+
+        self.assertDictEqual(response.data, {'message': "You can't remove a video from a playlist that you don't own"})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertTrue(PlaylistVideo.objects.filter(pk=not_own_playlist_video.pk).exists())
+
+    def test_playlist_does_not_exist(self):
+        """
+        Should return an error response and a 404 status code if the playlist does not exist
+        """
+        self.playlist.delete()
+
+        response = self.client.post(self.url, {'video_ids': [1]}, format='json')
+
+        self.assertDictEqual(response.data, {'message': 'The playlist does not exist'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_video_ids_are_invalid(self):
+        """
+        Should return an error response and a 400 status code if the video IDs are not a list of numbers
+        """
+        response = self.client.post(self.url, {'video_ids': []}, format='json')
+
+        self.assertIn('video_ids', response.data.get('errors'))
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
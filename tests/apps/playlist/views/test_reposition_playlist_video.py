@@ -369,7 +369,7 @@ class TestRepositionPlaylistVideo(APITestCaseWithAuth):
         )
 
         playlist_updated = Playlist.objects.get(pk=self.playlist.pk)
-        first_playlist_video = PlaylistVideo.objects.get(position=0, playlist=self.playlist)
+        first_playlist_video = PlaylistVideo.objects.filter(playlist=self.playlist).first()
 
         self.assertEqual(playlist_updated.video_thumbnail.pk, first_playlist_video.pk)
 
@@ -107,3 +107,25 @@ class TestRetrieveChannelPlaylists(APITestCaseWithAuth):
         self.assertIn(channel_private_playlist.pk, retrieved_channel_playlists)
         self.assertIn(channel_public_playlist.pk, retrieved_channel_playlists)
         self.assertNotIn(channel_playlist_without_video.pk, retrieved_channel_playlists)
+
+    def test_return_channel_playlists_in_a_constant_number_of_queries(self):
+        """
+        Should verify that the playlists are retrieved with the same number of queries whatever their videos
+        """
+        playlists: list[Playlist] = PlaylistFactory.create_batch(
+            3,
+            channel=self.channel,
+            visibility=Visibility.PUBLIC
+        )
+
+        for playlist in playlists:
+            PlaylistVideoFactory.create_batch(2, playlist=playlist)
+
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [playlist.get('total_videos') for playlist in response.data.get('data')],
+            [2, 2, 2]
+        )
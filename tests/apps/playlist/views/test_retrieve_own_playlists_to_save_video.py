@@ -0,0 +1,67 @@
+from django.urls import reverse
+
+from rest_framework import status
+
+from tests.setups import APITestCaseWithAuth
+
+from tests.factories.playlist import PlaylistFactory, PlaylistVideoFactory
+from tests.factories.video import VideoFactory
+
+from apps.playlist.models import Playlist
+from apps.video.models import Video
+
+
+class TestRetrieveOwnPlaylistsToSaveVideo(APITestCaseWithAuth):
+    def setUp(self):
+        super().setUp()
+
+        self.video: Video = VideoFactory.create()
+
+        self.url_name = 'own_playlists_video_saved'
+        self.url = reverse(self.url_name, kwargs={'video_id': self.video.pk})
+
+    def test_return_own_playlists_with_the_video_saved_flag(self):
+        """
+        Should verify that it returns the own playlists flagging the ones where the video is saved
+        """
+        playlist_with_video: Playlist = PlaylistFactory.create(channel=self.user.current_channel)
+        PlaylistVideoFactory.create(playlist=playlist_with_video, video=self.video)
+
+        playlist_without_video: Playlist = PlaylistFactory.create(channel=self.user.current_channel)
+        PlaylistVideoFactory.create(playlist=playlist_without_video)
+
+        PlaylistFactory.create()
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertDictEqual(
+            {playlist['id']: playlist['video_is_saved'] for playlist in response.data.get('data')},
+            {playlist_with_video.pk: True, playlist_without_video.pk: False}
+        )
+
+    def test_return_own_playlists_in_a_constant_number_of_queries(self):
+        """
+        Should verify that the playlists are retrieved with the same number of queries whatever their number
+        """
+        playlists: list[Playlist] = PlaylistFactory.create_batch(5, channel=self.user.current_channel)
+
+        for playlist in playlists[:3]:
+            PlaylistVideoFactory.create(playlist=playlist, video=self.video)
+
+        # The user, the video and the annotated playlists
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url)
+
+        self.assertEqual(len(response.data.get('data')), 5)
+
+    def test_video_does_not_exist(self):
+        """
+        Should return an error response and a 404 status code if the video does not exist
+        """
+        self.video.delete()
+
+        response = self.client.get(self.url)
+
+        self.assertDictEqual(response.data, {'message': 'The video does not exist'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -3,6 +3,7 @@ from django.urls import reverse
 from rest_framework import status
 
 from tests.setups import APITestCaseWithAuth
+from tests.utils import encode_cursor
 
 from tests.factories.playlist import PlaylistFactory, PlaylistVideoFactory
 
@@ -71,6 +72,139 @@ class TestRetrieveVideosFromAPlaylist(APITestCaseWithAuth):
             serialized_playlist_video.data
         )
 
+    def test_return_the_videos_from_a_playlist_in_a_constant_number_of_queries(self):
+        """
+        Should retrieve the videos of a playlist without a query per playlist video
+        """
+        playlist: Playlist = PlaylistFactory.create(visibility=Visibility.PUBLIC)
+
+        PlaylistVideoFactory.create_batch(5, playlist=playlist)
+
+        url = reverse(self.url_name, kwargs={'playlist_id': playlist.pk})
+
+        with self.assertNumQueries(3):
+            self.client.get(url)
+
+    def test_return_dense_positions_across_pages(self):
+        """
+        Should verify that the positions of the playlist videos are dense and continue on the next page
+        """
+        playlist: Playlist = PlaylistFactory.create(visibility=Visibility.PUBLIC)
+
+        playlist_videos = PlaylistVideoFactory.create_batch(4, playlist=playlist)
+        PlaylistVideo.objects.move(playlist_videos[3], 1)
+        playlist_videos[0].delete()
+
+        url = reverse(self.url_name, kwargs={'playlist_id': playlist.pk})
+
+        first_page = self.client.get(url, {'page_size': 2})
+        second_page = self.client.get(url, {'page_size': 2, 'cursor': first_page.data.get('next')})
+
+        retrieved_playlist_videos = first_page.data.get('data') + second_page.data.get('data')
+
+        self.assertEqual(
+            [(playlist_video.get('id'), playlist_video.get('position')) for playlist_video in retrieved_playlist_videos],
+            [(playlist_videos[3].pk, 0), (playlist_videos[1].pk, 1), (playlist_videos[2].pk, 2)]
+        )
+
+    def get_shuffled_playlist_videos(self, url: str, seed: str, page_size: int) -> list:
+        playlist_videos = []
+        params = {'seed': seed, 'page_size': page_size}
+
+        while True:
+            response = self.client.get(url, params)
+            playlist_videos += response.data.get('data')
+
+            if response.data.get('next') is None:
+                return playlist_videos
+
+            params['cursor'] = response.data.get('next')
+
+    def test_return_the_videos_from_a_playlist_shuffled_by_a_seed(self):
+        """
+        Should verify that a seed returns every video of the playlist once, in the same order for the same seed
+        """
+        playlist: Playlist = PlaylistFactory.create(visibility=Visibility.PUBLIC)
+
+        playlist_videos = PlaylistVideoFactory.create_batch(12, playlist=playlist)
+
+        url = reverse(self.url_name, kwargs={'playlist_id': playlist.pk})
+
+        shuffled_playlist_videos = self.get_shuffled_playlist_videos(url, 'first seed', 5)
+        shuffled_ids = [playlist_video.get('id') for playlist_video in shuffled_playlist_videos]
+
+        self.assertCountEqual(shuffled_ids, [playlist_video.pk for playlist_video in playlist_videos])
+        self.assertEqual(
+            [playlist_video.get('position') for playlist_video in shuffled_playlist_videos],
+            list(range(12))
+        )
+        self.assertEqual(
+            [playlist_video.get('id') for playlist_video in self.get_shuffled_playlist_videos(url, 'first seed', 3)],
+            shuffled_ids
+        )
+        self.assertNotEqual(
+            [playlist_video.get('id') for playlist_video in self.get_shuffled_playlist_videos(url, 'second seed', 5)],
+            shuffled_ids
+        )
+
+    def test_shuffled_cursor_is_rejected_when_videos_are_removed(self):
+        """
+        Should return a 404 status code if the playlist changed its size since the first page of the shuffled videos
+        """
+        playlist: Playlist = PlaylistFactory.create(visibility=Visibility.PUBLIC)
+
+        playlist_videos = PlaylistVideoFactory.create_batch(6, playlist=playlist)
+
+        url = reverse(self.url_name, kwargs={'playlist_id': playlist.pk})
+
+        first_page = self.client.get(url, {'seed': 'seed', 'page_size': 3})
+
+        playlist_videos[0].delete()
+
+        response = self.client.get(url, {'seed': 'seed', 'page_size': 3, 'cursor': first_page.data.get('next')})
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_shuffled_videos_with_a_cursor_of_another_size(self):
+        """
+        Should return a 404 status code if the size in the cursor of the shuffled videos is not the size of the playlist
+        """
+        playlist: Playlist = PlaylistFactory.create(visibility=Visibility.PUBLIC)
+
+        PlaylistVideoFactory.create_batch(3, playlist=playlist)
+
+        url = reverse(self.url_name, kwargs={'playlist_id': playlist.pk})
+
+        for cursor in ([0, 2 ** 70], [0, 4], [4, 3]):
+            response = self.client.get(url, {'seed': 'seed', 'cursor': encode_cursor(cursor)})
+
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_return_the_shuffled_videos_in_a_constant_number_of_queries(self):
+        """
+        Should retrieve the shuffled videos of a playlist without a query per playlist video
+        """
+        playlist: Playlist = PlaylistFactory.create(visibility=Visibility.PUBLIC)
+
+        PlaylistVideoFactory.create_batch(5, playlist=playlist)
+
+        url = reverse(self.url_name, kwargs={'playlist_id': playlist.pk})
+
+        with self.assertNumQueries(2):
+            self.client.get(url, {'seed': 'seed'})
+
+    def test_shuffled_videos_with_an_invalid_cursor(self):
+        """
+        Should return a 404 status code if the cursor of the shuffled videos is not valid
+        """
+        playlist: Playlist = PlaylistFactory.create(visibility=Visibility.PUBLIC)
+
+        url = reverse(self.url_name, kwargs={'playlist_id': playlist.pk})
+
+        response = self.client.get(url, {'seed': 'seed', 'cursor': 'WyJhIiwgMV0='})
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
     def test_the_playlist_is_PRIVATE_and_not_authenticated(self):
         """
         Should return an error response and a 401 status code if a channel wants to retrieve the videos from a PRIVATE playlist and i am not authenticated
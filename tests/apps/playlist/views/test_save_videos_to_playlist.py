@@ -0,0 +1,167 @@
+from django.db import connection
+from django.urls import reverse
+
+from rest_framework import status
+
+from tests.setups import APITestCaseWithAuth
+
+from tests.factories.playlist import PlaylistFactory, PlaylistVideoFactory
+from tests.factories.video import VideoFactory
+
+from apps.playlist.models import Playlist, PlaylistVideo
+
+
+class TestSaveVideosToPlaylist(APITestCaseWithAuth):
+    def setUp(self):
+        super().setUp()
+        self.playlist: Playlist = PlaylistFactory.create(channel=self.user.current_channel)
+
+        self.videos = VideoFactory.create_batch(3)
+
+        self.url_name = 'save_videos_to_playlist'
+        self.url = reverse(self.url_name, kwargs={'playlist_id': self.playlist.pk})
+
+    def test_success_response(self):
+        """
+        Should return a success response with the number of added videos if the videos have been saved to the playlist
+        """
+        response = self.client.post(
+            self.url,
+            {'video_ids': [video.pk for video in self.videos]},
+            format='json'
+        )
+
+        self.assertDictEqual(response.data, {'message': f'Added to {self.playlist.name}', 'added': 3})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_videos_have_been_saved_in_the_given_order_after_the_playlist_videos(self):
+        """
+        Should verify that the videos are appended to the playlist in the given order
+        """
+        playlist_video: PlaylistVideo = PlaylistVideoFactory.create(playlist=self.playlist)
+
+        self.client.post(
+            self.url,
+            {'video_ids': [self.videos[2].pk, self.videos[0].pk, self.videos[1].pk]},
+            format='json'
+        )
+
+        self.assertEqual(
+            list(PlaylistVideo.objects.filter(playlist=self.playlist).values_list('video_id', flat=True)),
+            [playlist_video.video_id, self.videos[2].pk, self.videos[0].pk, self.videos[1].pk]
+        )
+
+    def test_skip_the_videos_already_in_the_playlist(self):
+        """
+        Should verify that the videos already in the playlist and the repeated video IDs are skipped
+        """
+        PlaylistVideoFactory.create(playlist=self.playlist, video=self.videos[0])
+
+        response = self.client.post(
+            self.url,
+            {'video_ids': [self.videos[0].pk, self.videos[1].pk, self.videos[1].pk]},
+            format='json'
+        )
+
+        self.assertEqual(response.data.get('added'), 1)
+        self.assertEqual(PlaylistVideo.objects.filter(playlist=self.playlist).count(), 2)
+
+    def test_save_videos_in_a_constant_number_of_queries(self):
+        """
+        Should verify that the videos are saved with the same number of queries whatever their number
+        """
+        videos = VideoFactory.create_batch(20)
+
+        with self.assertNumQueries(13):
+            self.client.post(self.url, {'video_ids': [video.pk for video in videos]}, format='json')
+
+    def test_playlist_updates_its_updated_at(self):
+        """
+        Should verify if the playlist updates its updated_at field
+        """
+        self.client.post(self.url, {'video_ids': [self.videos[0].pk]}, format='json')
+
+        playlist_updated = Playlist.objects.get(id=self.playlist.pk)
+
+        self.assertNotEqual(self.playlist.updated_at, playlist_updated.updated_at)
+
+    def test_another_channel_wants_to_save_videos_to_the_playlist_that_he_does_not_own(self):
+        """
+        Should return an error response and a 401 status code if the playlist is not owned by the channel
+        """
+        not_own_playlist: Playlist = PlaylistFactory.create()
+
+        response = self.client.post(
+            reverse(self.url_name, kwargs={'playlist_id': not_own_playlist.pk}),
+            {'video_ids': [self.videos[0].pk]},
+            format='json'
+        )
+
+        self.assertDictEqual(response.data, {'message': 'You are not a owner of this playlist'})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertFalse(PlaylistVideo.objects.filter(playlist=not_own_playlist).exists())
+
+    def test_playlist_does_not_exist(self):
+        """
+        Should return an error response and a 404 status code if the playlist does not exist
+        """
+        self.playlist.delete()
+
+        response = self.client.post(self.url, {'video_ids': [self.videos[0].pk]}, format='json')
+
+        self.assertDictEqual(response.data, {'message': 'The playlist does not exist'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_some_of_the_videos_do_not_exist(self):
+        """
+        Should return an error response and a 404 status code without saving any video if some of the videos do not exist
+        """
+        non_exist_video_id = self.videos[2].pk
+        self.videos[2].delete()
+
+        response = self.client.post(
+            self.url,
+            {'video_ids': [self.videos[0].pk, non_exist_video_id]},
+            format='json'
+        )
+
+        self.assertDictEqual(response.data, {'message': 'Some of the videos do not exist'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertFalse(PlaylistVideo.objects.filter(playlist=self.playlist).exists())
+
+    def test_a_video_is_deleted_after_the_check(self):
+        """
+        Should return an error response and a 404 status code without saving any video if a video is deleted between the check and the insert
+        """
+        deleted_videos = [self.videos[1]]
+
+        def delete_video_concurrently(execute, sql, params, many, context):
+            if sql.lstrip().startswith('INSERT INTO playlist_playlistvideo') and deleted_videos:
+                deleted_videos.pop().delete()
+
+            return execute(sql, params, many, context)
+
+        with connection.cursor() as cursor:
+            # The foreign keys are checked on commit, which never happens in a test case
+            cursor.execute('SET CONSTRAINTS ALL IMMEDIATE')
+
+        with connection.execute_wrapper(delete_video_concurrently):
+            response = self.client.post(
+                self.url,
+                {'video_ids': [video.pk for video in self.videos]},
+                format='json'
+            )
+
+        self.assertDictEqual(response.data, {'message': 'Some of the videos do not exist'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertFalse(PlaylistVideo.objects.filter(playlist=self.playlist).exists())
+
+    def test_video_ids_are_invalid(self):
+        """
+        Should return an error response and a 400 status code if the video IDs are not a list of numbers
+        """
+        for video_ids in ([], ['video'], 'video'):
+            response = self.client.post(self.url, {'video_ids': video_ids}, format='json')
+
+            self.assertIn('video_ids', response.data.get('errors'))
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,71 @@
+from django.test import TestCase, override_settings
+
+from tests.factories.channel import ChannelFactory, ChannelSubscriptionFactory
+from tests.factories.video import VideoFactory
+
+from apps.channel.models import Channel, ChannelSubscription
+from apps.video.models import InboxVideo
+
+
+class TestInboxVideoModel(TestCase):
+    def setUp(self):
+        self.channel: Channel = ChannelFactory.create()
+        self.subscriber: Channel = ChannelFactory.create()
+
+    def get_inbox_video_ids(self, channel: Channel):
+        return set(InboxVideo.objects.filter(subscriber=channel).values_list('video_id', flat=True))
+
+    def test_published_video_is_written_into_the_subscriber_inboxes(self):
+        """
+        Should verify that a published video is written into the inbox of every subscriber of its channel
+        """
+        other_subscriber: Channel = ChannelFactory.create()
+        ChannelSubscriptionFactory.create(subscriber=self.subscriber, subscribing=self.channel)
+        ChannelSubscriptionFactory.create(subscriber=other_subscriber, subscribing=self.channel)
+
+        video = VideoFactory.create(channel=self.channel)
+        VideoFactory.create()
+
+        self.assertEqual(self.get_inbox_video_ids(self.subscriber), {video.pk})
+        self.assertEqual(self.get_inbox_video_ids(other_subscriber), {video.pk})
+
+    @override_settings(SUBSCRIPTION_FEED={'FAN_OUT_LIMIT': 1, 'BACKFILL_SIZE': 30})
+    def test_videos_of_channels_over_the_fan_out_limit_are_not_written(self):
+        """
+        Should verify that the videos of a channel with at least FAN_OUT_LIMIT subscribers are not written into inboxes
+        """
+        ChannelSubscriptionFactory.create(subscriber=self.subscriber, subscribing=self.channel)
+
+        VideoFactory.create(channel=self.channel)
+
+        self.assertFalse(InboxVideo.objects.exists())
+
+        self.channel.refresh_from_db()
+
+        self.assertTrue(self.channel.fan_out_skipped)
+
+    @override_settings(SUBSCRIPTION_FEED={'FAN_OUT_LIMIT': 10000, 'BACKFILL_SIZE': 2})
+    def test_new_subscription_backfills_the_latest_videos(self):
+        """
+        Should verify that subscribing to a channel writes its latest BACKFILL_SIZE videos into the inbox
+        """
+        videos = [VideoFactory.create(channel=self.channel) for _ in range(3)]
+
+        ChannelSubscriptionFactory.create(subscriber=self.subscriber, subscribing=self.channel)
+
+        self.assertEqual(self.get_inbox_video_ids(self.subscriber), {videos[1].pk, videos[2].pk})
+
+    def test_removed_subscription_removes_the_channel_videos(self):
+        """
+        Should verify that unsubscribing from a channel removes its videos from the inbox
+        """
+        other_channel: Channel = ChannelFactory.create()
+        ChannelSubscriptionFactory.create(subscriber=self.subscriber, subscribing=self.channel)
+        ChannelSubscriptionFactory.create(subscriber=self.subscriber, subscribing=other_channel)
+
+        VideoFactory.create(channel=self.channel)
+        other_channel_video = VideoFactory.create(channel=other_channel)
+
+        ChannelSubscription.objects.get(subscriber=self.subscriber, subscribing=self.channel).delete()
+
+        self.assertEqual(self.get_inbox_video_ids(self.subscriber), {other_channel_video.pk})
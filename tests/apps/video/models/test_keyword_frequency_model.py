@@ -0,0 +1,59 @@
+from django.test import TestCase
+
+from tests.factories.video import VideoFactory
+
+from apps.video.models import Video, KeywordFrequency
+
+
+class TestKeywordFrequencyModel(TestCase):
+    def get_video_count(self, keyword: str) -> int:
+        keyword_frequency = KeywordFrequency.objects.filter(keyword=keyword).first()
+
+        return keyword_frequency.video_count if keyword_frequency is not None else 0
+
+    def test_str_of_the_keyword_frequency_model_is_the_keyword(self):
+        """
+        Should verify if the __str__() of the keyword frequency model is the keyword
+        """
+        VideoFactory.create(title='Pasta', description='Pasta')
+
+        self.assertEqual(KeywordFrequency.objects.get(keyword='pasta').__str__(), 'pasta')
+
+    def test_indexed_videos_are_counted_by_keyword(self):
+        """
+        Should verify that every keyword counts the videos that contain it and that every indexed video is counted
+        """
+        VideoFactory.create_batch(2, title='Pasta', description='Tomato')
+        VideoFactory.create(title='Pasta', description='Cheese')
+
+        self.assertEqual(self.get_video_count('pasta'), 3)
+        self.assertEqual(self.get_video_count('tomato'), 2)
+        self.assertEqual(self.get_video_count('chees'), 1)
+        self.assertEqual(self.get_video_count(KeywordFrequency.ALL_VIDEOS), 3)
+
+    def test_edited_videos_move_their_counts_to_their_new_keywords(self):
+        """
+        Should verify that editing a video counts it in its new keywords only, and once in the indexed videos
+        """
+        video: Video = VideoFactory.create(title='Pasta', description='Tomato')
+
+        video.description = 'Cheese'
+        video.save()
+
+        self.assertEqual(self.get_video_count('pasta'), 1)
+        self.assertEqual(self.get_video_count('tomato'), 0)
+        self.assertEqual(self.get_video_count('chees'), 1)
+        self.assertEqual(self.get_video_count(KeywordFrequency.ALL_VIDEOS), 1)
+
+    def test_deleted_videos_are_no_longer_counted(self):
+        """
+        Should verify that deleting a video removes it from the counts of its keywords and of the indexed videos
+        """
+        video: Video = VideoFactory.create(title='Pasta', description='Tomato')
+        VideoFactory.create(title='Pasta', description='Cheese')
+
+        video.delete()
+
+        self.assertEqual(self.get_video_count('pasta'), 1)
+        self.assertEqual(self.get_video_count('tomato'), 0)
+        self.assertEqual(self.get_video_count(KeywordFrequency.ALL_VIDEOS), 1)
@@ -1,3 +1,4 @@
+from django.db import IntegrityError
 from django.test import TestCase
 
 from tests.factories.video import LikeVideoFactory
@@ -21,3 +22,10 @@ class TestLikedVideoModel(TestCase):
         """
         like_video = LikedVideo.objects.filter(id=self.like_video.pk)
         self.assertTrue(like_video.exists())
+
+    def test_a_channel_can_only_like_a_video_once(self):
+        """
+        Should verify that a channel can not have two likes on the same video
+        """
+        with self.assertRaises(IntegrityError):
+            LikeVideoFactory.create(channel=self.like_video.channel, video=self.like_video.video)
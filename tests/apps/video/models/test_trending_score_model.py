@@ -0,0 +1,135 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.test import TestCase
+from django.utils import timezone
+
+from tests.factories.video import VideoFactory, VideoViewFactory, LikeVideoFactory
+from tests.factories.comment import CommentFactory
+
+from apps.video.models import Video, TrendingScore
+
+
+class TestTrendingScoreModel(TestCase):
+    def setUp(self):
+        self.trending_settings = settings.TRENDING_SCORE
+        self.video: Video = VideoFactory.create()
+
+    def test_str_of_the_trending_score_model_is_the_video_title(self):
+        """
+        Should verify if the __str__() of the trending score model is the video title
+        """
+        TrendingScore.objects.refresh()
+
+        trending_score = TrendingScore.objects.get(video=self.video)
+
+        self.assertEqual(trending_score.__str__(), self.video.title)
+
+    def test_refresh_adds_the_weighted_engagement_of_the_video(self):
+        """
+        Should verify that the refresh scores the views, likes and comments of the video by their weights
+        """
+        VideoViewFactory.create(video=self.video, count=4)
+        LikeVideoFactory.create_batch(2, video=self.video)
+        CommentFactory.create(video=self.video)
+
+        TrendingScore.objects.refresh()
+
+        trending_score = TrendingScore.objects.get(video=self.video)
+
+        expected_score = 4 * self.trending_settings['VIEW_WEIGHT']\
+            + 2 * self.trending_settings['LIKE_WEIGHT']\
+            + self.trending_settings['COMMENT_WEIGHT']
+
+        self.assertAlmostEqual(trending_score.score, expected_score)
+
+    def test_refresh_only_adds_the_engagement_received_since_the_last_refresh(self):
+        """
+        Should verify that the engagement already scored is not added again
+        """
+        now = timezone.now()
+
+        LikeVideoFactory.create(video=self.video)
+        TrendingScore.objects.refresh(now=now)
+
+        LikeVideoFactory.create(video=self.video)
+        TrendingScore.objects.refresh(now=now)
+
+        trending_score = TrendingScore.objects.get(video=self.video)
+
+        self.assertAlmostEqual(trending_score.score, 2 * self.trending_settings['LIKE_WEIGHT'])
+
+    def test_refresh_halves_the_score_every_half_life(self):
+        """
+        Should verify that the score decays by half every half life
+        """
+        now = timezone.now()
+
+        LikeVideoFactory.create(video=self.video)
+        TrendingScore.objects.refresh(now=now)
+        TrendingScore.objects.refresh(now=now + 2 * self.trending_settings['HALF_LIFE'])
+
+        trending_score = TrendingScore.objects.get(video=self.video)
+
+        self.assertAlmostEqual(trending_score.score, self.trending_settings['LIKE_WEIGHT'] / 4)
+
+    def test_recent_engagement_outweighs_older_engagement(self):
+        """
+        Should verify that a video with recent engagement overtakes a video with more but older engagement
+        """
+        now = timezone.now()
+        recent_video: Video = VideoFactory.create()
+
+        LikeVideoFactory.create_batch(3, video=self.video)
+        TrendingScore.objects.refresh(now=now)
+
+        LikeVideoFactory.create_batch(2, video=recent_video)
+        TrendingScore.objects.refresh(now=now + self.trending_settings['HALF_LIFE'])
+
+        trending_scores = TrendingScore.objects.order_by('-score')
+
+        self.assertEqual(trending_scores[0].video_id, recent_video.pk)
+
+    def test_refresh_skips_the_videos_without_score_nor_new_engagement(self):
+        """
+        Should verify that the refresh does not touch the videos that are no longer trending
+        """
+        now = timezone.now()
+        created_at = TrendingScore.objects.get(video=self.video).refreshed_at
+
+        TrendingScore.objects.refresh(now=now)
+        refreshed_videos = TrendingScore.objects.refresh(now=now + timedelta(hours=1))
+
+        trending_score = TrendingScore.objects.get(video=self.video)
+
+        self.assertEqual(refreshed_videos, 0)
+        self.assertEqual(trending_score.refreshed_at, created_at)
+
+    def test_trending_score_is_created_with_the_video(self):
+        """
+        Should verify that a video starts with an empty trending score, so the refresh never has to add it
+        """
+        trending_score = TrendingScore.objects.get(video=self.video)
+
+        self.assertEqual(trending_score.score, 0)
+        self.assertFalse(trending_score.has_new_engagement)
+
+    def test_engagement_flags_the_trending_score_until_the_refresh(self):
+        """
+        Should verify that new engagement flags the video for the next refresh, which only reads the flagged or trending videos
+        """
+        now = timezone.now()
+        VideoFactory.create_batch(3)
+
+        VideoViewFactory.create(video=self.video, count=2)
+
+        self.assertTrue(TrendingScore.objects.get(video=self.video).has_new_engagement)
+
+        refreshed_videos = TrendingScore.objects.refresh(now=now)
+
+        self.assertEqual(refreshed_videos, 1)
+        self.assertFalse(TrendingScore.objects.get(video=self.video).has_new_engagement)
+
+        LikeVideoFactory.create(video=self.video)
+
+        self.assertTrue(TrendingScore.objects.get(video=self.video).has_new_engagement)
@@ -1,6 +1,10 @@
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
-from tests.factories.video import VideoFactory
+from tests.factories.video import VideoFactory, VideoViewFactory, LikeVideoFactory, DislikeVideoFactory
+from tests.factories.channel import ChannelFactory
+from tests.factories.comment import CommentFactory, LikeCommentFactory
 
 from apps.video.models import Video
 
@@ -34,3 +38,118 @@ class TestVideoModel(TestCase):
 
         for index, video in enumerate(videos_sorted_alphabetically):
             self.assertEqual(videos[index].get('id'), video.get('id'))
+
+    def test_engagement_counters_increase_when_engagements_are_created(self):
+        """
+        Should verify that the video counters increase when views, likes, dislikes and comments are created
+        """
+        VideoViewFactory.create(video=self.video, count=3)
+        VideoViewFactory.create(video=self.video, count=2)
+        LikeVideoFactory.create_batch(2, video=self.video)
+        DislikeVideoFactory.create(video=self.video)
+        CommentFactory.create_batch(3, video=self.video)
+
+        self.video.refresh_from_db()
+
+        self.assertEqual(self.video.view_count, 5)
+        self.assertEqual(self.video.like_count, 2)
+        self.assertEqual(self.video.dislike_count, 1)
+        self.assertEqual(self.video.comment_count, 3)
+
+    def test_engagement_counters_decrease_when_engagements_are_deleted(self):
+        """
+        Should verify that the video counters decrease when views, likes, dislikes and comments are deleted
+        """
+        video_view = VideoViewFactory.create(video=self.video, count=3)
+        like_video = LikeVideoFactory.create(video=self.video)
+        dislike_video = DislikeVideoFactory.create(video=self.video)
+        comment = CommentFactory.create(video=self.video)
+
+        video_view.delete()
+        like_video.delete()
+        dislike_video.delete()
+        comment.delete()
+
+        self.video.refresh_from_db()
+
+        self.assertEqual(self.video.view_count, 0)
+        self.assertEqual(self.video.like_count, 0)
+        self.assertEqual(self.video.dislike_count, 0)
+        self.assertEqual(self.video.comment_count, 0)
+
+    def test_engagement_counters_decrease_when_the_channel_is_deleted(self):
+        """
+        Should verify that the video counters decrease when the engagements of a deleted channel are cascaded
+        """
+        video_view = VideoViewFactory.create(video=self.video, count=4)
+        LikeVideoFactory.create(video=self.video, channel=video_view.channel)
+        CommentFactory.create(video=self.video, channel=video_view.channel)
+
+        video_view.channel.delete()
+
+        self.video.refresh_from_db()
+
+        self.assertEqual(self.video.view_count, 0)
+        self.assertEqual(self.video.like_count, 0)
+        self.assertEqual(self.video.comment_count, 0)
+
+    def test_counters_of_the_kept_rows_decrease_when_the_channel_is_deleted(self):
+        """
+        Should verify that deleting a channel takes its replies, the replies under its comments and its comment likes out of the kept counters
+        """
+        channel = ChannelFactory.create()
+        other_comment = CommentFactory.create(video=self.video)
+        channel_comment = CommentFactory.create(video=self.video, channel=channel)
+        CommentFactory.create(video=self.video, comment=channel_comment)
+        CommentFactory.create(video=self.video, comment=other_comment, channel=channel)
+        LikeCommentFactory.create(comment=other_comment, channel=channel)
+        VideoViewFactory.create(video=self.video, channel=channel, count=3)
+        VideoViewFactory.create(video=self.video, count=2)
+
+        channel.delete()
+
+        self.video.refresh_from_db()
+        other_comment.refresh_from_db()
+        self.video.channel.refresh_from_db()
+
+        self.assertEqual(self.video.comment_count, 1)
+        self.assertEqual(self.video.view_count, 2)
+        self.assertEqual(self.video.channel.total_views, 2)
+        self.assertEqual(other_comment.reply_count, 0)
+        self.assertEqual(other_comment.like_count, 0)
+
+    def test_deleting_a_video_takes_the_same_queries_whatever_its_engagements(self):
+        """
+        Should verify that the views, likes and comments of a deleted video do not add queries per row
+        """
+        def count_delete_queries(video: Video, engagements: int) -> int:
+            VideoViewFactory.create_batch(engagements, video=video)
+            LikeVideoFactory.create_batch(engagements, video=video)
+            comments = CommentFactory.create_batch(engagements, video=video)
+            LikeCommentFactory.create_batch(engagements, comment=comments[0])
+
+            with CaptureQueriesContext(connection) as context:
+                video.delete()
+
+            return len(context.captured_queries)
+
+        first_video_queries = count_delete_queries(self.video, 1)
+
+        self.assertEqual(count_delete_queries(VideoFactory.create(channel=self.video.channel), 10), first_video_queries)
+
+        self.video.channel.refresh_from_db()
+
+        self.assertEqual(self.video.channel.total_views, 0)
+
+    def test_comment_count_decreases_when_comment_replies_are_cascaded(self):
+        """
+        Should verify that the comment count decreases by the comment and its replies when the comment is deleted
+        """
+        comment = CommentFactory.create(video=self.video)
+        CommentFactory.create_batch(2, video=self.video, comment=comment)
+
+        comment.delete()
+
+        self.video.refresh_from_db()
+
+        self.assertEqual(self.video.comment_count, 0)
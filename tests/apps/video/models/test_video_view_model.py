@@ -1,8 +1,13 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
 from django.test import TestCase
+from django.utils import timezone
 
-from tests.factories.video import VideoViewFactory
+from tests.factories.video import VideoFactory, VideoViewFactory
 
-from apps.video.models import VideoView
+from apps.video.models import Video, VideoView
 
 
 class TestVideoViewModel(TestCase):
@@ -30,3 +35,55 @@ class TestVideoViewModel(TestCase):
 
         video_view = VideoView.objects.filter(id=self.video_view.pk)
         self.assertTrue(video_view.exists())
+
+    def test_compaction_merges_the_anonymous_view_shards_of_a_video(self):
+        """
+        Should verify that the anonymous view shards of a video are merged into a single row
+        """
+        video: Video = VideoFactory.create()
+        last_view_date = timezone.now() + timedelta(hours=1)
+
+        VideoViewFactory.create(channel=None, video=video, shard=0, count=2)
+        VideoViewFactory.create(channel=None, video=video, shard=1, count=3)
+        VideoViewFactory.create(channel=None, video=video, shard=5, count=4, last_view_date=last_view_date)
+
+        call_command('compact_video_views', stdout=StringIO())
+
+        anonymous_views = VideoView.objects.filter(channel=None, video=video)
+
+        self.assertEqual(anonymous_views.count(), 1)
+        self.assertEqual(anonymous_views[0].shard, 0)
+        self.assertEqual(anonymous_views[0].count, 9)
+        self.assertEqual(anonymous_views[0].last_view_date, last_view_date)
+
+    def test_compaction_creates_the_first_shard_if_it_does_not_exist(self):
+        """
+        Should verify that the shards are merged even if the video has no first shard
+        """
+        video: Video = VideoFactory.create()
+
+        VideoViewFactory.create(channel=None, video=video, shard=3, count=3)
+
+        VideoView.objects.compact_anonymous_views()
+
+        anonymous_view = VideoView.objects.get(channel=None, video=video)
+
+        self.assertEqual(anonymous_view.shard, 0)
+        self.assertEqual(anonymous_view.count, 3)
+
+    def test_compaction_keeps_the_view_counters_and_the_channel_views(self):
+        """
+        Should verify that the compaction does not change the view count of the video nor the views of channels
+        """
+        video: Video = VideoFactory.create()
+
+        channel_view: VideoView = VideoViewFactory.create(video=video, count=2)
+        VideoViewFactory.create(channel=None, video=video, shard=1, count=3)
+        VideoViewFactory.create(channel=None, video=video, shard=2, count=4)
+
+        VideoView.objects.compact_anonymous_views()
+
+        video.refresh_from_db()
+
+        self.assertEqual(video.view_count, 9)
+        self.assertTrue(VideoView.objects.filter(pk=channel_view.pk, count=2).exists())
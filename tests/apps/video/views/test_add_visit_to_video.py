@@ -1,3 +1,8 @@
+import time
+from datetime import timedelta
+
+from django.db.models import Sum
+from django.test import TransactionTestCase, override_settings
 from django.urls import reverse
 
 from rest_framework import status
@@ -7,6 +12,7 @@ from tests.setups import APITestCaseWithAuth
 from tests.factories.video import VideoFactory, VideoViewFactory
 
 from apps.video.models import Video, VideoView
+from apps.video.buffers import video_view_buffer
 
 
 class TestAddVisitToVideo(APITestCaseWithAuth):
@@ -15,13 +21,21 @@ class TestAddVisitToVideo(APITestCaseWithAuth):
 
         self.url = reverse('visit_to_video', kwargs={'video_id': self.video.pk})
 
-    def test_return_no_content_status_code(self):
+    def tearDown(self):
+        video_view_buffer.flush()
+
+    def visit_video(self):
         response = self.client.post(self.url)
+        video_view_buffer.flush()
+        return response
+
+    def test_return_no_content_status_code(self):
+        response = self.visit_video()
 
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
 
     def test_verify_video_view_for_unauthenticated_users_has_been_created(self):
-        self.client.post(self.url)
+        self.visit_video()
 
         video_view = VideoView.objects.filter(channel=None, video=self.video)
 
@@ -30,7 +44,7 @@ class TestAddVisitToVideo(APITestCaseWithAuth):
     def test_verify_video_view_of_a_user_has_been_created(self):
         super().setUp()
 
-        self.client.post(self.url)
+        self.visit_video()
 
         video_view = VideoView.objects.filter(
             channel=self.user.current_channel,
@@ -42,11 +56,13 @@ class TestAddVisitToVideo(APITestCaseWithAuth):
     def test_verify_video_views_from_unauthenticated_users_have_increased(self):
         video_view: VideoView = VideoViewFactory.create(channel=None, video=self.video)
 
-        self.client.post(self.url)
+        self.visit_video()
 
-        video_view_updated = VideoView.objects.get(channel=None, video=self.video)
+        anonymous_views = VideoView.objects\
+            .filter(channel=None, video=self.video)\
+            .aggregate(total=Sum('count'))
 
-        self.assertEqual(video_view_updated.count, video_view.count + 1)
+        self.assertEqual(anonymous_views.get('total'), video_view.count + 1)
 
     def test_verify_video_views_from_user_have_increased(self):
         super().setUp()
@@ -56,7 +72,7 @@ class TestAddVisitToVideo(APITestCaseWithAuth):
             video=self.video
         )
 
-        self.client.post(self.url)
+        self.visit_video()
 
         video_view_updated = VideoView.objects.get(
             channel=self.user.current_channel,
@@ -65,6 +81,15 @@ class TestAddVisitToVideo(APITestCaseWithAuth):
 
         self.assertEqual(video_view_updated.count, video_view.count + 1)
 
+    def test_verify_video_view_count_has_increased(self):
+        VideoViewFactory.create(channel=None, video=self.video, count=5)
+
+        self.visit_video()
+
+        self.video.refresh_from_db()
+
+        self.assertEqual(self.video.view_count, 6)
+
     def test_video_does_not_exist(self):
         self.video.delete()
 
@@ -72,3 +97,118 @@ class TestAddVisitToVideo(APITestCaseWithAuth):
 
         self.assertDictEqual(response.data, {'message': 'The video does not exist'})
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    @override_settings(VIDEO_VIEW_BUFFER={'MAX_SIZE': 100, 'FLUSH_INTERVAL': timedelta(hours=1)})
+    def test_views_are_coalesced_until_the_buffer_is_flushed(self):
+        for _ in range(3):
+            self.client.post(self.url)
+
+        self.assertFalse(VideoView.objects.filter(video=self.video).exists())
+
+        video_view_buffer.flush()
+
+        video_views = VideoView.objects.filter(channel=None, video=self.video)
+        self.video.refresh_from_db()
+
+        self.assertEqual(video_views.count(), 1)
+        self.assertEqual(video_views[0].count, 3)
+        self.assertEqual(self.video.view_count, 3)
+
+    @override_settings(VIDEO_VIEW_ANONYMOUS_SHARDS=4)
+    def test_anonymous_views_are_spread_over_the_video_shards(self):
+        for _ in range(20):
+            self.visit_video()
+
+        anonymous_views = VideoView.objects.filter(channel=None, video=self.video)
+
+        self.assertGreater(anonymous_views.count(), 1)
+        self.assertTrue(all(video_view.shard < 4 for video_view in anonymous_views))
+        self.assertEqual(anonymous_views.aggregate(total=Sum('count')).get('total'), 20)
+
+    @override_settings(VIDEO_VIEW_ANONYMOUS_SHARDS=4)
+    def test_views_of_a_channel_are_not_sharded(self):
+        super().setUp()
+
+        for _ in range(5):
+            self.visit_video()
+
+        video_views = VideoView.objects.filter(channel=self.user.current_channel, video=self.video)
+
+        self.assertEqual(video_views.count(), 1)
+        self.assertEqual(video_views[0].count, 5)
+
+    @override_settings(VIDEO_VIEW_BUFFER={'MAX_SIZE': 2, 'FLUSH_INTERVAL': timedelta(hours=1)})
+    def test_buffer_is_flushed_when_it_is_full(self):
+        self.client.post(self.url)
+        self.client.post(self.url)
+
+        self.video.refresh_from_db()
+
+        self.assertEqual(self.video.view_count, 2)
+
+    @override_settings(VIDEO_VIEW_BUFFER={'MAX_SIZE': 100, 'FLUSH_INTERVAL': timedelta(seconds=0)})
+    def test_buffer_is_flushed_when_the_flush_interval_has_elapsed(self):
+        self.client.post(self.url)
+
+        self.video.refresh_from_db()
+
+        self.assertEqual(self.video.view_count, 1)
+
+    def test_verify_channel_total_views_have_increased(self):
+        self.visit_video()
+
+        self.video.channel.refresh_from_db()
+
+        self.assertEqual(self.video.channel.total_views, 1)
+
+    @override_settings(VIDEO_VIEW_BUFFER={'MAX_SIZE': 100, 'FLUSH_INTERVAL': timedelta(hours=1)})
+    def test_views_of_deleted_videos_are_dropped_on_flush(self):
+        deleted_video: Video = VideoFactory.create()
+
+        self.client.post(self.url)
+        self.client.post(reverse('visit_to_video', kwargs={'video_id': deleted_video.pk}))
+
+        deleted_video.delete()
+        video_view_buffer.flush()
+
+        self.video.refresh_from_db()
+
+        self.assertEqual(self.video.view_count, 1)
+        self.assertFalse(VideoView.objects.filter(video_id=deleted_video.pk).exists())
+
+    @override_settings(VIDEO_VIEW_BUFFER={'MAX_SIZE': 100, 'FLUSH_INTERVAL': timedelta(hours=1)})
+    def test_buffer_is_flushed_in_a_constant_number_of_queries(self):
+        super().setUp()
+
+        for video in VideoFactory.create_batch(5):
+            video_view_buffer.add(video.pk)
+            video_view_buffer.add(video.pk, self.user.current_channel_id)
+
+        with self.assertNumQueries(6):
+            video_view_buffer.flush()
+
+
+class TestVideoViewBufferFlushTimer(TransactionTestCase):
+    def tearDown(self):
+        video_view_buffer.flush()
+
+    @override_settings(VIDEO_VIEW_BUFFER={'MAX_SIZE': 100, 'FLUSH_INTERVAL': timedelta(milliseconds=100)})
+    def test_idle_buffer_is_flushed_after_the_flush_interval(self):
+        """
+        Should verify that the buffered views are written once the flush interval elapses, without any new view
+        """
+        video: Video = VideoFactory.create()
+
+        video_view_buffer.add(video.pk)
+
+        self.assertFalse(VideoView.objects.filter(video=video).exists())
+
+        deadline = time.monotonic() + 5
+
+        while not VideoView.objects.filter(video=video).exists() and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+        video.refresh_from_db()
+
+        self.assertEqual(video.view_count, 1)
+        self.assertIsNone(video_view_buffer.flush_timer)
@@ -29,7 +29,13 @@ class TestDislikeVideo(APITestCaseWithAuth):
 
         response = self.client.post(url)
 
-        self.assertDictEqual(response.data, {'message': 'Dislike video added'})
+        self.assertDictEqual(response.data, {
+            'message': 'Dislike video added',
+            'liked': False,
+            'disliked': True,
+            'likes': 0,
+            'dislikes': 1
+        })
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
     def test_dislike_video_added(self):
@@ -61,7 +67,13 @@ class TestDislikeVideo(APITestCaseWithAuth):
 
         response = self.client.post(url)
 
-        self.assertDictEqual(response.data, {'message': 'Dislike video removed'})
+        self.assertDictEqual(response.data, {
+            'message': 'Dislike video removed',
+            'liked': False,
+            'disliked': False,
+            'likes': 0,
+            'dislikes': 0
+        })
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
     def test_dislike_video_removed(self):
@@ -106,6 +118,24 @@ class TestDislikeVideo(APITestCaseWithAuth):
 
         self.assertTrue(dislike_video.exists())
 
+    def test_dislike_count_of_the_video_has_been_updated(self):
+        """
+        Should verify that the like and dislike counters of the video are updated when a like is converted to a dislike
+        """
+        LikeVideoFactory.create(
+            channel=self.user.current_channel,
+            video=self.video
+        )
+
+        url = reverse(self.url_name, kwargs={'video_id': self.video.pk})
+
+        self.client.post(url)
+
+        self.video.refresh_from_db()
+
+        self.assertEqual(self.video.like_count, 0)
+        self.assertEqual(self.video.dislike_count, 1)
+
     def test_video_does_not_exist(self):
         """
         Should return an error response and a 404 status code if the video does not exist
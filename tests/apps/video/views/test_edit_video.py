@@ -7,7 +7,7 @@ from unittest.mock import patch
 
 from tests.setups import APITestCaseWithAuth
 
-from tests.factories.video import VideoFactory
+from tests.factories.video import VideoFactory, LikeVideoFactory, VideoViewFactory
 
 from apps.video.models import Video
 
@@ -64,6 +64,37 @@ class TestEditVideo(APITestCaseWithAuth):
 
         self.assertNotEqual(self.video.thumbnail, video_updated.thumbnail)
 
+    @patch('youtube_clone.utils.storage.CloudinaryUploader.upload_image')
+    def test_video_counters_changed_during_the_edition_are_kept(self, mock_upload_image):
+        """
+        Should verify that the likes and views added while the video is edited are not reverted by the edition
+        """
+        thumbnail_data = faker.image(size=(2, 2), hue=[90, 270], image_format='png')
+        thumbnail = SimpleUploadedFile('thumbnail.png', thumbnail_data, content_type='image/png')
+
+        def like_and_view_during_upload(*args):
+            LikeVideoFactory.create(video=self.video)
+            VideoViewFactory.create(video=self.video, count=7)
+
+            return 'https://cloudinary.com/image.png'
+
+        mock_upload_image.side_effect = like_and_view_during_upload
+
+        self.client.patch(
+            self.url,
+            {
+                'title': 'New title',
+                'thumbnail': thumbnail
+            },
+            format='multipart'
+        )
+
+        video_updated = Video.objects.get(id=self.video.pk)
+
+        self.assertEqual(video_updated.title, 'New title')
+        self.assertEqual(video_updated.like_count, 1)
+        self.assertEqual(video_updated.view_count, 7)
+
     def test_video_title_has_been_updated(self):
         """
         Should verify if the video title has been updated successfully
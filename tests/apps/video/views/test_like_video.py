@@ -29,7 +29,13 @@ class TestLikeVideo(APITestCaseWithAuth):
 
         response = self.client.post(url)
 
-        self.assertDictEqual(response.data, {'message': 'Like video added'})
+        self.assertDictEqual(response.data, {
+            'message': 'Like video added',
+            'liked': True,
+            'disliked': False,
+            'likes': 1,
+            'dislikes': 0
+        })
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
     def test_like_video_added(self):
@@ -61,7 +67,13 @@ class TestLikeVideo(APITestCaseWithAuth):
 
         response = self.client.post(url)
 
-        self.assertDictEqual(response.data, {'message': 'Like video removed'})
+        self.assertDictEqual(response.data, {
+            'message': 'Like video removed',
+            'liked': False,
+            'disliked': False,
+            'likes': 0,
+            'dislikes': 0
+        })
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
     def test_like_video_removed(self):
@@ -106,6 +118,57 @@ class TestLikeVideo(APITestCaseWithAuth):
 
         self.assertTrue(like_video.exists())
 
+    def test_like_count_of_the_video_has_been_updated(self):
+        """
+        Should verify that the like and dislike counters of the video are updated when a dislike is converted to a like
+        """
+        DislikeVideoFactory.create(
+            channel=self.user.current_channel,
+            video=self.video
+        )
+
+        url = reverse(self.url_name, kwargs={'video_id': self.video.pk})
+
+        self.client.post(url)
+
+        self.video.refresh_from_db()
+
+        self.assertEqual(self.video.like_count, 1)
+        self.assertEqual(self.video.dislike_count, 0)
+
+    def test_return_the_new_totals_of_the_video(self):
+        """
+        Should return the new state and totals of the video when a dislike is converted to a like
+        """
+        DislikeVideoFactory.create(
+            channel=self.user.current_channel,
+            video=self.video
+        )
+        LikeVideoFactory.create(video=self.video)
+
+        url = reverse(self.url_name, kwargs={'video_id': self.video.pk})
+
+        response = self.client.post(url)
+
+        self.assertTrue(response.data.get('liked'))
+        self.assertFalse(response.data.get('disliked'))
+        self.assertEqual(response.data.get('likes'), 2)
+        self.assertEqual(response.data.get('dislikes'), 0)
+
+    def test_like_video_twice_does_not_duplicate_the_like(self):
+        """
+        Should verify that liking a video twice removes the like instead of adding a second one
+        """
+        url = reverse(self.url_name, kwargs={'video_id': self.video.pk})
+
+        self.client.post(url)
+        self.client.post(url)
+
+        self.video.refresh_from_db()
+
+        self.assertFalse(LikedVideo.objects.filter(video=self.video).exists())
+        self.assertEqual(self.video.like_count, 0)
+
     def test_video_does_not_exist(self):
         """
         Should return an error response and a 404 status code if the video does not exist
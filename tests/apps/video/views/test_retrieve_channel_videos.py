@@ -49,6 +49,12 @@ class TestRetrieveChannelVideos(APITestCase):
 
         self.assertEqual(first_video_retrieved, serialized_video.data)
 
+    def test_return_channel_videos_in_a_constant_number_of_queries(self):
+        VideoFactory.create_batch(5, channel=self.channel)
+
+        with self.assertNumQueries(2):
+            self.client.get(self.url)
+
     def test_return_channel_videos_sorted_by_MOST_POPULAR(self):
         first_most_popular_video: Video = VideoFactory.create(channel=self.channel)
         VideoViewFactory.create(video=first_most_popular_video, count=3)
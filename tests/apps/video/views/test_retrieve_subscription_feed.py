@@ -0,0 +1,150 @@
+from django.test import override_settings
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from tests.setups import APITestCaseWithAuth
+
+from tests.factories.channel import ChannelFactory, ChannelSubscriptionFactory
+from tests.factories.video import VideoFactory
+from tests.utils import encode_cursor
+
+from apps.channel.models import Channel
+from apps.video.models import Video, InboxVideo
+
+from apps.video.serializers import VideoListSerializer
+
+
+class TestRetrieveSubscriptionFeed(APITestCaseWithAuth):
+    def setUp(self):
+        super().setUp()
+
+        self.channel: Channel = self.user.current_channel
+        self.subscribed_channels: list[Channel] = ChannelFactory.create_batch(2)
+
+        for subscribed_channel in self.subscribed_channels:
+            ChannelSubscriptionFactory.create(subscriber=self.channel, subscribing=subscribed_channel)
+
+        self.url = reverse('subscription_feed')
+
+    def get_feed_video_ids(self, params=None) -> list:
+        video_ids = []
+        params = dict(params or {})
+
+        while True:
+            response = self.client.get(self.url, params)
+            video_ids += [video.get('id') for video in response.data.get('data')]
+
+            if response.data.get('next') is None:
+                return video_ids
+
+            params['cursor'] = response.data.get('next')
+
+    def test_return_the_videos_of_the_subscribed_channels_newest_first(self):
+        """
+        Should return the videos of the subscribed channels sorted by publication date, newest first
+        """
+        videos = [VideoFactory.create(channel=self.subscribed_channels[index % 2]) for index in range(4)]
+        VideoFactory.create()
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [video.get('id') for video in response.data.get('data')],
+            [video.pk for video in reversed(videos)]
+        )
+        self.assertDictEqual(
+            response.data.get('data')[0],
+            VideoListSerializer(videos[-1]).data
+        )
+
+    def test_return_the_feed_across_pages(self):
+        """
+        Should verify that the feed continues on the next pages without repeating or skipping videos
+        """
+        videos = [VideoFactory.create(channel=self.subscribed_channels[index % 2]) for index in range(7)]
+
+        self.assertEqual(
+            self.get_feed_video_ids({'page_size': 3}),
+            [video.pk for video in reversed(videos)]
+        )
+
+    def test_merge_the_videos_of_channels_over_the_fan_out_limit_on_read(self):
+        """
+        Should verify that the videos of large channels are merged with the inbox videos in the same order
+        """
+        videos = [VideoFactory.create(channel=self.subscribed_channels[0])]
+
+        with override_settings(SUBSCRIPTION_FEED={'FAN_OUT_LIMIT': 1, 'BACKFILL_SIZE': 30}):
+            videos += [VideoFactory.create(channel=self.subscribed_channels[index % 2]) for index in range(5)]
+
+            self.assertFalse(InboxVideo.objects.filter(video__in=videos[1:]).exists())
+            self.assertEqual(
+                self.get_feed_video_ids({'page_size': 2}),
+                [video.pk for video in reversed(videos)]
+            )
+
+    def test_keep_the_videos_of_a_channel_that_drops_below_the_fan_out_limit(self):
+        """
+        Should verify that the videos published while the channel was over the fan-out limit are still returned once it drops below it
+        """
+        large_channel = self.subscribed_channels[0]
+        other_subscription = ChannelSubscriptionFactory.create(subscribing=large_channel)
+
+        with override_settings(SUBSCRIPTION_FEED={'FAN_OUT_LIMIT': 2, 'BACKFILL_SIZE': 30}):
+            video: Video = VideoFactory.create(channel=large_channel)
+
+            self.assertFalse(InboxVideo.objects.filter(video=video).exists())
+
+            other_subscription.delete()
+            new_video: Video = VideoFactory.create(channel=large_channel)
+
+            self.assertEqual(self.get_feed_video_ids(), [new_video.pk, video.pk])
+
+    def test_unsubscribed_channel_videos_are_not_returned(self):
+        """
+        Should verify that the videos of a channel are no longer returned after unsubscribing from it
+        """
+        VideoFactory.create(channel=self.subscribed_channels[0])
+        video: Video = VideoFactory.create(channel=self.subscribed_channels[1])
+
+        self.channel.subscriber.get(subscribing=self.subscribed_channels[0]).delete()
+
+        self.assertEqual(self.get_feed_video_ids(), [video.pk])
+
+    def test_return_the_feed_in_a_constant_number_of_queries(self):
+        """
+        Should retrieve the feed without a query per video or per subscribed channel
+        """
+        for subscribed_channel in self.subscribed_channels:
+            VideoFactory.create_batch(3, channel=subscribed_channel)
+
+        # The user and the feed videos with their channels
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+
+        self.assertEqual(len(response.data.get('data')), 6)
+
+    def test_the_feed_with_an_invalid_cursor(self):
+        """
+        Should return a 404 status code if the values of the cursor are not a publication date and an id
+        """
+        VideoFactory.create(channel=self.subscribed_channels[0])
+
+        for cursor in (['x', 'y'], ['2023-01-01T00:00:00+00:00', 'y'], ['2023-01-01T00:00:00+00:00', 2 ** 70]):
+            response = self.client.get(self.url, {'cursor': encode_cursor(cursor)})
+
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class TestRetrieveSubscriptionFeedWithoutAuth(APITestCase):
+    def test_the_feed_requires_authentication(self):
+        """
+        Should return a 401 status code if the user is not authenticated
+        """
+        response = self.client.get(reverse('subscription_feed'))
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
@@ -0,0 +1,131 @@
+from unittest.mock import patch
+
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from tests.factories.video import VideoFactory
+
+from apps.video.models import Video, VideoKeyword
+
+
+class TestRetrieveSuggestionVideos(APITestCase):
+    def setUp(self):
+        self.url_name = 'suggestion_videos'
+
+        self.video: Video = VideoFactory.create(
+            title='Italian pasta recipe',
+            description='How to cook homemade pasta with tomato sauce'
+        )
+        self.url = reverse(self.url_name, kwargs={'video_id': self.video.pk})
+
+    def get_suggestion_videos_ids(self, response):
+        return [video.get('id') for video in response.data.get('data')]
+
+    def test_should_return_not_found_if_the_video_does_not_exist(self):
+        """
+        Should return an error response and a 404 status code if the video does not exist
+        """
+        response = self.client.get(reverse(self.url_name, kwargs={'video_id': 1000}))
+
+        self.assertDictEqual(response.data, {'message': 'The video does not exist'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_should_return_OK_status_code(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_should_return_the_videos_that_share_keywords_with_the_video(self):
+        """
+        Should return the videos that share keywords with the video and not the unrelated ones
+        """
+        related_video: Video = VideoFactory.create(title='Pasta carbonara', description='Cooking a quick dinner')
+        unrelated_video: Video = VideoFactory.create(title='Football highlights', description='Best goals of the season')
+
+        response = self.client.get(self.url)
+
+        suggestion_videos_ids = self.get_suggestion_videos_ids(response)
+
+        self.assertIn(related_video.pk, suggestion_videos_ids)
+        self.assertNotIn(unrelated_video.pk, suggestion_videos_ids)
+
+    def test_should_not_suggest_the_video_itself(self):
+        VideoFactory.create(title='Pasta carbonara')
+
+        response = self.client.get(self.url)
+
+        self.assertNotIn(self.video.pk, self.get_suggestion_videos_ids(response))
+
+    def test_should_sort_the_videos_by_similarity(self):
+        """
+        Should return first the videos that share more relevant keywords with the video
+        """
+        less_similar_video: Video = VideoFactory.create(title='Tomato soup', description='A warm soup')
+        most_similar_video: Video = VideoFactory.create(title='Homemade italian pasta', description='Pasta recipe')
+
+        response = self.client.get(self.url)
+
+        suggestion_videos_ids = self.get_suggestion_videos_ids(response)
+
+        self.assertEqual(suggestion_videos_ids, [most_similar_video.pk, less_similar_video.pk])
+
+    def test_should_weigh_rare_keywords_more_than_common_ones(self):
+        """
+        Should rank a video sharing a rare keyword above a video sharing a keyword most videos have
+        """
+        VideoFactory.create_batch(5, title='Tomato', description='Tomato')
+        rare_keyword_video: Video = VideoFactory.create(title='Italian', description='Travel')
+        common_keyword_video: Video = VideoFactory.create(title='Tomato', description='Travel')
+
+        response = self.client.get(self.url)
+
+        suggestion_videos_ids = self.get_suggestion_videos_ids(response)
+
+        self.assertLess(
+            suggestion_videos_ids.index(rare_keyword_video.pk),
+            suggestion_videos_ids.index(common_keyword_video.pk)
+        )
+
+    def test_should_update_the_suggestions_when_the_video_is_edited(self):
+        """
+        Should index the new keywords of a video when it is edited
+        """
+        football_video: Video = VideoFactory.create(title='Football highlights', description='Goals')
+
+        self.video.title = 'Football tactics'
+        self.video.save()
+
+        response = self.client.get(self.url)
+
+        self.assertIn(football_video.pk, self.get_suggestion_videos_ids(response))
+
+    def test_should_continue_from_the_cursor_without_repeating_videos(self):
+        VideoFactory.create_batch(7, title='Pasta')
+
+        first_page = self.client.get(self.url, {'page_size': 4})
+        second_page = self.client.get(self.url, {'page_size': 4, 'cursor': first_page.data.get('next')})
+
+        suggestion_videos_ids = self.get_suggestion_videos_ids(first_page) + self.get_suggestion_videos_ids(second_page)
+
+        self.assertEqual(len(set(suggestion_videos_ids)), 7)
+        self.assertIsNone(second_page.data.get('next'))
+
+    def test_should_only_read_the_heaviest_videos_of_each_keyword(self):
+        """
+        Should read a bounded number of candidate videos from the posting list of each keyword
+        """
+        heavy_video: Video = VideoFactory.create(title='Pasta pasta pasta', description='Pasta')
+        VideoFactory.create_batch(3, title='Pasta', description='Dinner')
+
+        with patch.object(VideoKeyword.objects, 'max_keyword_candidates', 1):
+            response = self.client.get(self.url)
+
+        self.assertEqual(self.get_suggestion_videos_ids(response), [heavy_video.pk])
+
+    def test_should_retrieve_suggestion_videos_in_a_constant_number_of_queries(self):
+        VideoFactory.create_batch(5, title='Pasta')
+
+        # The video, its keywords with their document frequencies and the suggestions
+        with self.assertNumQueries(3):
+            self.client.get(self.url)
@@ -1,3 +1,6 @@
+from io import StringIO
+
+from django.core.management import call_command
 from django.urls import reverse
 
 from rest_framework import status
@@ -8,6 +11,7 @@ from apps.video.serializers import VideoListSimpleSerializer
 
 from tests.factories.video import VideoFactory, VideoViewFactory, LikeVideoFactory
 from tests.factories.comment import CommentFactory
+from tests.utils import encode_cursor
 
 class TestRetrieveTrendingVideos(APITestCase):
     def setUp(self):
@@ -28,9 +32,19 @@ class TestRetrieveTrendingVideos(APITestCase):
         VideoViewFactory.create(video=self.top_trending_video, count=15)
         CommentFactory.create_batch(3, video=self.top_trending_video)
 
+        call_command('refresh_trending_scores', stdout=StringIO())
+
+    def create_trending_videos(self, size: int):
+        for video in VideoFactory.create_batch(size):
+            VideoViewFactory.create(video=video, count=1)
+
+        call_command('refresh_trending_scores', stdout=StringIO())
+
     def test_should_return_a_list_of_serialized_videos(self):
         response = self.client.get(self.url)
 
+        self.top_trending_video.refresh_from_db()
+
         serialized_top_trending_video = VideoListSimpleSerializer(self.top_trending_video)
 
         self.assertIn(serialized_top_trending_video.data, response.data.get('data'))
@@ -45,3 +59,57 @@ class TestRetrieveTrendingVideos(APITestCase):
         self.assertEqual(response.data.get('data')[0].get('id'), self.top_trending_video.pk)
         self.assertEqual(response.data.get('data')[1].get('id'), self.second_top_trending_video.pk)
         self.assertEqual(response.data.get('data')[2].get('id'), self.video.pk)
+
+    def test_should_not_return_videos_without_trending_score(self):
+        video_without_engagement: Video = VideoFactory.create()
+
+        call_command('refresh_trending_scores', stdout=StringIO())
+
+        response = self.client.get(self.url)
+
+        videos_ids = [video.get('id') for video in response.data.get('data')]
+
+        self.assertNotIn(video_without_engagement.pk, videos_ids)
+
+    def test_should_retrieve_trending_videos_in_a_constant_number_of_queries(self):
+        self.create_trending_videos(5)
+
+        with self.assertNumQueries(1):
+            self.client.get(self.url)
+
+    def test_should_return_a_bounded_page_with_a_cursor_to_the_next_page(self):
+        self.create_trending_videos(10)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(len(response.data.get('data')), 10)
+        self.assertIsNotNone(response.data.get('next'))
+
+    def test_should_continue_from_the_cursor_without_repeating_videos(self):
+        self.create_trending_videos(10)
+
+        first_page = self.client.get(self.url, {'page_size': 5})
+        second_page = self.client.get(self.url, {'page_size': 5, 'cursor': first_page.data.get('next')})
+        third_page = self.client.get(self.url, {'page_size': 5, 'cursor': second_page.data.get('next')})
+
+        videos_ids = [
+            video.get('id')
+            for page in (first_page, second_page, third_page)
+            for video in page.data.get('data')
+        ]
+
+        self.assertEqual(len(videos_ids), 13)
+        self.assertEqual(len(set(videos_ids)), 13)
+        self.assertEqual(videos_ids[0], self.top_trending_video.pk)
+        self.assertIsNone(third_page.data.get('next'))
+
+    def test_should_return_not_found_if_the_cursor_is_invalid(self):
+        response = self.client.get(self.url, {'cursor': 'invalid'})
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_should_return_not_found_if_the_cursor_values_do_not_match_the_ordering(self):
+        for cursor in (['x', 'y'], [1.5, {'id': 1}], [1.5, 2 ** 70]):
+            response = self.client.get(self.url, {'cursor': encode_cursor(cursor)})
+
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
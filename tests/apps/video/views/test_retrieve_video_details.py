@@ -1,8 +1,14 @@
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from rest_framework import status
 from rest_framework.test import APITestCase
 
+from tests.setups import APITestCaseWithAuth
+
+from tests.factories.channel import ChannelSubscriptionFactory
 from tests.factories.video import VideoFactory
 
 from apps.video.models import Video
@@ -44,3 +50,55 @@ class TestRetrieveVideoDetails(APITestCase):
 
         self.assertDictEqual(response.data, {'message': 'The video does not exist'})
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class TestRetrieveVideoDetailsSubscribed(APITestCaseWithAuth):
+    def setUp(self):
+        super().setUp()
+
+        self.video: Video = VideoFactory.create()
+
+        self.url = reverse('video_details', kwargs={'video_id': self.video.pk})
+
+    def test_subscribed_flag_follows_the_subscriptions(self):
+        """
+        Should verify that the subscribed flag of the channel is refreshed when the viewer subscribes or unsubscribes
+        """
+        subscribe_url = reverse('subscribe_channel', kwargs={'channel_id': self.video.channel_id})
+
+        self.assertFalse(self.client.get(self.url).data['channel']['subscribed'])
+
+        self.client.post(subscribe_url)
+
+        self.assertTrue(self.client.get(self.url).data['channel']['subscribed'])
+
+        self.client.post(subscribe_url)
+
+        self.assertFalse(self.client.get(self.url).data['channel']['subscribed'])
+
+    def count_subscription_queries(self) -> int:
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url)
+
+        self.assertTrue(response.data['channel']['subscribed'])
+
+        return sum('channel_channelsubscription' in query['sql'] for query in context.captured_queries)
+
+    def test_subscribed_flag_is_read_once_per_request(self):
+        """
+        Should verify that the subscribed channels of the viewer are read once per request without a shared cache
+        """
+        ChannelSubscriptionFactory.create(subscriber=self.user.current_channel, subscribing=self.video.channel)
+
+        self.assertEqual(self.count_subscription_queries(), 1)
+        self.assertEqual(self.count_subscription_queries(), 1)
+
+    @override_settings(SHARED_CACHE=True)
+    def test_subscribed_flag_is_read_from_the_shared_cache(self):
+        """
+        Should verify that the subscribed channels of the viewer are only read once while they do not change with a shared cache
+        """
+        ChannelSubscriptionFactory.create(subscriber=self.user.current_channel, subscribing=self.video.channel)
+
+        self.assertEqual(self.count_subscription_queries(), 1)
+        self.assertEqual(self.count_subscription_queries(), 0)
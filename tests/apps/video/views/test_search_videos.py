@@ -4,13 +4,20 @@ from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APITestCase
 
-from tests.factories.video import DislikeVideoFactory, VideoFactory, VideoViewFactory, LikeVideoFactory
+from tests.factories import video as video_factories
+from tests.factories.video import DislikeVideoFactory, VideoViewFactory, LikeVideoFactory
+from tests.utils import encode_cursor
 
 from apps.video.models import Video
 
 from youtube_clone.enums import SearchSortOptions, SearchUploadDate
 
 
+class VideoFactory(video_factories.VideoFactory):
+    # Search covers the descriptions, so random text could match the query
+    description = 'Another description'
+
+
 class TestSearchVideos(APITestCase):
     def setUp(self):
         self.SEARCH_QUERY = 'test'
@@ -56,6 +63,67 @@ class TestSearchVideos(APITestCase):
         self.assertIn(first_expected_video.pk, searched_videos_ids)
         self.assertIn(second_expected_video.pk, searched_videos_ids)
 
+    def test_return_videos_searched_by_description(self):
+        """
+        Should return the videos that have the searched words in their description
+        """
+        expected_video: Video = VideoFactory.create(description=f'a {self.SEARCH_QUERY} description')
+        no_expected_video: Video = VideoFactory.create(description='another description')
+
+        response = self.client.get(self.url, {'search_query': self.SEARCH_QUERY})
+
+        searched_videos_ids = [dict(video).get('id') for video in response.data.get('data')]
+
+        self.assertIn(expected_video.pk, searched_videos_ids)
+        self.assertNotIn(no_expected_video.pk, searched_videos_ids)
+
+    def test_return_videos_searched_by_the_stem_of_the_words(self):
+        """
+        Should return the videos that have a word with the same stem as the search query
+        """
+        expected_video: Video = VideoFactory.create(title=f'{self.SEARCH_QUERY}ing videos')
+
+        response = self.client.get(self.url, {'search_query': self.SEARCH_QUERY})
+
+        searched_videos_ids = [dict(video).get('id') for video in response.data.get('data')]
+
+        self.assertIn(expected_video.pk, searched_videos_ids)
+
+    def test_sorted_by_RELEVANCE(self):
+        """
+        Should verify that the videos that match the search query in their title come before the ones that match it in their description
+        """
+        video_matched_by_description: Video = VideoFactory.create(description=self.SEARCH_QUERY)
+        video_matched_by_title: Video = VideoFactory.create(title=self.SEARCH_QUERY)
+
+        response = self.client.get(
+            self.url,
+            {
+                'search_query': self.SEARCH_QUERY,
+                'sort_by': SearchSortOptions.RELEVANCE.value
+            }
+        )
+
+        searched_videos_ids = [dict(video).get('id') for video in response.data.get('data')]
+
+        self.assertEqual(searched_videos_ids[0], video_matched_by_title.pk)
+        self.assertEqual(searched_videos_ids[1], video_matched_by_description.pk)
+
+    def test_search_vector_is_updated_when_the_video_is_edited(self):
+        """
+        Should return a video that is found by its new title after being edited
+        """
+        video: Video = VideoFactory.create()
+
+        video.title = self.SEARCH_QUERY
+        video.save()
+
+        response = self.client.get(self.url, {'search_query': self.SEARCH_QUERY})
+
+        searched_videos_ids = [dict(video).get('id') for video in response.data.get('data')]
+
+        self.assertIn(video.pk, searched_videos_ids)
+
     def test_sorted_by_UPLOAD_DATE(self):
         """
         Should verify that the searched videos are sorted by upload date
@@ -281,3 +349,52 @@ class TestSearchVideos(APITestCase):
 
         self.assertIn(expected_video.pk, searched_videos_ids)
         self.assertNotIn(not_expected_video.pk, searched_videos_ids)
+
+    def test_search_with_an_invalid_cursor(self):
+        """
+        Should return a 404 status code if the values of the cursor do not match the sort of the videos
+        """
+        VideoFactory.create(title=self.SEARCH_QUERY)
+
+        for sort_by, cursor in [
+            (SearchSortOptions.RELEVANCE.value, ['x', 'y']),
+            (SearchSortOptions.UPLOAD_DATE.value, [[2023], 1]),
+            (SearchSortOptions.VIEW_COUNT.value, [1, 2 ** 70]),
+        ]:
+            response = self.client.get(
+                self.url,
+                {'search_query': self.SEARCH_QUERY, 'sort_by': sort_by, 'cursor': encode_cursor(cursor)}
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_search_by_relevance_across_pages(self):
+        """
+        Should verify that the pages of the videos sorted by relevance neither repeat nor skip videos
+        """
+        videos = [
+            VideoFactory.create(title=self.SEARCH_QUERY),
+            VideoFactory.create(title=f'{self.SEARCH_QUERY} {self.SEARCH_QUERY}'),
+            VideoFactory.create(title=f'{self.SEARCH_QUERY} video'),
+            VideoFactory.create(title=f'A {self.SEARCH_QUERY} video with a long title'),
+            VideoFactory.create(description=self.SEARCH_QUERY),
+            VideoFactory.create(title=self.SEARCH_QUERY),
+        ]
+
+        single_page = self.client.get(self.url, {'search_query': self.SEARCH_QUERY})
+        expected_videos_ids = [video.get('id') for video in single_page.data.get('data')]
+
+        searched_videos_ids = []
+        params = {'search_query': self.SEARCH_QUERY, 'page_size': 2}
+
+        for _ in range(len(videos)):
+            response = self.client.get(self.url, params)
+            searched_videos_ids += [video.get('id') for video in response.data.get('data')]
+
+            if response.data.get('next') is None:
+                break
+
+            params['cursor'] = response.data.get('next')
+
+        self.assertEqual(sorted(expected_videos_ids), sorted(video.pk for video in videos))
+        self.assertEqual(searched_videos_ids, expected_videos_ids)
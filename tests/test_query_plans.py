@@ -0,0 +1,115 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from tests.setups import APITestCaseWithAuth
+
+from tests.factories.channel import ChannelFactory, ChannelSubscriptionFactory
+from tests.factories.comment import CommentFactory, LikeCommentFactory
+from tests.factories.playlist import PlaylistFactory, PlaylistVideoFactory
+from tests.factories.video import VideoFactory, VideoViewFactory, LikeVideoFactory
+
+from apps.channel.models import Channel
+from apps.comment.models import Comment
+from apps.playlist.models import Playlist
+from apps.video.models import Video
+
+from youtube_clone.enums import CommentSortOptions
+
+
+class TestQueryPlans(APITestCaseWithAuth):
+    """
+    Runs the hot read endpoints against a seeded dataset and explains every
+    query they make with sequential scans disabled, so a query falls back to a
+    sequential scan only when no index can serve it.
+    """
+
+    def setUp(self):
+        super().setUp()
+
+        self.channel: Channel = self.user.current_channel
+        channels = ChannelFactory.create_batch(5)
+
+        for channel in channels:
+            ChannelSubscriptionFactory.create(subscriber=self.channel, subscribing=channel)
+            VideoFactory.create_batch(3, channel=channel)
+
+        self.video: Video = VideoFactory.create(channel=channels[0], title='Pasta recipe')
+        VideoViewFactory.create(video=self.video, channel=self.channel)
+        LikeVideoFactory.create(video=self.video, channel=self.channel)
+
+        self.comment: Comment = CommentFactory.create(video=self.video)
+        CommentFactory.create_batch(3, video=self.video, comment=self.comment)
+        LikeCommentFactory.create(comment=self.comment, channel=self.channel)
+
+        self.playlist: Playlist = PlaylistFactory.create(channel=self.channel)
+
+        for video in Video.objects.all()[:5]:
+            PlaylistVideoFactory.create(playlist=self.playlist, video=video)
+
+        call_command('refresh_trending_scores', stdout=StringIO())
+        call_command('refresh_channel_recommendations', stdout=StringIO())
+
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+
+    def get_sequential_scans(self, url: str, params=None):
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(url, params)
+
+        sequential_scans = []
+
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_seqscan = off')
+
+            for query in context.captured_queries:
+                if not query['sql'].lstrip().upper().startswith(('SELECT', 'WITH')):
+                    continue
+
+                cursor.execute(f'EXPLAIN {query["sql"]}')
+                plan = '\n'.join(row[0] for row in cursor.fetchall())
+
+                if 'Seq Scan' in plan:
+                    sequential_scans.append(f'{query["sql"]}\n{plan}')
+
+        return sequential_scans
+
+    def assertNoSequentialScans(self, url: str, params=None):
+        sequential_scans = self.get_sequential_scans(url, params)
+
+        self.assertFalse(sequential_scans, '\n\n'.join(sequential_scans))
+
+    def test_video_endpoints_do_not_use_sequential_scans(self):
+        self.assertNoSequentialScans(reverse('trending_videos'))
+        self.assertNoSequentialScans(reverse('video_details', kwargs={'video_id': self.video.pk}))
+        self.assertNoSequentialScans(reverse('suggestion_videos', kwargs={'video_id': self.video.pk}))
+        self.assertNoSequentialScans(reverse('channel_videos', kwargs={'channel_id': self.video.channel_id}))
+        self.assertNoSequentialScans(reverse('search_videos'), {'search_query': 'pasta'})
+        self.assertNoSequentialScans(reverse('subscription_feed'))
+
+    def test_comment_endpoints_do_not_use_sequential_scans(self):
+        self.assertNoSequentialScans(reverse('video_comments', kwargs={'video_id': self.video.pk}))
+        self.assertNoSequentialScans(
+            reverse('video_comments', kwargs={'video_id': self.video.pk}),
+            {'sort_by': CommentSortOptions.TOP_COMMENTS.value}
+        )
+        self.assertNoSequentialScans(reverse('comments_of_comment', kwargs={'comment_id': self.comment.pk}))
+
+    def test_channel_endpoints_do_not_use_sequential_scans(self):
+        self.assertNoSequentialScans(reverse('subscribed_channels'))
+        self.assertNoSequentialScans(reverse('channel_recommendations', kwargs={'channel_id': self.video.channel_id}))
+        self.assertNoSequentialScans(reverse('channel_details_by_id', kwargs={'channel_id': self.video.channel_id}))
+        self.assertNoSequentialScans(reverse('search_channels'), {'search_query': self.video.channel.name})
+
+    def test_playlist_endpoints_do_not_use_sequential_scans(self):
+        self.assertNoSequentialScans(reverse('own_playlists'))
+        self.assertNoSequentialScans(reverse('playlist_details', kwargs={'playlist_id': self.playlist.pk}))
+        self.assertNoSequentialScans(reverse('videos_from_a_playlist', kwargs={'playlist_id': self.playlist.pk}))
+        self.assertNoSequentialScans(
+            reverse('videos_from_a_playlist', kwargs={'playlist_id': self.playlist.pk}),
+            {'seed': 'seed'}
+        )
+        self.assertNoSequentialScans(reverse('own_playlists_video_saved', kwargs={'video_id': self.video.pk}))
@@ -0,0 +1,10 @@
+import base64
+import json
+
+
+def encode_cursor(values: list) -> str:
+    """
+    Encodes the values of a keyset pagination cursor like the API does, so
+    tests can send tampered cursors.
+    """
+    return base64.urlsafe_b64encode(json.dumps(values).encode('utf-8')).decode('ascii')
@@ -2,6 +2,7 @@ from enum import Enum
 
 
 class SearchSortOptions(Enum):
+    RELEVANCE = 'relevance'
     UPLOAD_DATE = 'upload_date'
     VIEW_COUNT = 'view_count'
     RATING = 'rating'
@@ -0,0 +1,237 @@
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from functools import reduce
+from typing import Any, Callable, List, Optional, Sequence
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import Field, Q, QuerySet
+
+from rest_framework import status
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+
+from youtube_clone.permutations import FeistelPermutation
+
+
+# Float orderings must be double precision to round trip through the cursor
+class KeysetPagination(BasePagination):
+    page_size = settings.REST_FRAMEWORK['PAGE_SIZE']
+    max_page_size = 50
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset: QuerySet, request, view=None) -> List[Any]:
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(queryset)
+
+        queryset = queryset.order_by(*self.ordering)
+
+        cursor = self.decode_cursor(request, self.get_ordering_fields(queryset))
+
+        if cursor is not None:
+            queryset = queryset.filter(self.get_keyset_filter(cursor))
+
+        return self.paginate_results(list(queryset[:self.page_size + 1]))
+
+    def paginate_keyset_source(
+        self,
+        get_results: Callable[[Optional[List[Any]], int], Sequence[Any]],
+        queryset: QuerySet,
+        request,
+        view=None
+    ) -> List[Any]:
+        # For sources that apply the cursor themselves, such as a union of index ranges
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(queryset)
+
+        cursor = self.decode_cursor(request, self.get_ordering_fields(queryset))
+
+        return self.paginate_results(list(get_results(cursor, self.page_size + 1)))
+
+    def paginate_results(self, results: List[Any]) -> List[Any]:
+        self.page = results[:self.page_size]
+        self.next_cursor = None
+
+        if len(results) > self.page_size:
+            self.next_cursor = self.encode_cursor(self.page[-1])
+
+        return self.page
+
+    def get_paginated_response(self, data) -> Response:
+        return Response({
+            'data': data,
+            'next': self.next_cursor
+        }, status=status.HTTP_200_OK)
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'properties': {
+                'data': schema,
+                'next': {'type': 'string', 'nullable': True}
+            }
+        }
+
+    def get_page_size(self, request) -> int:
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+
+        return min(max(page_size, 1), self.max_page_size)
+
+    def get_ordering(self, queryset: QuerySet) -> List[str]:
+        ordering = list(queryset.query.order_by)
+
+        if not ordering and queryset.query.default_ordering:
+            ordering = list(queryset.model._meta.ordering)
+
+        assert all(isinstance(field, str) for field in ordering), (
+            'KeysetPagination only supports orderings by field or annotation names'
+        )
+
+        if not any(field.lstrip('-') in ('pk', 'id') for field in ordering):
+            is_descending = len(ordering) > 0 and ordering[0].startswith('-')
+            ordering.append('-pk' if is_descending else 'pk')
+
+        return ordering
+
+    def get_ordering_fields(self, queryset: QuerySet) -> List[Field]:
+        ordering_fields = []
+
+        for field in self.ordering:
+            field_name = field.lstrip('-')
+
+            if field_name in queryset.query.annotations:
+                ordering_fields.append(queryset.query.annotations[field_name].output_field)
+                continue
+
+            model = queryset.model
+
+            for attribute in field_name.split('__'):
+                model_field = model._meta.pk if attribute == 'pk' else model._meta.get_field(attribute)
+                model = model_field.related_model
+
+            ordering_fields.append(getattr(model_field, 'target_field', model_field))
+
+        return ordering_fields
+
+    def get_keyset_filter(self, cursor: List[Any]) -> Q:
+        conditions = []
+
+        for index, field in enumerate(self.ordering):
+            field_name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') else 'gt'
+
+            previous_fields_equal = {
+                previous_field.lstrip('-'): cursor[previous_index]
+                for previous_index, previous_field in enumerate(self.ordering[:index])
+            }
+
+            conditions.append(Q(
+                **previous_fields_equal,
+                **{f'{field_name}__{lookup}': cursor[index]}
+            ))
+
+        return reduce(lambda a, b: a | b, conditions)
+
+    def get_ordering_value(self, instance, field: str):
+        value = instance
+
+        for attribute in field.lstrip('-').split('__'):
+            value = getattr(value, attribute)
+
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+
+        return value
+
+    def encode_cursor(self, instance) -> str:
+        values = [self.get_ordering_value(instance, field) for field in self.ordering]
+
+        return base64.urlsafe_b64encode(json.dumps(values).encode('utf-8')).decode('ascii')
+
+    def decode_cursor(self, request, fields: Optional[List[Field]] = None) -> Optional[List[Any]]:
+        encoded_cursor = request.query_params.get(self.cursor_query_param)
+
+        if not encoded_cursor:
+            return None
+
+        try:
+            cursor = json.loads(base64.urlsafe_b64decode(encoded_cursor.encode('ascii')))
+        except (binascii.Error, UnicodeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if not isinstance(cursor, list) or len(cursor) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+
+        if any(value is None or isinstance(value, (list, dict)) for value in cursor):
+            raise NotFound(self.invalid_cursor_message)
+
+        if fields is None:
+            return cursor
+
+        try:
+            return [self.to_cursor_value(field, value) for field, value in zip(fields, cursor)]
+        except (ValidationError, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def to_cursor_value(self, field: Field, value: Any) -> Any:
+        value = field.to_python(value)
+
+        # Runs the range validators of the integer fields among others
+        field.run_validators(value)
+
+        return value
+
+
+# The cursor keeps the size of the sequence and is rejected once it changes
+class ShufflePagination(KeysetPagination):
+    seed_query_param = 'seed'
+    # Fields of the cursor, checked by KeysetPagination.decode_cursor
+    ordering = ['offset', 'size']
+
+    def get_seed(self, request) -> Optional[str]:
+        return request.query_params.get(self.seed_query_param) or None
+
+    def paginate_positions(
+        self,
+        size: int,
+        get_items: Callable[[List[int]], Sequence[Any]],
+        request,
+        view=None
+    ) -> List[Any]:
+        self.page_size = self.get_page_size(request)
+
+        cursor = self.decode_cursor(request)
+
+        if cursor is not None and (cursor[1] != size or cursor[0] > size):
+            raise NotFound(self.invalid_cursor_message)
+
+        self.offset = cursor[0] if cursor is not None else 0
+
+        permutation = FeistelPermutation(size, self.get_seed(request))
+        next_offset = min(self.offset + self.page_size, size)
+
+        self.page = list(get_items([permutation[index] for index in range(self.offset, next_offset)]))
+        self.next_cursor = None
+
+        if next_offset < size:
+            self.next_cursor = base64.urlsafe_b64encode(
+                json.dumps([next_offset, size]).encode('utf-8')
+            ).decode('ascii')
+
+        return self.page
+
+    def decode_cursor(self, request, fields: Optional[List[Field]] = None) -> Optional[List[Any]]:
+        cursor = super().decode_cursor(request, fields)
+
+        if cursor is not None and not all(isinstance(value, int) and value >= 0 for value in cursor):
+            raise NotFound(self.invalid_cursor_message)
+
+        return cursor
@@ -0,0 +1,49 @@
+import hashlib
+from typing import Iterator
+
+
+# Feistel network with cycle walking for the indexes past the size
+class FeistelPermutation:
+    rounds = 4
+
+    def __init__(self, size: int, seed: str):
+        self.size = size
+        self.key = hashlib.blake2b(seed.encode('utf-8'), digest_size=16).digest()
+
+        half_bits = max((size - 1).bit_length() + 1, 2) // 2
+        self.half_bits = half_bits
+        self.half_mask = (1 << half_bits) - 1
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, index: int) -> int:
+        if not 0 <= index < self.size:
+            raise IndexError('permutation index out of range')
+
+        permuted_index = self.encrypt(index)
+
+        while permuted_index >= self.size:
+            permuted_index = self.encrypt(permuted_index)
+
+        return permuted_index
+
+    def __iter__(self) -> Iterator[int]:
+        return (self[index] for index in range(self.size))
+
+    def encrypt(self, value: int) -> int:
+        left, right = value >> self.half_bits, value & self.half_mask
+
+        for round_number in range(self.rounds):
+            left, right = right, left ^ self.round_function(round_number, right)
+
+        return (left << self.half_bits) | right
+
+    def round_function(self, round_number: int, value: int) -> int:
+        digest = hashlib.blake2b(
+            f'{round_number}:{value}'.encode('ascii'),
+            key=self.key,
+            digest_size=8
+        ).digest()
+
+        return int.from_bytes(digest, 'big') & self.half_mask
@@ -0,0 +1,110 @@
+from typing import Optional, TypedDict
+
+from django.db import connection, models
+
+
+class ReactionToggle(TypedDict):
+    liked: bool
+    disliked: bool
+    likes: int
+    dislikes: int
+
+
+def like_counter_field(liked: bool) -> str:
+    return 'like_count' if liked else 'dislike_count'
+
+
+class ReactionManager(models.Manager):
+    target_field: str
+
+    def toggle(self, channel_id: int, target_id: int, liked: bool) -> Optional[ReactionToggle]:
+        # Returns None if the target does not exist
+        reaction_table = self.model._meta.db_table
+        target_field = self.model._meta.get_field(self.target_field)
+        target_column = target_field.column
+        target_table = target_field.related_model._meta.db_table
+        channel_column = self.model._meta.get_field('channel').column
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'''
+                WITH existing_reaction AS (
+                    SELECT id FROM {reaction_table}
+                    WHERE {target_column} = %(target_id)s
+                        AND {channel_column} = %(channel_id)s
+                        AND liked = %(liked)s
+                    FOR UPDATE
+                ), removed_reaction AS (
+                    DELETE FROM {reaction_table}
+                    WHERE id IN (SELECT id FROM existing_reaction)
+                    RETURNING id
+                ), added_reaction AS (
+                    INSERT INTO {reaction_table} ({channel_column}, {target_column}, liked)
+                    SELECT %(channel_id)s, %(target_id)s, %(liked)s
+                    WHERE NOT EXISTS (SELECT 1 FROM existing_reaction)
+                        AND EXISTS (SELECT 1 FROM {target_table} WHERE id = %(target_id)s)
+                    ON CONFLICT ({target_column}, {channel_column}) DO UPDATE SET liked = EXCLUDED.liked
+                        WHERE {reaction_table}.liked <> EXCLUDED.liked
+                    RETURNING xmax = 0 AS inserted
+                ), reaction_changes AS (
+                    SELECT
+                        (SELECT count(*) FROM removed_reaction) AS removed,
+                        (SELECT count(*) FROM added_reaction WHERE inserted) AS inserted,
+                        (SELECT count(*) FROM added_reaction WHERE NOT inserted) AS flipped
+                )
+                UPDATE {target_table} AS target SET
+                    like_count = target.like_count + CASE WHEN %(liked)s
+                        THEN changes.inserted + changes.flipped - changes.removed
+                        ELSE -changes.flipped
+                    END,
+                    dislike_count = target.dislike_count + CASE WHEN %(liked)s
+                        THEN -changes.flipped
+                        ELSE changes.inserted + changes.flipped - changes.removed
+                    END
+                FROM reaction_changes AS changes
+                WHERE target.id = %(target_id)s
+                RETURNING changes.removed > 0, target.like_count, target.dislike_count
+                ''',
+                {'channel_id': channel_id, 'target_id': target_id, 'liked': liked}
+            )
+
+            row = cursor.fetchone()
+
+        if row is None:
+            return None
+
+        removed, likes, dislikes = row
+
+        return {
+            'liked': liked and not removed,
+            'disliked': not liked and not removed,
+            'likes': likes,
+            'dislikes': dislikes
+        }
+
+    def remove_channel_reactions(self, channel_id: int):
+        reaction_table = self.model._meta.db_table
+        target_field = self.model._meta.get_field(self.target_field)
+        target_column = target_field.column
+        target_table = target_field.related_model._meta.db_table
+        channel_column = self.model._meta.get_field('channel').column
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'''
+                UPDATE {target_table} AS target SET
+                    like_count = target.like_count - reactions.likes,
+                    dislike_count = target.dislike_count - reactions.dislikes
+                FROM (
+                    SELECT
+                        {target_column} AS target_id,
+                        count(*) FILTER (WHERE liked) AS likes,
+                        count(*) FILTER (WHERE NOT liked) AS dislikes
+                    FROM {reaction_table}
+                    WHERE {channel_column} = %s
+                    GROUP BY {target_column}
+                ) AS reactions
+                WHERE target.id = reactions.target_id
+                ''',
+                [channel_id]
+            )
@@ -32,6 +32,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'corsheaders',
     'rest_framework',
     'drf_spectacular',
@@ -100,7 +101,7 @@ REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
         'rest_framework_simplejwt.authentication.JWTAuthentication',
     ),
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.LimitOffsetPagination',
+    'DEFAULT_PAGINATION_CLASS': 'youtube_clone.pagination.KeysetPagination',
     'PAGE_SIZE': 10,
     'TEST_REQUEST_DEFAULT_FORMAT': 'json'
 }
@@ -126,6 +127,33 @@ SIMPLE_JWT = {
     )
 }
 
+TRENDING_SCORE = {
+    'HALF_LIFE': timedelta(hours=env.int('TRENDING_SCORE_HALF_LIFE_HOURS', default=24)),
+    'VIEW_WEIGHT': 1,
+    'LIKE_WEIGHT': 20,
+    'COMMENT_WEIGHT': 10,
+    'MIN_SCORE': 0.01
+}
+
+VIDEO_VIEW_BUFFER = {
+    'MAX_SIZE': env.int('VIDEO_VIEW_BUFFER_MAX_SIZE', default=500),
+    'FLUSH_INTERVAL': timedelta(seconds=env.int('VIDEO_VIEW_BUFFER_FLUSH_INTERVAL_SECONDS', default=5))
+}
+
+VIDEO_VIEW_ANONYMOUS_SHARDS = env.int('VIDEO_VIEW_ANONYMOUS_SHARDS', default=8)
+
+SUBSCRIBED_CHANNEL_IDS_CACHE_TIMEOUT = env.int('SUBSCRIBED_CHANNEL_IDS_CACHE_TIMEOUT', default=300)
+
+CHANNEL_RECOMMENDATIONS = {
+    'TOP_K': env.int('CHANNEL_RECOMMENDATIONS_TOP_K', default=20),
+    'CHUNK_SIZE': env.int('CHANNEL_RECOMMENDATIONS_CHUNK_SIZE', default=1000)
+}
+
+SUBSCRIPTION_FEED = {
+    'FAN_OUT_LIMIT': env.int('SUBSCRIPTION_FEED_FAN_OUT_LIMIT', default=10000),
+    'BACKFILL_SIZE': env.int('SUBSCRIPTION_FEED_BACKFILL_SIZE', default=30)
+}
+
 PASSWORD_HASHERS = [
     'django.contrib.auth.hashers.Argon2PasswordHasher',
     'django.contrib.auth.hashers.PBKDF2PasswordHasher',
@@ -170,6 +198,19 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/ref/settings/#caches
+
+# The subscribed channel ids are only cached across requests in a cache shared
+# by every worker, such as redis://redis:6379/1, otherwise once per request
+SHARED_CACHE = env.str('CACHE_URL', default=None) is not None
+
+if SHARED_CACHE:
+    CACHES = {
+        'default': env.cache('CACHE_URL')
+    }
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 